@@ -0,0 +1,69 @@
+"""프로세스 내 TTL 캐시.
+
+읽기가 잦고 거의 바뀌지 않는 문서(설정, 체크리스트 등)를 메모리에 잠시 보관한다.
+쓰는 쪽에서 `invalidate`를 호출하면 같은 프로세스에는 즉시 반영되고,
+다른 인스턴스에는 TTL이 지나면 반영된다.
+
+`invalidate`는 세대(generation)를 올린다. 읽기 전에 받아 둔 세대를 `set`에 넘기면,
+읽는 동안 invalidate가 있었을 때 이전 값을 다시 넣지 않는다.
+"""
+
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """generation이 있으면 그 뒤로 invalidate가 없었을 때만 넣는다."""
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                # 가장 먼저 만료되는 항목부터 버린다.
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest]
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """캐시에 없으면 await loader()로 읽어서 넣는다(read-through)."""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            generation = self._generation
+            value = await loader()
+            self.set(key, value, generation)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """key 하나, 또는 key가 없으면 전체를 비운다."""
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
@@ -1,3 +1,5 @@
+import os
+
 CORS_ORIGINS = [
     # local/dev
     "http://localhost:5173",
@@ -17,3 +19,19 @@ CORS_ORIGINS = [
     "https://safety-frontend-ryzxipd66a-du.a.run.app",
     "https://safety-frontend-409085920181.asia-northeast3.run.app",
 ]
+
+# 저장소 엔진: "firestore"(기본) 또는 "sqlite"(온프레미스/로컬 설치용)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "firestore").strip().lower()
+SQLITE_PATH = os.getenv("SQLITE_PATH", "safety_check.db")
+
+# 설정(장소/작업 종류) 메모리 캐시 유지 시간(초). 수정 API는 즉시 무효화하며,
+# 인스턴스가 여러 개면 다른 인스턴스에는 이 시간 안에 반영된다. 0이면 캐시하지 않는다.
+SETTINGS_CACHE_TTL_SECONDS = float(os.getenv("SETTINGS_CACHE_TTL_SECONDS", "60"))
+CHECKLIST_CACHE_TTL_SECONDS = float(os.getenv("CHECKLIST_CACHE_TTL_SECONDS", "60"))
+SUBADMIN_CACHE_TTL_SECONDS = float(os.getenv("SUBADMIN_CACHE_TTL_SECONDS", "60"))
+
+# 로그인 결과 메모리 캐시 유지 시간(초). 서브어드민 생성/수정/삭제는 즉시 무효화한다. 0이면 캐시하지 않는다.
+LOGIN_CACHE_TTL_SECONDS = float(os.getenv("LOGIN_CACHE_TTL_SECONDS", "30"))
+# nameKey가 없는 예전 사용자 문서를 phoneLast4로 다시 찾는 호환 조회.
+# scripts/backfill_user_name_keys.py 실행 후 0으로 끄면 로그인은 인덱스 조회 1번으로 끝난다.
+USERS_LEGACY_LOOKUP = os.getenv("USERS_LEGACY_LOOKUP", "1").strip().lower() not in ("0", "false", "no")
@@ -0,0 +1,49 @@
+"""프로세스 내 이벤트 브로커 (SSE 피드용).
+
+쓰기 경로에서 `publish`한 이벤트를 구독 중인 모든 연결의 큐에 넣는다.
+같은 프로세스의 쓰기만 전달되므로, 인스턴스가 여러 개면 클라이언트는 재연결 시 목록을 다시 읽어야 한다.
+"""
+
+import asyncio
+import threading
+from typing import Any, Dict, List, Tuple
+
+
+class EventBroker:
+    def __init__(self, max_queue: int = 256):
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._subscribers: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Queue[Dict[str, Any]]"]] = []
+
+    def subscribe(self) -> "asyncio.Queue[Dict[str, Any]]":
+        """현재 이벤트 루프에서 읽을 큐를 만들어 등록한다. 끝나면 unsubscribe를 호출해야 한다."""
+        queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(self.max_queue)
+        with self._lock:
+            self._subscribers.append((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, queue: "asyncio.Queue[Dict[str, Any]]") -> None:
+        with self._lock:
+            self._subscribers = [(loop, q) for loop, q in self._subscribers if q is not queue]
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        """모든 구독자에게 이벤트를 보낸다. 기다리지 않으며, 느린 구독자의 큐가 차면 가장 오래된 이벤트를 버린다."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_put_latest, queue, event)
+            except RuntimeError:
+                # 루프가 이미 닫힌 연결
+                self.unsubscribe(queue)
+
+
+def _put_latest(queue: "asyncio.Queue[Dict[str, Any]]", event: Dict[str, Any]) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(event)
@@ -2,7 +2,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import CORS_ORIGINS
-from app.routers import settings, checklists, inspections, users
+from app.routers import bootstrap, settings, checklists, inspections, users
 
 def create_app() -> FastAPI:
     app = FastAPI()
@@ -19,6 +19,7 @@ def create_app() -> FastAPI:
     def root():
         return {"status": "Safety Inspection API Running"}
 
+    app.include_router(bootstrap.router, prefix="/api/v1")
     app.include_router(settings.router, prefix="/api/v1")
     app.include_router(checklists.router, prefix="/api/v1")
     app.include_router(inspections.router, prefix="/api/v1")
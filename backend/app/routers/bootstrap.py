@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Header, Response
+from typing import Optional
+
+from app.core.http_cache import etag_matches
+from app.services.bootstrap_service import bootstrap_etag, get_bootstrap
+
+router = APIRouter(tags=["bootstrap"])
+
+
+@router.get("/bootstrap")
+async def api_get_bootstrap(response: Response, if_none_match: Optional[str] = Header(default=None)):
+    data = await get_bootstrap()
+    etag = bootstrap_etag(data)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return data
@@ -1,15 +1,23 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, Response
 from pydantic import BaseModel
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from app.services.checklists_service import get_checklist, update_checklist
+from app.core.http_cache import etag_matches
+from app.services.checklists_service import checklist_etag, get_checklist, update_checklist
 
 router = APIRouter(tags=["checklists"])
 
 
 @router.get("/checklists/{work_type}")
-def api_get_checklist(work_type: str):
-    return get_checklist(work_type)
+async def api_get_checklist(work_type: str, response: Response, if_none_match: Optional[str] = Header(default=None)):
+    checklist = await get_checklist(work_type)
+    etag = checklist_etag(checklist)
+    # no-cache: 브라우저가 캐시를 쓰되 매번 If-None-Match로 재검증한다(바뀌지 않았으면 304, 본문 없음).
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return checklist
 
 
 class ChecklistItem(BaseModel):
@@ -25,7 +33,7 @@ class ChecklistUpdateRequest(BaseModel):
 
 
 @router.post("/checklists")
-def api_update_checklists(body: ChecklistUpdateRequest):
+async def api_update_checklists(body: ChecklistUpdateRequest):
     # Pydantic 모델을 dict로 변환
     items = [it.model_dump() for it in body.items]
-    return update_checklist(body.adminName, body.workType, items)
+    return await update_checklist(body.adminName, body.workType, items)
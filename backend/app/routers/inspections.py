@@ -1,53 +1,128 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from typing import Any, Dict, List, Optional
 import io
+import json
 from pathlib import Path
 
 from app.schemas.inspection import InspectionSubmission
-from app.services.excel_export_service import build_export_filename, build_inspections_excel_bytes
+from app.services.excel_export_service import InspectionsExcelWriter, build_export_filename, iter_file_chunks
 from app.services.pdf_export_service import build_export_pdf_filename, build_inspections_pdf_bytes
+from app.services.inspection_events import inspection_changes
 from app.services.inspections_service import (
+    AmbiguousInspectionError,
+    InspectionConflictError,
     create_inspection_record,
+    create_inspection_records,
     list_admin_inspections,
+    list_admin_inspections_page,
+    iter_admin_inspections,
+    get_admin_inspection_detail,
+    list_inspection_revisions,
+    list_pending_queue,
     can_subadmin_handle_inspection,
     list_my_inspections,
+    list_my_inspection_changes,
+    list_my_inspections_page,
     get_my_inspection_detail,
     add_revision,
     cancel_my_inspection,
     approve_inspection,
+    approve_inspections,
     reject_inspection,
+    reject_inspections,
 )
 
 router = APIRouter(tags=["inspections"])
 
+# POST /inspections/batch 한 번에 받을 수 있는 최대 점검 수
+MAX_BATCH_SUBMISSIONS = 500
+# 일괄 승인/반려 한 번에 받을 수 있는 최대 id 수
+MAX_BULK_IDS = 500
+# 엑셀 내보내기 템플릿. 실제 파일 이름은 밑줄이 아니라 공백이다("EHS Checklist_HB.xlsx").
+EXCEL_TEMPLATE_PATH = Path(__file__).resolve().parents[2] / "templates" / "EHS Checklist_HB.xlsx"
+
+
+def _bulk_response(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    failed = sum(1 for item in items if item["status"] != "ok")
+    return {"status": "success" if not failed else "partial", "succeeded": len(items) - failed, "failed": failed, "items": items}
+
 
 @router.post("/inspections")
-def submit_inspection(data: InspectionSubmission):
-    record = create_inspection_record(data.model_dump())
+async def submit_inspection(data: InspectionSubmission):
+    record = await create_inspection_record(data.model_dump())
     return {"status": "success", "id": record["id"]}
 
 
+class InspectionBatchRequest(BaseModel):
+    # 항목별로 검증해서 잘못된 항목만 실패로 돌려주기 위해 dict로 받는다.
+    items: List[Dict[str, Any]]
+
+
+@router.post("/inspections/batch")
+async def submit_inspections_batch(body: InspectionBatchRequest):
+    if len(body.items) > MAX_BATCH_SUBMISSIONS:
+        raise HTTPException(status_code=400, detail=f"too many items (max {MAX_BATCH_SUBMISSIONS})")
+
+    results: List[Dict[str, Any]] = [{} for _ in body.items]
+    valid_indexes: List[int] = []
+    payloads: List[Dict[str, Any]] = []
+    for index, item in enumerate(body.items):
+        try:
+            payloads.append(InspectionSubmission.model_validate(item).model_dump())
+            valid_indexes.append(index)
+        except ValidationError as exc:
+            results[index] = {"error": "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors())}
+
+    for index, outcome in zip(valid_indexes, await create_inspection_records(payloads)):
+        results[index] = outcome
+
+    return _bulk_response(
+        [{"index": index, "status": "error" if "error" in r else "ok", **r} for index, r in enumerate(results)]
+    )
+
+
 @router.get("/inspections")
-def admin_list_inspections(
+async def admin_list_inspections(
     admin_name: str,
     start_date: str,
     end_date: str,
     requester_role: Optional[str] = None,
     requester_categories: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    view: Optional[str] = None,
 ):
     categories = [c.strip() for c in str(requester_categories or "").split(",") if c.strip()]
-    return list_admin_inspections(
-        start_date,
-        end_date,
-        requester_role=requester_role,
-        requester_categories=categories,
-    )
+    # view=summary: 목록 컬럼만 반환 (응답 항목/서명은 GET /inspections/{id}로 조회)
+    summary = str(view or "").strip().lower() == "summary"
+    if limit is None and not cursor:
+        return await list_admin_inspections(
+            start_date,
+            end_date,
+            requester_role=requester_role,
+            requester_categories=categories,
+            summary=summary,
+        )
+
+    try:
+        return await list_admin_inspections_page(
+            start_date,
+            end_date,
+            requester_role=requester_role,
+            requester_categories=categories,
+            limit=limit or 50,
+            cursor=cursor,
+            summary=summary,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
 
 @router.get("/inspections/export")
-def export_inspections(
+async def export_inspections(
     admin_name: str,
     start_date: str,
     end_date: str,
@@ -55,38 +130,42 @@ def export_inspections(
     requester_categories: Optional[str] = None,
 ):
     categories = [c.strip() for c in str(requester_categories or "").split(",") if c.strip()]
-    data = list_admin_inspections(
-        start_date,
-        end_date,
-        requester_role=requester_role,
-        requester_categories=categories,
-    )
 
-    backend_root = Path(__file__).resolve().parents[2]
-    template_path = backend_root / "templates" / "EHS_Checklist_HB.xlsx"
+    template_path = EXCEL_TEMPLATE_PATH
     if not template_path.exists():
         raise HTTPException(status_code=500, detail=f"excel template not found: {template_path}")
 
+    # 조회(페이지) -> 시트 쓰기(write-only, 임시 파일) -> 청크 응답으로 흘려 보내 기간이 길어도 메모리가 일정하다.
+    # 엑셀 생성은 CPU 작업이므로 이벤트 루프 밖(스레드풀)에서 실행한다.
+    writer = await run_in_threadpool(InspectionsExcelWriter, str(template_path))
     try:
-        excel_bytes = build_inspections_excel_bytes(data, template_path=str(template_path))
+        async for page in iter_admin_inspections(
+            start_date,
+            end_date,
+            requester_role=requester_role,
+            requester_categories=categories,
+        ):
+            await run_in_threadpool(writer.add_records, page)
+        output = await run_in_threadpool(writer.finish)
     except Exception as exc:
+        await run_in_threadpool(writer.close)
         raise HTTPException(status_code=500, detail=f"excel export failed: {exc}")
 
-    stream = io.BytesIO(excel_bytes)
-    stream.seek(0)
+    size = output.seek(0, io.SEEK_END)
+    output.seek(0)
 
     filename = build_export_filename(start_date, end_date)
     return StreamingResponse(
-        stream,
+        iter_file_chunks(output),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        headers={"Content-Disposition": f"attachment; filename={filename}", "Content-Length": str(size)},
     )
 
 
 
 
 @router.get("/inspections/export-pdf")
-def export_inspections_pdf(
+async def export_inspections_pdf(
     admin_name: str,
     start_date: str,
     end_date: str,
@@ -94,7 +173,7 @@ def export_inspections_pdf(
     requester_categories: Optional[str] = None,
 ):
     categories = [c.strip() for c in str(requester_categories or "").split(",") if c.strip()]
-    data = list_admin_inspections(
+    data = await list_admin_inspections(
         start_date,
         end_date,
         requester_role=requester_role,
@@ -102,7 +181,7 @@ def export_inspections_pdf(
     )
 
     try:
-        pdf_bytes = build_inspections_pdf_bytes(data)
+        pdf_bytes = await run_in_threadpool(build_inspections_pdf_bytes, data)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"pdf export failed: {exc}")
 
@@ -116,14 +195,113 @@ def export_inspections_pdf(
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
 
+
+@router.get("/inspections/stream")
+async def stream_inspections(
+    requester_role: Optional[str] = None,
+    requester_categories: Optional[str] = None,
+):
+    # SSE: 점검 제출/재제출/승인/반려/취소 이벤트를 푸시한다. (/inspections/{inspection_id}보다 먼저 선언해야 한다)
+    categories = [c.strip() for c in str(requester_categories or "").split(",") if c.strip()]
+
+    async def events():
+        # 재연결 간격(ms). 재연결 직후에는 클라이언트가 목록을 한 번 다시 읽는다.
+        yield "retry: 3000\n\n"
+        async for event in inspection_changes(requester_role, categories):
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/inspections/{inspection_id}")
+async def admin_inspection_detail(
+    inspection_id: str,
+    requester_role: Optional[str] = None,
+    requester_categories: Optional[str] = None,
+):
+    detail = await get_admin_inspection_detail(inspection_id)
+    if not detail:
+        raise HTTPException(status_code=404, detail="inspection not found")
+
+    categories = [c.strip() for c in str(requester_categories or "").split(",") if c.strip()]
+    if str(requester_role or "").strip().upper() == "SUB_ADMIN" and categories:
+        if str(detail.get("workType") or "") not in categories:
+            raise HTTPException(status_code=403, detail="subadmin cannot view this category")
+    return detail
+
+
+@router.get("/inspections/{inspection_id}/revisions")
+async def get_inspection_revisions(
+    inspection_id: str,
+    requester_role: Optional[str] = None,
+    requester_categories: Optional[str] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+):
+    categories = [c.strip() for c in str(requester_categories or "").split(",") if c.strip()]
+    if str(requester_role or "").strip().upper() == "SUB_ADMIN" and categories:
+        if not await can_subadmin_handle_inspection(inspection_id, categories):
+            raise HTTPException(status_code=403, detail="subadmin cannot view this category")
+
+    try:
+        page = await list_inspection_revisions(inspection_id, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if page is None:
+        raise HTTPException(status_code=404, detail="inspection not found")
+    return page
+
+
+@router.get("/subadmin/queue")
+async def subadmin_queue(
+    requester_role: Optional[str] = None,
+    requester_categories: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+):
+    # 승인 대기 건(오래된 순). 담당 작업 종류의 대기 큐만 읽는다.
+    categories = [c.strip() for c in str(requester_categories or "").split(",") if c.strip()]
+    try:
+        return await list_pending_queue(requester_role, categories, limit=limit or 50, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
 @router.get("/me/inspections")
-def me_list_inspections(userName: str, start_date: Optional[str] = None, end_date: Optional[str] = None):
-    return list_my_inspections(userName, start_date, end_date)
+async def me_list_inspections(
+    userName: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+):
+    if since is not None:
+        # 증분 동기화: since 이후 변경분 + 취소 tombstone
+        return await list_my_inspection_changes(userName, since, limit=limit or 200)
+
+    if limit is None and not cursor:
+        return await list_my_inspections(userName, start_date, end_date)
+
+    try:
+        return await list_my_inspections_page(userName, start_date, end_date, limit=limit or 50, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
 
 @router.get("/me/inspections/detail")
-def me_inspection_detail(userName: str, date: str, hospital: str, equipmentName: Optional[str] = None):
-    detail = get_my_inspection_detail(userName, date, hospital, equipmentName)
+async def me_inspection_detail(userName: str, date: str, hospital: str, equipmentName: Optional[str] = None):
+    try:
+        detail = await get_my_inspection_detail(userName, date, hospital, equipmentName)
+    except AmbiguousInspectionError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
     if not detail:
         raise HTTPException(status_code=404, detail="inspection not found")
     return detail
@@ -137,8 +315,11 @@ class CancelRequest(BaseModel):
 
 
 @router.post("/me/inspections/cancel")
-def me_cancel(body: CancelRequest):
-    ok = cancel_my_inspection(body.userName, body.date, body.hospital, body.equipmentName)
+async def me_cancel(body: CancelRequest):
+    try:
+        ok = await cancel_my_inspection(body.userName, body.date, body.hospital, body.equipmentName)
+    except (AmbiguousInspectionError, InspectionConflictError) as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
     if not ok:
         raise HTTPException(status_code=404, detail="inspection not found")
     return {"status": "ok"}
@@ -153,17 +334,20 @@ class ApproveRequest(BaseModel):
 
 
 @router.post("/inspections/{inspection_id}/approve")
-def approve(inspection_id: str, body: ApproveRequest):
+async def approve(inspection_id: str, body: ApproveRequest):
     if not body.signatureBase64 or len(body.signatureBase64.strip()) < 50:
         raise HTTPException(status_code=400, detail="signatureBase64 is required")
     if not body.subadminName or not body.subadminName.strip():
         raise HTTPException(status_code=400, detail="subadminName is required")
 
     if body.subadminCategories is not None and len(body.subadminCategories) > 0:
-        if not can_subadmin_handle_inspection(inspection_id, body.subadminCategories):
+        if not await can_subadmin_handle_inspection(inspection_id, body.subadminCategories):
             raise HTTPException(status_code=403, detail="subadmin cannot approve this category")
 
-    r = approve_inspection(inspection_id, body.subadminName, body.signatureBase64)
+    try:
+        r = await approve_inspection(inspection_id, body.subadminName, body.signatureBase64)
+    except InspectionConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
     if not r:
         raise HTTPException(status_code=404, detail="inspection not found")
     return {"status": "ok"}
@@ -176,17 +360,54 @@ class RejectRequest(BaseModel):
 
 
 @router.post("/inspections/{inspection_id}/reject")
-def reject(inspection_id: str, body: RejectRequest):
+async def reject(inspection_id: str, body: RejectRequest):
     if body.subadminCategories is not None and len(body.subadminCategories) > 0:
-        if not can_subadmin_handle_inspection(inspection_id, body.subadminCategories):
+        if not await can_subadmin_handle_inspection(inspection_id, body.subadminCategories):
             raise HTTPException(status_code=403, detail="subadmin cannot reject this category")
 
-    r = reject_inspection(inspection_id, body.subadminName, body.reason or "")
+    try:
+        r = await reject_inspection(inspection_id, body.subadminName, body.reason or "")
+    except InspectionConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
     if not r:
         raise HTTPException(status_code=404, detail="inspection not found")
     return {"status": "ok"}
 
 
+class BulkApproveRequest(ApproveRequest):
+    ids: List[str]
+
+
+@router.post("/inspections/bulk-approve")
+async def bulk_approve(body: BulkApproveRequest):
+    if not body.ids:
+        raise HTTPException(status_code=400, detail="ids is required")
+    if len(body.ids) > MAX_BULK_IDS:
+        raise HTTPException(status_code=400, detail=f"too many ids (max {MAX_BULK_IDS})")
+    if not body.signatureBase64 or len(body.signatureBase64.strip()) < 50:
+        raise HTTPException(status_code=400, detail="signatureBase64 is required")
+    if not body.subadminName or not body.subadminName.strip():
+        raise HTTPException(status_code=400, detail="subadminName is required")
+
+    items = await approve_inspections(body.ids, body.subadminName, body.signatureBase64, body.subadminCategories)
+    return _bulk_response(items)
+
+
+class BulkRejectRequest(RejectRequest):
+    ids: List[str]
+
+
+@router.post("/inspections/bulk-reject")
+async def bulk_reject(body: BulkRejectRequest):
+    if not body.ids:
+        raise HTTPException(status_code=400, detail="ids is required")
+    if len(body.ids) > MAX_BULK_IDS:
+        raise HTTPException(status_code=400, detail=f"too many ids (max {MAX_BULK_IDS})")
+
+    items = await reject_inspections(body.ids, body.subadminName, body.reason or "", body.subadminCategories)
+    return _bulk_response(items)
+
+
 class ResubmitRequest(BaseModel):
     userName: str
     date: str
@@ -197,8 +418,11 @@ class ResubmitRequest(BaseModel):
 
 
 @router.post("/me/inspections/resubmit")
-def me_resubmit(body: ResubmitRequest):
-    r = add_revision(body.userName, body.date, body.hospital, body.equipmentName, body.answers, body.signatureBase64)
+async def me_resubmit(body: ResubmitRequest):
+    try:
+        r = await add_revision(body.userName, body.date, body.hospital, body.equipmentName, body.answers, body.signatureBase64)
+    except (AmbiguousInspectionError, InspectionConflictError) as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
     if not r:
         raise HTTPException(status_code=404, detail="inspection not found")
     return {"status": "ok"}
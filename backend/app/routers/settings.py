@@ -18,20 +18,20 @@ class WorkTypesUpdateRequest(BaseModel):
 
 
 @router.get("/settings/hospitals")
-def api_get_hospitals():
-    return get_hospitals()
+async def api_get_hospitals():
+    return await get_hospitals()
 
 
 @router.post("/settings/hospitals")
-def api_update_hospitals(body: HospitalsUpdateRequest):
-    return update_hospitals(body.adminName, body.hospitals)
+async def api_update_hospitals(body: HospitalsUpdateRequest):
+    return await update_hospitals(body.adminName, body.hospitals)
 
 
 @router.get("/settings/work-types")
-def api_get_work_types():
-    return get_work_types()
+async def api_get_work_types():
+    return await get_work_types()
 
 
 @router.post("/settings/work-types")
-def api_update_work_types(body: WorkTypesUpdateRequest):
-    return update_work_types(body.adminName, body.workTypes)
+async def api_update_work_types(body: WorkTypesUpdateRequest):
+    return await update_work_types(body.adminName, body.workTypes)
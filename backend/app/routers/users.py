@@ -4,6 +4,7 @@ from typing import List, Optional
 
 from app.services.users_service import (
     list_users,
+    list_users_page,
     login_user,
     list_subadmins,
     create_subadmin,
@@ -26,36 +27,42 @@ class SubadminUpsertRequest(BaseModel):
 
 
 @router.get("/users")
-def get_users():
-    return {"users": list_users()}
+async def get_users(role: Optional[str] = None, limit: Optional[int] = None, cursor: Optional[str] = None):
+    try:
+        if limit is None and not cursor:
+            return {"users": await list_users(role)}
+        # 페이지 조회: 이름순, 다음 페이지는 nextCursor로 요청
+        return await list_users_page(role, limit=limit or 100, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
 
 @router.post("/users/login")
-def login(body: LoginRequest):
+async def login(body: LoginRequest):
     try:
-        user = login_user(body.name, body.phoneLast4)
+        user = await login_user(body.name, body.phoneLast4)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
     return user
 
 
 @router.get("/subadmins")
-def get_subadmins():
-    return {"subadmins": list_subadmins()}
+async def get_subadmins():
+    return {"subadmins": await list_subadmins()}
 
 
 @router.post("/subadmins")
-def post_subadmin(body: SubadminUpsertRequest):
+async def post_subadmin(body: SubadminUpsertRequest):
     try:
-        return create_subadmin(body.name, body.phoneLast4, body.categories)
+        return await create_subadmin(body.name, body.phoneLast4, body.categories)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
 
 @router.put("/subadmins/{subadmin_id}")
-def put_subadmin(subadmin_id: str, body: SubadminUpsertRequest):
+async def put_subadmin(subadmin_id: str, body: SubadminUpsertRequest):
     try:
-        return update_subadmin(subadmin_id, body.name, body.phoneLast4, body.categories)
+        return await update_subadmin(subadmin_id, body.name, body.phoneLast4, body.categories)
     except ValueError as exc:
         message = str(exc)
         status = 404 if message == "subadmin not found" else 400
@@ -63,8 +70,8 @@ def put_subadmin(subadmin_id: str, body: SubadminUpsertRequest):
 
 
 @router.delete("/subadmins/{subadmin_id}")
-def remove_subadmin(subadmin_id: str):
-    ok = delete_subadmin(subadmin_id)
+async def remove_subadmin(subadmin_id: str):
+    ok = await delete_subadmin(subadmin_id)
     if not ok:
         raise HTTPException(status_code=404, detail="subadmin not found")
     return {"status": "ok"}
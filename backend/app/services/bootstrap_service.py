@@ -0,0 +1,34 @@
+"""앱 시작 시 필요한 설정을 한 번에 반환한다 (장소, 작업 종류, 작업 종류별 체크리스트)."""
+
+import hashlib
+import json
+from typing import Any, Dict
+
+from app.services.checklists_service import get_checklists
+from app.services.settings_service import get_settings
+
+
+async def get_bootstrap() -> Dict[str, Any]:
+    settings = await get_settings()
+    hospitals = settings["hospitals"]
+    work_types = settings["work_types"]
+    checklists = await get_checklists(work_types.get("workTypes") or [])
+
+    # 구성 요소의 updatedAt/version이 하나라도 바뀌면 version(=ETag)도 바뀐다.
+    fingerprint = [
+        hospitals.get("updatedAt"),
+        work_types.get("updatedAt"),
+        [[key, c.get("version"), c.get("updatedAt")] for key, c in checklists.items()],
+    ]
+    version = hashlib.sha1(json.dumps(fingerprint, ensure_ascii=False).encode("utf-8")).hexdigest()[:16]
+
+    return {
+        "version": version,
+        "hospitals": hospitals.get("hospitals") or [],
+        "workTypes": work_types.get("workTypes") or [],
+        "checklists": checklists,
+    }
+
+
+def bootstrap_etag(bootstrap: Dict[str, Any]) -> str:
+    return f'W/"{bootstrap["version"]}"'
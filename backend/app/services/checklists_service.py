@@ -1,10 +1,17 @@
 
 
 ## 2) `backend/app/services/checklists_service.py`
+import copy
 import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from app.storage.firestore_client import get_firestore_client
+from app.core.cache import TTLCache
+from app.core.config import CHECKLIST_CACHE_TTL_SECONDS
+from app.storage.repository import get_repository
+
+# workType -> 정렬까지 끝난 체크리스트 응답. update_checklist가 즉시 무효화하고,
+# 무효화 전에 시작된 읽기 결과는 TTLCache 세대 검사로 버려진다.
+_cache = TTLCache(CHECKLIST_CACHE_TTL_SECONDS)
 
 
 def _default_items(work_type: str) -> List[Dict[str, Any]]:
@@ -31,23 +38,47 @@ def _normalize_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return [{**it, "order": idx + 1} for idx, it in enumerate(normalized)]
 
 
-def get_checklist(work_type: str) -> Dict[str, Any]:
+def checklist_etag(checklist: Dict[str, Any]) -> str:
+    """체크리스트 버전 기반 ETag. 항목이 바뀔 때만 version이 올라간다."""
+    return f'W/"v{int(checklist.get("version") or 1)}"'
+
+
+async def get_checklist(work_type: str) -> Dict[str, Any]:
     key = str(work_type)
-    client = get_firestore_client()
 
-    ref = client.collection("checklists").document(key)
-    snap = ref.get()
-    if not snap.exists:
+    async def load() -> Dict[str, Any]:
+        return await _checklist_from(key, await get_repository().get("checklists", key))
+
+    return copy.deepcopy(await _cache.get_or_load(key, load))
+
+
+async def get_checklists(work_types: List[str]) -> Dict[str, Dict[str, Any]]:
+    """여러 작업 종류의 체크리스트를 {workType: 체크리스트}로 반환한다. 캐시에 없는 것만 한 번의 get_many로 읽는다."""
+    keys = list(dict.fromkeys(str(w) for w in work_types or []))
+    missing = object()
+    out = {key: _cache.get(key, missing) for key in keys}
+    todo = [key for key, value in out.items() if value is missing]
+    if todo:
+        # 읽는 동안 update_checklist가 무효화했으면 읽은 값을 캐시에 넣지 않는다.
+        generation = _cache.generation
+        docs = await get_repository().get_many("checklists", todo)
+        for key in todo:
+            out[key] = await _checklist_from(key, docs.get(key))
+            _cache.set(key, out[key], generation)
+    return copy.deepcopy(out)
+
+
+async def _checklist_from(key: str, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if data is None:
         initial = {
             "workType": key,
             "version": 1,
             "items": _default_items(key),
             "updatedAt": datetime.datetime.now().isoformat(),
         }
-        ref.set(initial)
+        await get_repository().set("checklists", key, initial)
         return initial
 
-    data = snap.to_dict() or {}
     items = sorted((data.get("items") or []), key=lambda x: int(x.get("order") or 0))
     return {
         "workType": key,
@@ -57,20 +88,20 @@ def get_checklist(work_type: str) -> Dict[str, Any]:
     }
 
 
-def update_checklist(admin_name: str, work_type: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+async def update_checklist(admin_name: str, work_type: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
     key = str(work_type)
     normalized = _normalize_items(items)
     now = datetime.datetime.now().isoformat()
 
-    client = get_firestore_client()
-    ref = client.collection("checklists").document(key)
-    snap = ref.get()
-    prev = snap.to_dict() if snap.exists else {}
+    repo = get_repository()
+    prev = await repo.get("checklists", key) or {}
     version = int((prev or {}).get("version") or 1)
     if prev and (prev.get("items") != normalized):
         version += 1
 
-    ref.set(
+    await repo.set(
+        "checklists",
+        key,
         {
             "workType": key,
             "version": version,
@@ -80,4 +111,5 @@ def update_checklist(admin_name: str, work_type: str, items: List[Dict[str, Any]
         },
         merge=True,
     )
-    return get_checklist(key)
+    _cache.invalidate(key)
+    return await get_checklist(key)
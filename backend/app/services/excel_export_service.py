@@ -1,76 +1,69 @@
 import base64
+import hashlib
 import io
 import os
 import re
 import tempfile
+import threading
 import zipfile
 import xml.etree.ElementTree as ET
 from copy import copy
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from openpyxl import Workbook, load_workbook
-from openpyxl.cell.cell import MergedCell
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.drawing.image import Image as XLImage
-from openpyxl.utils import get_column_letter
+from openpyxl.utils import coordinate_to_tuple, get_column_letter
+from openpyxl.utils.units import DEFAULT_COLUMN_WIDTH
+from openpyxl.worksheet.cell_range import CellRange, MultiCellRange
 from PIL import Image as PILImage
 
+# 완성된 xlsx를 메모리에 두는 최대 크기. 넘으면 디스크 임시 파일로 내려간다.
+EXPORT_SPOOL_MAX_BYTES = 8 * 1024 * 1024
 
-def _repair_xlsx_style_ids(src_path: str) -> str:
-    """Repair broken style index references in a template workbook."""
-    tmpdir = tempfile.mkdtemp(prefix="xlsx_repair_")
+# 다운로드 응답 청크 크기
+EXPORT_CHUNK_SIZE = 64 * 1024
 
-    with zipfile.ZipFile(src_path, "r") as zf:
-        zf.extractall(tmpdir)
+# (서명 이미지를 붙일 셀, 레코드 필드)
+SIGNATURE_CELLS = (("E2", "subadminSignatureBase64"), ("E4", "signatureBase64"))
+
+
+def _repair_xlsx_style_ids(src_path: str) -> Optional[io.BytesIO]:
+    """Repair broken style index references in a template workbook.
 
-    styles_path = os.path.join(tmpdir, "xl", "styles.xml")
-    if not os.path.exists(styles_path):
-        return src_path
+    zip을 메모리에서 읽고 고쳐 다시 묶는다(임시 파일 없음). 고칠 수 없는 형식이면 None.
+    """
+    with zipfile.ZipFile(src_path, "r") as zf:
+        entries = [(info, zf.read(info)) for info in zf.infolist()]
+    styles_xml = next((data for info, data in entries if info.filename == "xl/styles.xml"), None)
+    if styles_xml is None:
+        return None
 
-    tree = ET.parse(styles_path)
-    root = tree.getroot()
+    root = ET.fromstring(styles_xml)
     ns_uri = root.tag.split("}")[0].strip("{")
     ns = {"a": ns_uri}
 
     cell_xfs = root.find("a:cellXfs", ns)
     xf_count = len(cell_xfs.findall("a:xf", ns)) if cell_xfs is not None else 0
     if xf_count <= 0:
-        return src_path
-
-    sheets_dir = os.path.join(tmpdir, "xl", "worksheets")
-    if not os.path.isdir(sheets_dir):
-        return src_path
+        return None
 
     style_pattern = re.compile(r'\bs="(\d+)"')
 
-    def _patch_sheet(sheet_xml_path: str) -> None:
-        txt = open(sheet_xml_path, "r", encoding="utf-8").read()
-
-        def _repl(match: re.Match[str]) -> str:
-            style_id = int(match.group(1))
-            return 's="0"' if style_id >= xf_count else match.group(0)
-
-        patched = style_pattern.sub(_repl, txt)
-        if patched != txt:
-            with open(sheet_xml_path, "w", encoding="utf-8") as fp:
-                fp.write(patched)
-
-    for filename in os.listdir(sheets_dir):
-        if filename.endswith(".xml"):
-            _patch_sheet(os.path.join(sheets_dir, filename))
-
-    repaired_path = os.path.join(tempfile.gettempdir(), f"repaired_{os.path.basename(src_path)}")
-    if os.path.exists(repaired_path):
-        os.remove(repaired_path)
+    def _repl(match: re.Match[str]) -> str:
+        style_id = int(match.group(1))
+        return 's="0"' if style_id >= xf_count else match.group(0)
 
-    with zipfile.ZipFile(repaired_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for folder, _, files in os.walk(tmpdir):
-            for file in files:
-                full = os.path.join(folder, file)
-                rel = os.path.relpath(full, tmpdir)
-                zf.write(full, rel)
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as zf:
+        for info, data in entries:
+            if info.filename.startswith("xl/worksheets/") and info.filename.endswith(".xml"):
+                data = style_pattern.sub(_repl, data.decode("utf-8")).encode("utf-8")
+            zf.writestr(info.filename, data, compress_type=zipfile.ZIP_DEFLATED)
 
-    return repaired_path
+    output.seek(0)
+    return output
 
 
 def _load_template_safe(template_path: str):
@@ -78,6 +71,8 @@ def _load_template_safe(template_path: str):
         return load_workbook(template_path)
     except IndexError:
         repaired = _repair_xlsx_style_ids(template_path)
+        if repaired is None:
+            raise
         return load_workbook(repaired)
 
 
@@ -93,21 +88,20 @@ def _points_to_pixels(points: Optional[float]) -> int:
     return int(points * 4 / 3)
 
 
-def _estimate_range_pixels(ws, cell_range: str) -> Tuple[int, int]:
-    start, end = cell_range.split(":")
-    start_col = ws[start].column
-    start_row = ws[start].row
-    end_col = ws[end].column
-    end_row = ws[end].row
+def _estimate_range_pixels(
+    cell_range: str,
+    column_widths: Dict[str, Optional[float]],
+    row_heights: Dict[int, Optional[float]],
+) -> Tuple[int, int]:
+    bounds = CellRange(cell_range)
 
     width_px = 0
-    for col in range(start_col, end_col + 1):
-        letter = get_column_letter(col)
-        width_px += _excel_col_width_to_pixels(ws.column_dimensions[letter].width)
+    for col in range(bounds.min_col, bounds.max_col + 1):
+        width_px += _excel_col_width_to_pixels(column_widths.get(get_column_letter(col)))
 
     height_px = 0
-    for row in range(start_row, end_row + 1):
-        height_px += _points_to_pixels(ws.row_dimensions[row].height)
+    for row in range(bounds.min_row, bounds.max_row + 1):
+        height_px += _points_to_pixels(row_heights.get(row))
 
     return width_px, height_px
 
@@ -136,36 +130,30 @@ def _decode_signature_image(signature_base64: Optional[str]) -> Optional[bytes]:
         return None
 
 
-def _insert_signature_image_pretty(ws, anchor_cell: str, image_bytes: Optional[bytes], padding_px: int = 2) -> None:
+def _save_signature_png(image_bytes: Optional[bytes], path: str) -> bool:
     if not image_bytes:
-        return
+        return False
 
     try:
         with PILImage.open(io.BytesIO(image_bytes)) as im:
             if im.mode in ("RGBA", "P"):
                 im = im.convert("RGB")
-            original_w, original_h = im.size
-            render_buffer = io.BytesIO()
-            im.save(render_buffer, format="PNG")
+            im.save(path, format="PNG")
     except Exception:
-        return
+        return False
+    return True
 
-    original_w = max(1, int(original_w))
-    original_h = max(1, int(original_h))
 
-    render_buffer.seek(0)
-    render_buffer.name = "signature.png"
-    img = XLImage(render_buffer)
+def _insert_signature_image_pretty(ws, anchor_cell: str, image_path: Optional[str], box_px: Tuple[int, int], padding_px: int = 2) -> None:
+    if not image_path:
+        return
 
-    merged = _find_merged_range_containing_cell(ws, anchor_cell)
-    if merged:
-        width_px, height_px = _estimate_range_pixels(ws, merged)
-    else:
-        col_letter = re.sub(r"\d+", "", anchor_cell)
-        row_num = int(re.sub(r"\D+", "", anchor_cell))
-        width_px = _excel_col_width_to_pixels(ws.column_dimensions[col_letter].width)
-        height_px = _points_to_pixels(ws.row_dimensions[row_num].height)
+    # 파일 경로로 넘기면 openpyxl은 크기만 읽어 두고 저장할 때 이미지를 다시 읽는다.
+    img = XLImage(image_path)
+    original_w = max(1, int(img.width))
+    original_h = max(1, int(img.height))
 
+    width_px, height_px = box_px
     target_w = max(10, width_px - padding_px * 2)
     target_h = max(10, height_px - padding_px * 2)
     scale = min(target_w / original_w, target_h / original_h)
@@ -176,20 +164,14 @@ def _insert_signature_image_pretty(ws, anchor_cell: str, image_bytes: Optional[b
     ws.add_image(img, anchor_cell)
 
 
-def _set_cell_value_safe(ws, coord: str, value: Any) -> None:
-    """Write to a cell while safely handling merged-cell coordinates."""
-    cell = ws[coord]
-    if not isinstance(cell, MergedCell):
-        cell.value = value
-        return
-
-    for merged_range in ws.merged_cells.ranges:
-        if coord in merged_range:
-            ws[merged_range.start_cell.coordinate].value = value
-            return
-
-    # fallback (should rarely happen)
-    ws[cell.coordinate].value = value
+def _merged_anchors(template_ws) -> Dict[Tuple[int, int], Tuple[int, int]]:
+    """병합 범위에 속한 모든 셀 (row, col) -> 병합 범위 첫 셀 (row, col)."""
+    anchors: Dict[Tuple[int, int], Tuple[int, int]] = {}
+    for merged_range in template_ws.merged_cells.ranges:
+        for row in range(merged_range.min_row, merged_range.max_row + 1):
+            for col in range(merged_range.min_col, merged_range.max_col + 1):
+                anchors[(row, col)] = (merged_range.min_row, merged_range.min_col)
+    return anchors
 
 
 def _replace_placeholder(cell_value: Any, new_value: str) -> str:
@@ -218,15 +200,17 @@ def _make_unique_sheet_title(base_title: str, used_titles: set[str]) -> str:
         idx += 1
 
 
-def _copy_cell_style_and_format(src_cell, dst_cell) -> None:
-    if src_cell.has_style:
-        dst_cell._style = copy(src_cell._style)
-    dst_cell.number_format = src_cell.number_format
-    dst_cell.protection = copy(src_cell.protection)
-    dst_cell.alignment = copy(src_cell.alignment)
-    dst_cell.font = copy(src_cell.font)
-    dst_cell.fill = copy(src_cell.fill)
-    dst_cell.border = copy(src_cell.border)
+def _compile_cell_style(src_cell) -> Tuple[Any, ...]:
+    """셀 스타일을 (StyleArray, 표시 형식, 보호, 정렬, 글꼴, 채우기, 테두리) 복사본으로 한 번 떼어 둔다."""
+    return (
+        copy(src_cell._style),
+        src_cell.number_format,
+        copy(src_cell.protection),
+        copy(src_cell.alignment),
+        copy(src_cell.font),
+        copy(src_cell.fill),
+        copy(src_cell.border),
+    )
 
 
 def _create_default_template_workbook() -> Workbook:
@@ -267,12 +251,21 @@ def _create_default_template_workbook() -> Workbook:
     return wb
 
 
-def _write_record_to_sheet(
-    ws,
-    record: Dict[str, Any],
-    name_row_height_pt: float = 18.0,
-    sign_row_height_pt: float = 52.0,
-) -> None:
+def _record_cell_values(template: "ExcelTemplate", record: Dict[str, Any]) -> Dict[Tuple[int, int], Any]:
+    """템플릿 위에 덮어쓸 레코드 값을 {(row, col): value}로 만든다. 병합 셀 좌표는 병합 범위의 첫 셀에 쓴다."""
+    values: Dict[Tuple[int, int], Any] = {}
+
+    def _key(coord: str) -> Tuple[int, int]:
+        key = coordinate_to_tuple(coord)
+        return template.merged_anchors.get(key, key)
+
+    def _put(coord: str, value: Any) -> None:
+        values[_key(coord)] = value
+
+    def _current(coord: str) -> Any:
+        key = _key(coord)
+        return values[key] if key in values else template.cells.get(key, (None, None))[0]
+
     write_date = str(record.get("date") or "")
     inspector = str(record.get("userName") or record.get("name") or "")
     hospital = str(record.get("hospital") or "")
@@ -281,82 +274,246 @@ def _write_record_to_sheet(
     subadmin_name = str(record.get("subadminName") or "")
     worker_name = inspector
 
-    _set_cell_value_safe(ws, "B1", _replace_placeholder(ws["B1"].value, write_date))
-    _set_cell_value_safe(ws, "B2", _replace_placeholder(ws["B2"].value, inspector))
-    _set_cell_value_safe(ws, "B3", _replace_placeholder(ws["B3"].value, hospital))
-    _set_cell_value_safe(ws, "B4", work_type)
-    _set_cell_value_safe(ws, "C4", _replace_placeholder(ws["C4"].value, equipment))
+    _put("B1", _replace_placeholder(_current("B1"), write_date))
+    _put("B2", _replace_placeholder(_current("B2"), inspector))
+    _put("B3", _replace_placeholder(_current("B3"), hospital))
+    _put("B4", work_type)
+    _put("C4", _replace_placeholder(_current("C4"), equipment))
 
-    ws.row_dimensions[1].height = name_row_height_pt
-    ws.row_dimensions[2].height = sign_row_height_pt
-    ws.row_dimensions[3].height = name_row_height_pt
-    ws.row_dimensions[4].height = sign_row_height_pt
+    _put("E1", f"이름: {subadmin_name}" if subadmin_name else "이름:")
+    _put("E3", f"이름: {worker_name}" if worker_name else "이름:")
 
-    _set_cell_value_safe(ws, "E1", f"이름: {subadmin_name}" if subadmin_name else "이름:")
-    _set_cell_value_safe(ws, "E3", f"이름: {worker_name}" if worker_name else "이름:")
-
-    _set_cell_value_safe(ws, "E2", None)
-    _set_cell_value_safe(ws, "E4", None)
-
-    _insert_signature_image_pretty(ws, "E2", _decode_signature_image(record.get("subadminSignatureBase64")), padding_px=2)
-    _insert_signature_image_pretty(ws, "E4", _decode_signature_image(record.get("signatureBase64")), padding_px=2)
+    _put("E2", None)
+    _put("E4", None)
 
     # checklist rows
     results = record.get("results") or []
     start_row = 7
     for idx, result in enumerate(results, start=1):
         row = start_row + idx - 1
-        _set_cell_value_safe(ws, f"A{row}", idx)
-        _set_cell_value_safe(ws, f"B{row}", result.get("question") or "")
-        _set_cell_value_safe(ws, f"C{row}", result.get("value") or "")
-        _set_cell_value_safe(ws, f"D{row}", result.get("comment") or "")
+        _put(f"A{row}", idx)
+        _put(f"B{row}", result.get("question") or "")
+        _put(f"C{row}", result.get("value") or "")
+        _put(f"D{row}", result.get("comment") or "")
 
+    return values
 
-def _copy_template_sheet_content(src_ws, dst_ws) -> None:
-    for row in src_ws.iter_rows():
-        for src_cell in row:
-            dst_cell = dst_ws.cell(row=src_cell.row, column=src_cell.column)
-            dst_cell.value = src_cell.value
-            _copy_cell_style_and_format(src_cell, dst_cell)
 
-    for merged in src_ws.merged_cells.ranges:
-        dst_ws.merge_cells(str(merged))
+def _sheet_column_widths(template_ws) -> Dict[str, Optional[float]]:
+    widths = {col: dim.width for col, dim in template_ws.column_dimensions.items()}
+    # 서명 칸 열에 너비가 없으면 openpyxl 기본 너비를 넣는다(이미지 크기 계산과 출력 모양 유지).
+    for anchor, _ in SIGNATURE_CELLS:
+        bounds = CellRange(_find_merged_range_containing_cell(template_ws, anchor) or anchor)
+        for col in range(bounds.min_col, bounds.max_col + 1):
+            widths.setdefault(get_column_letter(col), DEFAULT_COLUMN_WIDTH)
+    return widths
 
-    for col, dim in src_ws.column_dimensions.items():
-        dst_ws.column_dimensions[col].width = dim.width
 
-    for row_idx, dim in src_ws.row_dimensions.items():
-        dst_ws.row_dimensions[row_idx].height = dim.height
+def _sheet_row_heights(
+    template_ws,
+    name_row_height_pt: float = 18.0,
+    sign_row_height_pt: float = 52.0,
+) -> Dict[int, Optional[float]]:
+    heights = {row_idx: dim.height for row_idx, dim in template_ws.row_dimensions.items()}
+    heights[1] = name_row_height_pt
+    heights[2] = sign_row_height_pt
+    heights[3] = name_row_height_pt
+    heights[4] = sign_row_height_pt
+    return heights
+
+
+class ExcelTemplate:
+    """템플릿 시트를 한 번 컴파일한 결과(셀 값/스타일 번호, 열 너비, 행 높이, 병합, 서명 칸 크기).
+
+    스타일은 템플릿 안에서 같은 것끼리 번호 하나를 공유하고, 시트를 만들 때는 이 번호로 찍기만 한다.
+    여러 내보내기가 동시에 공유하므로 만든 뒤에는 읽기만 한다.
+    """
+
+    def __init__(self, ws):
+        self.styles: List[Tuple[Any, ...]] = []
+        self.cells: Dict[Tuple[int, int], Tuple[Any, Optional[int]]] = {}   # (row, col) -> (값, 스타일 번호)
+        style_ids: Dict[Tuple[int, ...], int] = {}
+        for cell in ws._cells.values():
+            style_id = None
+            if cell.has_style:
+                key = tuple(cell._style)
+                if key not in style_ids:
+                    style_ids[key] = len(self.styles)
+                    self.styles.append(_compile_cell_style(cell))
+                style_id = style_ids[key]
+            if cell.value is not None or style_id is not None:
+                self.cells[(cell.row, cell.column)] = (cell.value, style_id)
+        self.max_row = ws.max_row
+        self.max_column = ws.max_column
+
+        self.column_widths = _sheet_column_widths(ws)
+        self.row_heights = _sheet_row_heights(ws)
+        self.merged_ranges = [str(merged) for merged in ws.merged_cells.ranges]
+        self.merged_anchors = _merged_anchors(ws)
+        self.signature_boxes = {
+            anchor: _estimate_range_pixels(
+                _find_merged_range_containing_cell(ws, anchor) or anchor, self.column_widths, self.row_heights
+            )
+            for anchor, _ in SIGNATURE_CELLS
+        }
+
+
+_template_lock = threading.Lock()
+# 절대 경로(None = 기본 템플릿) -> (파일 수정 시각, 템플릿)
+_templates: Dict[Optional[str], Tuple[Optional[int], ExcelTemplate]] = {}
+
+
+def load_excel_template(template_path: Optional[str] = None) -> ExcelTemplate:
+    """템플릿을 경로와 수정 시각 기준으로 한 번만 읽고(필요하면 복구) 캐시한다. 파일이 없으면 기본 템플릿."""
+    key: Optional[str] = None
+    mtime: Optional[int] = None
+    if template_path and os.path.exists(template_path):
+        key = os.path.abspath(template_path)
+        mtime = os.stat(key).st_mtime_ns
+
+    with _template_lock:
+        cached = _templates.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        template_wb = _load_template_safe(key) if key else _create_default_template_workbook()
+        template_ws = template_wb["Sheet1"] if "Sheet1" in template_wb.sheetnames else template_wb.worksheets[0]
+        template = ExcelTemplate(template_ws)
+        _templates[key] = (mtime, template)
+        return template
+
+
+class InspectionsExcelWriter:
+    """점검 기록을 시트 단위로 흘려 쓰는 엑셀 내보내기.
+
+    write-only 워크북을 사용하므로 시트는 완성되는 즉시 임시 파일로 내려가고, 서명 이미지도 임시 디렉터리에
+    PNG로 둔다. add_records에 페이지 단위로 넘기면 메모리에는 한 페이지 분량의 레코드만 남는다.
+    finish()는 완성된 xlsx 파일 객체를 반환하고, 실패하면 close()로 임시 파일을 정리한다.
+    """
+
+    def __init__(self, template_path: Optional[str] = None):
+        self._template = load_excel_template(template_path)
+
+        self._wb = Workbook(write_only=True)
+        self._tmpdir = tempfile.TemporaryDirectory(prefix="xlsx_export_")
+        self._images: Dict[str, Optional[str]] = {}   # 서명 base64 해시 -> PNG 경로
+        self._style_arrays: Dict[int, Any] = {}        # 템플릿 스타일 번호 -> 이 워크북에 등록한 StyleArray
+        self._used_titles: set[str] = set()
+        self._sheet_count = 0
+
+    def add_records(self, records: Iterable[Dict[str, Any]]) -> None:
+        for record in records:
+            self._add_sheet(record)
+
+    def finish(self) -> BinaryIO:
+        try:
+            if self._sheet_count == 0:
+                self._add_sheet({})
+            output = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_BYTES)
+            self._wb.save(output)
+        finally:
+            self.close()
+        output.seek(0)
+        return output
+
+    def close(self) -> None:
+        # 저장 전에 실패하면 write-only 시트의 임시 파일이 남으므로 직접 지운다.
+        for ws in self._wb.worksheets:
+            writer = getattr(ws, "_writer", None)
+            if writer is not None and os.path.exists(writer.out):
+                writer.close()
+                writer.cleanup()
+        self._tmpdir.cleanup()
+
+    def _signature_image_path(self, signature_base64: Optional[str]) -> Optional[str]:
+        raw = str(signature_base64 or "").strip()
+        if not raw:
+            return None
+        key = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        if key not in self._images:
+            path = os.path.join(self._tmpdir.name, f"{key}.png")
+            self._images[key] = path if _save_signature_png(_decode_signature_image(raw), path) else None
+        return self._images[key]
+
+    def _style_array(self, ws, style_id: int):
+        style = self._style_arrays.get(style_id)
+        if style is None:
+            base, number_format, protection, alignment, font, fill, border = self._template.styles[style_id]
+            cell = WriteOnlyCell(ws)
+            cell._style = copy(base)
+            cell.number_format = number_format
+            cell.protection = protection
+            cell.alignment = alignment
+            cell.font = font
+            cell.fill = fill
+            cell.border = border
+            style = self._style_arrays[style_id] = cell._style
+        return style
+
+    def _add_sheet(self, record: Dict[str, Any]) -> None:
+        template = self._template
+        base_name = f"{record.get('date') or 'NoDate'}_{record.get('name') or record.get('userName') or 'Inspection'}"
+        ws = self._wb.create_sheet(title=_make_unique_sheet_title(base_name, self._used_titles))
+        self._sheet_count += 1
+
+        # write-only 시트는 열/행 크기와 병합, 이미지를 행을 쓰기 전에 정해 둬야 한다.
+        for col, width in template.column_widths.items():
+            ws.column_dimensions[col].width = width
+        for row_idx, height in template.row_heights.items():
+            ws.row_dimensions[row_idx].height = height
+        for merged in template.merged_ranges:
+            ws.merged_cells.add(merged)
+
+        for anchor, key in SIGNATURE_CELLS:
+            image_path = self._signature_image_path(record.get(key))
+            _insert_signature_image_pretty(ws, anchor, image_path, template.signature_boxes[anchor], padding_px=2)
+
+        # 템플릿 셀은 미리 컴파일한 값과 스타일 번호로 찍고, 레코드 값만 덮어쓴다.
+        values = _record_cell_values(template, record)
+        max_row = max([template.max_row] + [row for row, _ in values])
+        max_col = max([template.max_column] + [col for _, col in values])
+        for row_idx in range(1, max_row + 1):
+            row: List[Any] = []
+            for col_idx in range(1, max_col + 1):
+                value, style_id = template.cells.get((row_idx, col_idx), (None, None))
+                if (row_idx, col_idx) in values:
+                    value = values[(row_idx, col_idx)]
+                if style_id is None:
+                    row.append(value)
+                    continue
+                cell = WriteOnlyCell(ws, value=value)
+                cell._style = copy(self._style_array(ws, style_id))
+                row.append(cell)
+            ws.append(row)
+
+        # 시트를 닫아 XML 임시 파일을 마무리한다(열린 파일은 항상 1개).
+        # 병합/행·열 크기는 이미 XML에 쓰였으므로 비워서 시트마다 남는 객체를 줄인다.
+        ws.close()
+        ws.merged_cells = MultiCellRange()
+        ws.row_dimensions.clear()
+        ws.column_dimensions.clear()
 
 
 def build_inspections_excel_bytes(
     records: List[Dict[str, Any]],
     template_path: Optional[str] = None,
 ) -> bytes:
-    if template_path and os.path.exists(template_path):
-        template_wb = _load_template_safe(template_path)
-    else:
-        template_wb = _create_default_template_workbook()
-
-    template_ws = template_wb["Sheet1"] if "Sheet1" in template_wb.sheetnames else template_wb.worksheets[0]
-
-    wb = Workbook()
-    wb.remove(wb.active)
+    writer = InspectionsExcelWriter(template_path)
+    writer.add_records(records)
+    with writer.finish() as output:
+        return output.read()
 
-    used_titles: set[str] = set()
-    target_records = records or [{}]
 
-    for record in target_records:
-        base_name = f"{record.get('date') or 'NoDate'}_{record.get('name') or record.get('userName') or 'Inspection'}"
-        title = _make_unique_sheet_title(base_name, used_titles)
-
-        ws = wb.create_sheet(title=title)
-        _copy_template_sheet_content(template_ws, ws)
-        _write_record_to_sheet(ws, record)
-
-    output = io.BytesIO()
-    wb.save(output)
-    return output.getvalue()
+def iter_file_chunks(fp: BinaryIO, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[bytes]:
+    """파일 객체를 chunk_size씩 읽어 내보내고 다 읽으면 닫는다(StreamingResponse용)."""
+    try:
+        while True:
+            chunk = fp.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        fp.close()
 
 
 def build_export_filename(start_date: str, end_date: str) -> str:
@@ -0,0 +1,64 @@
+"""점검 변경 이벤트 피드.
+
+inspections_service의 쓰기 경로(제출/재제출/승인/반려/취소)가 `publish_inspection_change`를 호출하고,
+`GET /inspections/stream`(SSE)이 `inspection_changes`로 구독한다. 이벤트에는 목록 갱신에 필요한 요약만 담는다.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from app.core.events import EventBroker
+
+EVENT_CREATED = "created"
+EVENT_RESUBMITTED = "resubmitted"
+EVENT_APPROVED = "approved"
+EVENT_REJECTED = "rejected"
+EVENT_CANCELLED = "cancelled"
+
+EVENT_FIELDS = [
+    "id",
+    "userName",
+    "date",
+    "hospital",
+    "equipmentName",
+    "workType",
+    "status",
+    "improveCount",
+    "rejectReason",
+    "approvedBy",
+    "updatedAt",
+]
+
+_broker = EventBroker()
+
+
+def publish_inspection_change(event_type: str, record: Dict[str, Any]) -> None:
+    _broker.publish({"type": event_type, **{field: record.get(field) for field in EVENT_FIELDS}})
+
+
+def _can_see(event: Dict[str, Any], requester_role: Optional[str], categories: set) -> bool:
+    # 관리자 목록과 같은 규칙: SUB_ADMIN은 담당 작업 종류만, 그 외에는 전체
+    if str(requester_role or "").strip().upper() == "SUB_ADMIN" and categories:
+        return str(event.get("workType") or "") in categories
+    return True
+
+
+async def inspection_changes(
+    requester_role: Optional[str] = None,
+    requester_categories: Optional[List[str]] = None,
+    keepalive_seconds: float = 15.0,
+) -> AsyncIterator[Optional[Dict[str, Any]]]:
+    """요청자가 볼 수 있는 변경 이벤트를 계속 내보낸다. keepalive_seconds 동안 이벤트가 없으면 None을 낸다."""
+    categories = {str(c).strip() for c in (requester_categories or []) if str(c).strip()}
+    queue = _broker.subscribe()
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=keepalive_seconds)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            if _can_see(event, requester_role, categories):
+                yield event
+    finally:
+        _broker.unsubscribe(queue)
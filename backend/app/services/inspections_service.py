@@ -1,8 +1,31 @@
+import asyncio
 import datetime
+import hashlib
+import json
 import uuid
-from typing import Any, Dict, List, Optional
-
-from app.storage.firestore_client import get_firestore_client
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from app.services.inspection_events import (
+    EVENT_APPROVED,
+    EVENT_CANCELLED,
+    EVENT_CREATED,
+    EVENT_REJECTED,
+    EVENT_RESUBMITTED,
+    publish_inspection_change,
+)
+from app.services.signatures_service import load_signatures, store_signature, store_signatures
+from app.storage.repository import (
+    BATCH_WRITE_LIMIT,
+    DELETE_FIELD,
+    ConflictError,
+    Filter,
+    SideWrite,
+    Write,
+    decode_cursor,
+    encode_cursor,
+    get_repository,
+    subcollection,
+)
 
 # status
 STATUS_PENDING = "PENDING"          # 점검자 1차 제출 후 (승인 대기)
@@ -10,6 +33,75 @@ STATUS_SUBMITTED = "SUBMITTED"      # 서브관리자 승인 완료
 STATUS_REJECTED = "REJECTED"        # 서브관리자 반려
 STATUS_CANCELLED = "CANCELLED"      # 점검자 취소
 
+# 허용되는 상태 전이. 승인/반려는 승인 대기 건에만 가능하고, 취소된 건은 더 바꿀 수 없다.
+# (재제출은 → PENDING)
+ALLOWED_TRANSITIONS = {
+    STATUS_PENDING: {STATUS_SUBMITTED, STATUS_REJECTED, STATUS_CANCELLED, STATUS_PENDING},
+    STATUS_REJECTED: {STATUS_PENDING, STATUS_CANCELLED},
+    STATUS_SUBMITTED: {STATUS_PENDING, STATUS_CANCELLED},
+    STATUS_CANCELLED: set(),
+}
+
+# 상태 전이 -> 변경 이벤트(SSE 피드)
+TRANSITION_EVENTS = {
+    STATUS_PENDING: EVENT_RESUBMITTED,
+    STATUS_SUBMITTED: EVENT_APPROVED,
+    STATUS_REJECTED: EVENT_REJECTED,
+    STATUS_CANCELLED: EVENT_CANCELLED,
+}
+
+# 목록 정렬: 점검일 최신순 → 수정시각 최신순 (Firestore 복합 인덱스: firestore.indexes.json)
+LIST_ORDER = [("date", "desc"), ("updatedAt", "desc")]
+MAX_PAGE_SIZE = 200
+
+# 작업자 변경분 동기화(since): 수정시각 오래된 순 (Firestore 복합 인덱스: userName + updatedAt)
+CHANGES_ORDER = [("updatedAt", "asc")]
+
+# 제출/수정 이력은 inspections/{id}/revisions 하위 컬렉션에 1건씩 쌓는다(최신순 조회).
+REVISIONS = "revisions"
+REVISION_ORDER = [("seq", "desc")]
+
+# 승인 대기 큐: PENDING 점검의 요약만 모아 둔 컬렉션(문서 키 = 점검 id).
+# 점검 문서와 같은 batch/트랜잭션에서 넣고/빼므로, 서브관리자의 "서명할 건" 조회는 이력 크기와 무관하게 이 컬렉션만 읽는다.
+QUEUE = "inspection_queue"
+QUEUE_ORDER = [("createdAt", "asc")]
+QUEUE_FIELDS = [
+    "userName",
+    "date",
+    "hospital",
+    "equipmentName",
+    "workType",
+    "resultCount",
+    "improveCount",
+    "createdAt",
+    "updatedAt",
+]
+
+# 관리자 목록(summary)에서 읽는 필드. 응답/서명 등 큰 필드는 상세 조회에서만 읽는다.
+ADMIN_SUMMARY_FIELDS = [
+    "name",
+    "userName",
+    "date",
+    "hospital",
+    "equipmentName",
+    "workType",
+    "status",
+    "resultCount",
+    "improveCount",
+    "rejectReason",
+    "approvedBy",
+    "createdAt",
+    "updatedAt",
+]
+
+
+class AmbiguousInspectionError(ValueError):
+    """(userName, date, hospital, equipmentName) 조합으로 점검이 2건 이상 조회될 때."""
+
+
+class InspectionConflictError(ValueError):
+    """허용되지 않는 상태 전이이거나, 읽은 뒤 다른 요청이 먼저 점검을 바꿨을 때."""
+
 
 def _normalize_value(value: str) -> str:
     if value is None:
@@ -44,7 +136,7 @@ def _counts(answers: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
-def _make_revision(answers: List[Dict[str, Any]], signature_base64: Optional[str]) -> Dict[str, Any]:
+def _make_revision(answers: List[Dict[str, Any]], signature_ref: Optional[str]) -> Dict[str, Any]:
     now = datetime.datetime.now().isoformat()
     normalized_answers = []
     for a in answers or []:
@@ -64,37 +156,205 @@ def _make_revision(answers: List[Dict[str, Any]], signature_base64: Optional[str
         "id": f"rev-{uuid.uuid4().hex[:10]}",
         "createdAt": now,
         "answers": normalized_answers,
-        "signatureBase64": signature_base64,
+        "signatureRef": signature_ref,
         **c,
     }
 
 
-def _all_records() -> List[Dict[str, Any]]:
-    client = get_firestore_client()
-    docs = client.collection("inspections").stream()
-    out = []
-    for doc in docs:
-        data = doc.to_dict() or {}
-        data["id"] = doc.id
-        out.append(data)
+def _lookup_key(*parts: Any) -> str:
+    normalized = [str(p or "").strip() for p in parts]
+    raw = json.dumps(normalized, ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _with_lookup_keys(record: Dict[str, Any]) -> Dict[str, Any]:
+    """_find_record 조회용 자연키 필드를 채운다.
+
+    - lookupKey: (userName, date, hospital, equipmentName)
+    - lookupPrefix: (userName, date, hospital) - equipmentName 없이 조회할 때 사용
+    """
+    user_name = record.get("userName")
+    date = record.get("date")
+    hospital = record.get("hospital")
+    return {
+        **record,
+        "lookupKey": _lookup_key(user_name, date, hospital, record.get("equipmentName")),
+        "lookupPrefix": _lookup_key(user_name, date, hospital),
+    }
+
+
+async def _all_records() -> List[Dict[str, Any]]:
+    return await get_repository().query("inspections")
+
+
+def _encode_cursor(record: Dict[str, Any], order: List[Tuple[str, str]] = LIST_ORDER) -> str:
+    return encode_cursor(record, order)
+
+
+def _decode_cursor(cursor: Optional[str], order: List[Tuple[str, str]] = LIST_ORDER) -> Optional[Dict[str, Any]]:
+    return decode_cursor(cursor, order)
+
+
+async def _query_page(
+    filters: List[Filter],
+    limit: Optional[int],
+    cursor: Optional[str],
+    select: Optional[List[str]] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """LIST_ORDER 순서로 조회한다. limit이 없으면 전체, 있으면 한 페이지와 다음 페이지 커서를 반환한다."""
+    repo = get_repository()
+    if limit is None:
+        return await repo.query("inspections", filters, order_by=LIST_ORDER, select=select), None
+
+    size = max(1, min(int(limit), MAX_PAGE_SIZE))
+    rows = await repo.query(
+        "inspections",
+        filters,
+        order_by=LIST_ORDER,
+        limit=size + 1,
+        start_after=_decode_cursor(cursor),
+        select=select,
+    )
+    next_cursor = _encode_cursor(rows[size - 1]) if len(rows) > size else None
+    return rows[:size], next_cursor
+
+
+async def _get_record(inspection_id: str) -> Optional[Dict[str, Any]]:
+    rec_id = str(inspection_id or "").strip()
+    if not rec_id:
+        return None
+    return await get_repository().get("inspections", rec_id)
+
+
+async def _externalize_signature(obj: Dict[str, Any], inline_field: str, ref_field: str) -> None:
+    # 예전 문서에 남아 있는 inline 서명을 signatures 컬렉션으로 옮기고 ref만 남긴다.
+    if inline_field not in obj:
+        return
+    inline = obj.pop(inline_field)
+    if inline and not obj.get(ref_field):
+        obj[ref_field] = await store_signature(inline)
+
+
+async def _externalize_signatures(record: Dict[str, Any]) -> Dict[str, Any]:
+    out = dict(record)
+    await _externalize_signature(out, "signatureBase64", "signatureRef")
+    await _externalize_signature(out, "subadminSignatureBase64", "subadminSignatureRef")
+    if isinstance(out.get("latestRevision"), dict):
+        out["latestRevision"] = dict(out["latestRevision"])
+        await _externalize_signature(out["latestRevision"], "signatureBase64", "signatureRef")
+    revisions = []
+    for rev in out.get("revisions") or []:
+        rev = dict(rev)
+        await _externalize_signature(rev, "signatureBase64", "signatureRef")
+        revisions.append(rev)
+    if "revisions" in out:
+        out["revisions"] = revisions
     return out
 
 
-def _save_record(record: Dict[str, Any]) -> Dict[str, Any]:
-    client = get_firestore_client()
-    rec_id = str(record.get("id") or f"rec-{uuid.uuid4().hex[:10]}")
-    payload = {**record, "id": rec_id}
-    client.collection("inspections").document(rec_id).set(payload, merge=True)
-    return payload
+def _status_of(record: Dict[str, Any]) -> str:
+    # 예전 문서는 status가 비어 있으면 제출 완료로 본다.
+    return str(record.get("status") or STATUS_SUBMITTED).strip().upper()
+
+
+def _check_transition(record: Dict[str, Any], target: str) -> None:
+    current = _status_of(record)
+    if target not in ALLOWED_TRANSITIONS.get(current, set()):
+        raise InspectionConflictError(f"cannot change status from {current} to {target}")
+
+
+async def _transition(record: Dict[str, Any], target: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """상태를 target으로 바꾸고 changes 필드만 update한다. 문서가 사라졌으면 None.
+
+    읽은 시점의 status/updatedAt이 그대로일 때만 쓰므로, 동시에 들어온 승인/반려/재제출 중
+    하나만 반영되고 나머지는 InspectionConflictError가 된다.
+    """
+    _check_transition(record, target)
+
+    changes = {**changes, "status": target}
+    updated = _with_changes(record, changes)
+    try:
+        # 대기 큐 문서는 같은 트랜잭션에서 넣거나 빼므로 점검 상태와 어긋나지 않는다.
+        await get_repository().update(
+            "inspections",
+            record["id"],
+            changes,
+            expected={"status": record.get("status"), "updatedAt": record.get("updatedAt")},
+            side_writes=[_queue_write(updated)],
+        )
+    except ConflictError as exc:
+        raise InspectionConflictError("inspection was changed by another request; reload and try again") from exc
+    except KeyError:
+        return None
+    record.clear()
+    record.update(updated)
+    publish_inspection_change(TRANSITION_EVENTS[target], record)
+    return record
+
+
+def _queue_entry(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {**{field: record.get(field) for field in QUEUE_FIELDS}, "status": STATUS_PENDING}
 
 
-def create_inspection_record(payload: Dict[str, Any]) -> Dict[str, Any]:
+def _queue_write(record: Dict[str, Any]) -> SideWrite:
+    """점검 상태에 맞는 승인 대기 큐 쓰기(PENDING이면 요약을 넣고, 아니면 뺀다)."""
+    if _status_of(record) == STATUS_PENDING:
+        return (QUEUE, record["id"], _queue_entry(record))
+    return (QUEUE, record["id"], None)
+
+
+def _with_changes(record: Dict[str, Any], changes: Dict[str, Any]) -> Dict[str, Any]:
+    # update(changes)가 반영된 뒤의 문서 (DELETE_FIELD는 필드 삭제)
+    out = dict(record)
+    for field, value in changes.items():
+        if value is DELETE_FIELD:
+            out.pop(field, None)
+        else:
+            out[field] = value
+    return out
+
+
+def _revision_pointer(rev: Dict[str, Any]) -> Dict[str, Any]:
+    # 부모 문서에는 최신 revision의 요약만 둔다. 응답 본문은 results에 있다.
+    return {k: v for k, v in rev.items() if k != "answers"}
+
+
+async def _append_revision(rec_id: str, rev: Dict[str, Any]) -> None:
+    await get_repository().set(subcollection("inspections", rec_id, REVISIONS), rev["id"], rev)
+
+
+async def _delete_revision(rec_id: str, rev_id: str) -> None:
+    await get_repository().delete(subcollection("inspections", rec_id, REVISIONS), rev_id)
+
+
+async def _move_embedded_revisions(r: Dict[str, Any]) -> None:
+    """예전 문서의 revisions 배열을 하위 컬렉션으로 옮기고 부모에서는 뺀다."""
+    if "revisions" not in r:
+        return
+    embedded = (await _externalize_signatures({"revisions": r.pop("revisions") or []}))["revisions"]
+    for seq, rev in enumerate(embedded, start=1):
+        await _append_revision(r["id"], {**rev, "seq": seq})
+    r["revisionCount"] = len(embedded)
+    if embedded:
+        r["latestRevision"] = _revision_pointer({**embedded[-1], "seq": len(embedded)})
+
+
+def _signature_refs(r: Dict[str, Any]) -> List[Optional[str]]:
+    latest = r.get("latestRevision") or {}
+    return [latest.get("signatureRef"), r.get("subadminSignatureRef")]
+
+
+def _resolve_signature(obj: Dict[str, Any], inline_field: str, ref_field: str, signatures: Dict[str, str]) -> Optional[str]:
+    return obj.get(inline_field) or signatures.get(obj.get(ref_field) or "")
+
+
+def _new_record(payload: Dict[str, Any], signature_ref: Optional[str]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """제출 payload로 새 점검 문서와 첫 revision을 만든다(저장은 하지 않음)."""
     rec_id = f"rec-{uuid.uuid4().hex[:10]}"
     now = datetime.datetime.now().isoformat()
 
     answers = payload.get("answers") or []
-    signature = payload.get("signatureBase64")
-    rev = _make_revision(answers, signature)
+    rev = {**_make_revision(answers, signature_ref), "seq": 1}
 
     record = {
         "id": rec_id,
@@ -108,110 +368,339 @@ def create_inspection_record(payload: Dict[str, Any]) -> Dict[str, Any]:
         "status": STATUS_PENDING,
         "createdAt": now,
         "updatedAt": now,
-        "revisions": [rev],
-        "latestRevision": rev,
+        "revisionCount": 1,
+        "latestRevision": _revision_pointer(rev),
         "results": rev["answers"],
-        "signatureBase64": signature,
+        "signatureRef": signature_ref,
         "resultCount": rev["resultCount"],
         "improveCount": rev["improveCount"],
     }
+    return record, rev
+
+
+def _new_record_writes(record: Dict[str, Any], rev: Dict[str, Any]) -> List[Write]:
+    # 첫 revision / 점검 문서 / 대기 큐 문서. 한 batch로 함께 커밋한다.
+    return [
+        (subcollection("inspections", record["id"], REVISIONS), rev["id"], rev),
+        ("inspections", record["id"], _with_lookup_keys(record)),
+        (QUEUE, record["id"], _queue_entry(record)),
+    ]
+
+
+async def create_inspection_record(payload: Dict[str, Any]) -> Dict[str, Any]:
+    record, rev = _new_record(payload, await store_signature(payload.get("signatureBase64")))
+    await get_repository().set_many(_new_record_writes(record, rev))
+    saved = _with_lookup_keys(record)
+    publish_inspection_change(EVENT_CREATED, saved)
+    return saved
+
+
+async def create_inspection_records(payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """여러 점검을 한 번에 저장한다(오프라인 작성분 일괄 동기화).
+
+    서명은 한 번에 저장하고, 점검 문서/첫 revision/대기 큐 문서는 WriteBatch(최대 BATCH_WRITE_LIMIT건)로 묶어 커밋한다.
+    한 점검의 문서들은 항상 같은 batch에 들어가므로, batch가 실패하면 그 batch의 점검만 실패로 보고한다.
+    반환값은 입력 순서대로 {"id": ...} 또는 {"error": ...}.
+    """
+    refs = await store_signatures(p.get("signatureBase64") for p in payloads)
+    docs = []  # (점검 문서, 해당 점검의 쓰기 목록)
+    for payload, signature_ref in zip(payloads, refs):
+        record, rev = _new_record(payload, signature_ref)
+        docs.append((record, _new_record_writes(record, rev)))
+
+    per_batch = BATCH_WRITE_LIMIT // 3
+    chunks = [docs[i:i + per_batch] for i in range(0, len(docs), per_batch)]
+    repo = get_repository()
+    outcomes = await asyncio.gather(
+        *(repo.set_many([write for _, writes in chunk for write in writes]) for chunk in chunks),
+        return_exceptions=True,
+    )
+
+    results: List[Dict[str, Any]] = []
+    for chunk, outcome in zip(chunks, outcomes):
+        for record, _ in chunk:
+            if isinstance(outcome, Exception):
+                results.append({"error": str(outcome) or outcome.__class__.__name__})
+            else:
+                publish_inspection_change(EVENT_CREATED, record)
+                results.append({"id": record["id"]})
+    return results
+
+
+def _category_filters(requester_role: Optional[str], requester_categories: Optional[List[str]]) -> List[Filter]:
+    # SUB_ADMIN은 담당 작업 종류만, 그 외에는 전체
+    role = str(requester_role or "").strip().upper()
+    category_set = {str(c).strip() for c in (requester_categories or []) if str(c).strip()}
+    if role == "SUB_ADMIN" and category_set:
+        return [("workType", "in", sorted(category_set))]
+    return []
 
-    return _save_record(record)
 
+def _admin_filters(start_date: str, end_date: str, requester_role: Optional[str], requester_categories: Optional[List[str]]) -> List[Filter]:
+    filters: List[Filter] = [("date", ">=", start_date), ("date", "<=", end_date)]
+    return filters + _category_filters(requester_role, requester_categories)
 
-def list_admin_inspections(start_date: str, end_date: str, requester_role: Optional[str] = None, requester_categories: Optional[List[str]] = None) -> List[Dict[str, Any]]:
-    data = [r for r in _all_records() if start_date <= (r.get("date") or "") <= end_date]
 
-    role = str(requester_role or "").strip().upper()
-    category_set = {str(c).strip() for c in (requester_categories or []) if str(c).strip()}
-    if role == "SUB_ADMIN" and category_set:
-        data = [r for r in data if str(r.get("workType") or "") in category_set]
+def _to_admin_item(r: Dict[str, Any], signatures: Dict[str, str]) -> Dict[str, Any]:
+    latest = r.get("latestRevision") or {}
+    return {
+        "id": r.get("id"),
+        "name": r.get("name"),
+        "userName": r.get("userName"),
+        "date": r.get("date"),
+        "hospital": r.get("hospital"),
+        "equipmentName": r.get("equipmentName"),
+        "workType": r.get("workType"),
+        "status": r.get("status"),
+        "resultCount": latest.get("resultCount"),
+        "improveCount": latest.get("improveCount"),
+        "rejectReason": r.get("rejectReason") or "",
+        "results": r.get("results") or latest.get("answers") or [],
+        "signatureBase64": _resolve_signature(latest, "signatureBase64", "signatureRef", signatures),
+        "subadminName": r.get("approvedBy"),
+        "subadminSignatureBase64": _resolve_signature(r, "subadminSignatureBase64", "subadminSignatureRef", signatures),
+        "createdAt": r.get("createdAt"),
+        "updatedAt": r.get("updatedAt"),
+    }
 
-    data.sort(key=lambda r: (r.get("date") or "", r.get("updatedAt") or ""), reverse=True)
-    out: List[Dict[str, Any]] = []
-    for r in data:
-        latest = r.get("latestRevision") or {}
-        out.append(
-            {
-                "id": r.get("id"),
-                "name": r.get("name"),
-                "userName": r.get("userName"),
-                "date": r.get("date"),
-                "hospital": r.get("hospital"),
-                "equipmentName": r.get("equipmentName"),
-                "workType": r.get("workType"),
-                "status": r.get("status"),
-                "resultCount": latest.get("resultCount"),
-                "improveCount": latest.get("improveCount"),
-                "rejectReason": r.get("rejectReason") or "",
-                "results": latest.get("answers") or [],
-                "signatureBase64": latest.get("signatureBase64"),
-                "subadminName": r.get("approvedBy"),
-                "subadminSignatureBase64": r.get("subadminSignatureBase64"),
-                "createdAt": r.get("createdAt"),
-                "updatedAt": r.get("updatedAt"),
-            }
+
+def _to_admin_summary(r: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": r.get("id"),
+        "name": r.get("name"),
+        "userName": r.get("userName"),
+        "date": r.get("date"),
+        "hospital": r.get("hospital"),
+        "equipmentName": r.get("equipmentName"),
+        "workType": r.get("workType"),
+        "status": r.get("status"),
+        "resultCount": r.get("resultCount"),
+        "improveCount": r.get("improveCount"),
+        "rejectReason": r.get("rejectReason") or "",
+        "subadminName": r.get("approvedBy"),
+        "createdAt": r.get("createdAt"),
+        "updatedAt": r.get("updatedAt"),
+    }
+
+
+async def list_admin_inspections(
+    start_date: str,
+    end_date: str,
+    requester_role: Optional[str] = None,
+    requester_categories: Optional[List[str]] = None,
+    summary: bool = False,
+) -> List[Dict[str, Any]]:
+    filters = _admin_filters(start_date, end_date, requester_role, requester_categories)
+    if summary:
+        rows, _ = await _query_page(filters, None, None, select=ADMIN_SUMMARY_FIELDS)
+        return [_to_admin_summary(r) for r in rows]
+
+    rows, _ = await _query_page(filters, None, None)
+    signatures = await load_signatures(ref for r in rows for ref in _signature_refs(r))
+    return [_to_admin_item(r, signatures) for r in rows]
+
+
+async def list_admin_inspections_page(
+    start_date: str,
+    end_date: str,
+    requester_role: Optional[str] = None,
+    requester_categories: Optional[List[str]] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    summary: bool = False,
+) -> Dict[str, Any]:
+    filters = _admin_filters(start_date, end_date, requester_role, requester_categories)
+    if summary:
+        rows, next_cursor = await _query_page(filters, limit, cursor, select=ADMIN_SUMMARY_FIELDS)
+        return {"items": [_to_admin_summary(r) for r in rows], "nextCursor": next_cursor}
+
+    rows, next_cursor = await _query_page(filters, limit, cursor)
+    signatures = await load_signatures(ref for r in rows for ref in _signature_refs(r))
+    return {"items": [_to_admin_item(r, signatures) for r in rows], "nextCursor": next_cursor}
+
+
+async def iter_admin_inspections(
+    start_date: str,
+    end_date: str,
+    requester_role: Optional[str] = None,
+    requester_categories: Optional[List[str]] = None,
+    page_size: int = MAX_PAGE_SIZE,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """기간 내 점검 기록(서명 포함)을 페이지 단위로 내보낸다. 내보내기처럼 전체를 훑을 때 메모리를 한 페이지로 묶는다."""
+    cursor: Optional[str] = None
+    while True:
+        page = await list_admin_inspections_page(
+            start_date,
+            end_date,
+            requester_role=requester_role,
+            requester_categories=requester_categories,
+            limit=page_size,
+            cursor=cursor,
         )
-    return out
+        if page["items"]:
+            yield page["items"]
+        cursor = page["nextCursor"]
+        if not cursor:
+            return
+
+
+async def get_admin_inspection_detail(inspection_id: str) -> Optional[Dict[str, Any]]:
+    r = await _get_record(inspection_id)
+    if not r:
+        return None
+    return _to_admin_item(r, await load_signatures(_signature_refs(r)))
 
 
-def can_subadmin_handle_inspection(inspection_id: str, categories: Optional[List[str]]) -> bool:
+def _to_revision_item(rev: Dict[str, Any], signatures: Dict[str, str]) -> Dict[str, Any]:
+    return {
+        "id": rev.get("id"),
+        "seq": rev.get("seq"),
+        "createdAt": rev.get("createdAt"),
+        "answers": rev.get("answers") or [],
+        "resultCount": rev.get("resultCount"),
+        "improveCount": rev.get("improveCount"),
+        "signatureBase64": _resolve_signature(rev, "signatureBase64", "signatureRef", signatures),
+    }
+
+
+async def list_inspection_revisions(inspection_id: str, limit: int = 20, cursor: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """제출/수정 이력을 최신순으로 한 페이지씩 반환한다. 점검 문서가 없으면 None."""
+    r = await _get_record(inspection_id)
+    if not r:
+        return None
+
+    size = max(1, min(int(limit), MAX_PAGE_SIZE))
+    start_after = _decode_cursor(cursor, REVISION_ORDER)
+    if "revisions" in r:
+        # 하위 컬렉션으로 옮기기 전의 문서
+        rows = [{**rev, "seq": seq} for seq, rev in enumerate(r.get("revisions") or [], start=1)][::-1]
+        if start_after is not None:
+            rows = [rev for rev in rows if rev["seq"] < (start_after.get("seq") or 0)]
+        rows = rows[:size + 1]
+    else:
+        rows = await get_repository().query(
+            subcollection("inspections", r["id"], REVISIONS),
+            order_by=REVISION_ORDER,
+            limit=size + 1,
+            start_after=start_after,
+        )
+
+    next_cursor = _encode_cursor(rows[size - 1], REVISION_ORDER) if len(rows) > size else None
+    rows = rows[:size]
+    signatures = await load_signatures(rev.get("signatureRef") for rev in rows)
+    return {"items": [_to_revision_item(rev, signatures) for rev in rows], "nextCursor": next_cursor}
+
+
+async def can_subadmin_handle_inspection(inspection_id: str, categories: Optional[List[str]]) -> bool:
     allowed = {str(c).strip() for c in (categories or []) if str(c).strip()}
     if not allowed:
         return False
 
-    for r in _all_records():
-        if str(r.get("id")) != str(inspection_id):
-            continue
-        return str(r.get("workType") or "") in allowed
-    return False
+    r = await _get_record(inspection_id)
+    if not r:
+        return False
+    return str(r.get("workType") or "") in allowed
 
 
-def list_my_inspections(user_name: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict[str, Any]]:
-    data = [r for r in _all_records() if str(r.get("userName")) == str(user_name)]
+def _my_filters(user_name: str, start_date: Optional[str], end_date: Optional[str]) -> List[Filter]:
+    filters: List[Filter] = [("userName", "==", str(user_name))]
     if start_date:
-        data = [r for r in data if (r.get("date") or "") >= start_date]
+        filters.append(("date", ">=", start_date))
     if end_date:
-        data = [r for r in data if (r.get("date") or "") <= end_date]
-
-    data.sort(key=lambda r: (r.get("date") or "", r.get("updatedAt") or ""), reverse=True)
-    out: List[Dict[str, Any]] = []
-    for r in data:
-        latest = r.get("latestRevision") or {}
-        out.append(
-            {
-                "id": r.get("id"),
-                "date": r.get("date"),
-                "hospital": r.get("hospital"),
-                "equipmentName": r.get("equipmentName"),
-                "workType": r.get("workType"),
-                "status": r.get("status"),
-                "improveCount": latest.get("improveCount"),
-                "rejectReason": r.get("rejectReason") or "",
-            }
-        )
-    return out
+        filters.append(("date", "<=", end_date))
+    return filters
 
 
-def _find_record(user_name: str, date: str, hospital: str, equipment_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
-    for r in _all_records():
-        if str(r.get("userName")) != str(user_name):
-            continue
-        if str(r.get("date")) != str(date):
-            continue
-        if str(r.get("hospital")) != str(hospital):
-            continue
-        if equipment_name is not None and str(r.get("equipmentName") or "") != str(equipment_name or ""):
-            continue
-        return r
-    return None
+def _to_my_item(r: Dict[str, Any]) -> Dict[str, Any]:
+    latest = r.get("latestRevision") or {}
+    return {
+        "id": r.get("id"),
+        "date": r.get("date"),
+        "hospital": r.get("hospital"),
+        "equipmentName": r.get("equipmentName"),
+        "workType": r.get("workType"),
+        "status": r.get("status"),
+        "improveCount": latest.get("improveCount"),
+        "rejectReason": r.get("rejectReason") or "",
+        "updatedAt": r.get("updatedAt"),
+    }
 
 
-def get_my_inspection_detail(user_name: str, date: str, hospital: str, equipment_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
-    r = _find_record(user_name, date, hospital, equipment_name)
+async def list_my_inspections(user_name: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict[str, Any]]:
+    rows, _ = await _query_page(_my_filters(user_name, start_date, end_date), None, None)
+    return [_to_my_item(r) for r in rows]
+
+
+async def list_my_inspections_page(
+    user_name: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    rows, next_cursor = await _query_page(_my_filters(user_name, start_date, end_date), limit, cursor)
+    return {"items": [_to_my_item(r) for r in rows], "nextCursor": next_cursor}
+
+
+async def list_my_inspection_changes(user_name: str, since: Optional[str], limit: int = MAX_PAGE_SIZE) -> Dict[str, Any]:
+    """since 이후에 생성/변경된 점검만 반환한다(작업자 목록의 증분 동기화).
+
+    since는 이전 응답의 nextSince(커서) 또는 마지막으로 받은 항목의 updatedAt 값이다(이 경우 같은 시각 포함).
+    비어 있으면 처음부터. 취소된 건은 items 대신 tombstones({id, status, updatedAt})로 내려준다.
+    hasMore가 true면 nextSince로 바로 다시 요청한다. 클라이언트는 id 기준으로 병합하면 된다.
+    """
+    size = max(1, min(int(limit), MAX_PAGE_SIZE))
+    filters: List[Filter] = [("userName", "==", str(user_name))]
+    start_after = None
+    if since:
+        try:
+            start_after = _decode_cursor(since, CHANGES_ORDER)
+        except ValueError:
+            filters.append(("updatedAt", ">=", since))
+
+    rows = await get_repository().query(
+        "inspections",
+        filters,
+        order_by=CHANGES_ORDER,
+        limit=size + 1,
+        start_after=start_after,
+    )
+    has_more = len(rows) > size
+    rows = rows[:size]
+
+    items: List[Dict[str, Any]] = []
+    tombstones: List[Dict[str, Any]] = []
+    for r in rows:
+        if _status_of(r) == STATUS_CANCELLED:
+            tombstones.append({"id": r.get("id"), "status": STATUS_CANCELLED, "updatedAt": r.get("updatedAt")})
+        else:
+            items.append(_to_my_item(r))
+    next_since = _encode_cursor(rows[-1], CHANGES_ORDER) if rows else since
+    return {"items": items, "tombstones": tombstones, "nextSince": next_since, "hasMore": has_more}
+
+
+async def _find_record(user_name: str, date: str, hospital: str, equipment_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    if equipment_name is None:
+        field, key = "lookupPrefix", _lookup_key(user_name, date, hospital)
+    else:
+        field, key = "lookupKey", _lookup_key(user_name, date, hospital, equipment_name)
+
+    matches = await get_repository().query("inspections", [(field, "==", key)], limit=2)
+    if len(matches) > 1:
+        raise AmbiguousInspectionError("multiple inspections match; specify equipmentName")
+    return matches[0] if matches else None
+
+
+async def get_my_inspection_detail(user_name: str, date: str, hospital: str, equipment_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    r = await _find_record(user_name, date, hospital, equipment_name)
     if not r:
         return None
 
+    latest = dict(r.get("latestRevision") or {})
+    latest.setdefault("answers", r.get("results") or [])
+    if latest.get("signatureRef") and not latest.get("signatureBase64"):
+        latest["signatureBase64"] = (await load_signatures([latest["signatureRef"]])).get(latest["signatureRef"])
+
     return {
         "id": r.get("id"),
         "date": r.get("date"),
@@ -219,65 +708,200 @@ def get_my_inspection_detail(user_name: str, date: str, hospital: str, equipment
         "equipmentName": r.get("equipmentName"),
         "workType": r.get("workType"),
         "status": r.get("status"),
-        "latestRevision": r.get("latestRevision"),
+        "latestRevision": latest,
         "rejectReason": r.get("rejectReason") or "",
         "rejectedAt": r.get("rejectedAt"),
     }
 
 
-def add_revision(user_name: str, date: str, hospital: str, equipment_name: Optional[str], answers: List[Dict[str, Any]], signature_base64: Optional[str]) -> Optional[Dict[str, Any]]:
-    r = _find_record(user_name, date, hospital, equipment_name)
+async def add_revision(user_name: str, date: str, hospital: str, equipment_name: Optional[str], answers: List[Dict[str, Any]], signature_base64: Optional[str]) -> Optional[Dict[str, Any]]:
+    r = await _find_record(user_name, date, hospital, equipment_name)
     if not r:
         return None
 
-    rev = _make_revision(answers, signature_base64)
-    r.setdefault("revisions", []).append(rev)
-    r["latestRevision"] = rev
-    r["results"] = rev["answers"]
-    r["signatureBase64"] = signature_base64
-    r["resultCount"] = rev["resultCount"]
-    r["improveCount"] = rev["improveCount"]
-    r["updatedAt"] = datetime.datetime.now().isoformat()
-    r["status"] = STATUS_PENDING
-    _save_record(r)
+    _check_transition(r, STATUS_PENDING)
+
+    # 예전 문서는 revisions 배열을 하위 컬렉션으로 옮기고(같은 id로 덮어쓰므로 다시 해도 안전),
+    # 배열은 아래 상태 전이와 같은 조건부 update에서 지운다. 부모 전체를 덮어쓰지 않는다.
+    legacy = "revisions" in r
+    if legacy:
+        await _move_embedded_revisions(r)
+
+    signature_ref = await store_signature(signature_base64)
+    rev = {**_make_revision(answers, signature_ref), "seq": int(r.get("revisionCount") or 0) + 1}
+    changes = {
+        "revisionCount": rev["seq"],
+        "latestRevision": _revision_pointer(rev),
+        "results": rev["answers"],
+        "signatureRef": signature_ref,
+        "resultCount": rev["resultCount"],
+        "improveCount": rev["improveCount"],
+        "updatedAt": datetime.datetime.now().isoformat(),
+    }
+    if legacy:
+        changes["revisions"] = DELETE_FIELD
+    # revision 문서를 먼저 쓰고 부모를 갱신한다. 부모가 latestRevision으로 없는 문서를 가리키거나
+    # 재제출 이벤트를 받은 쪽이 아직 없는 revision을 조회하는 일이 없게 한다.
+    # 부모 갱신이 실패하면 같은 seq가 두 번 보이지 않도록 먼저 쓴 revision을 지운다.
+    await _append_revision(r["id"], rev)
+    try:
+        updated = await _transition(r, STATUS_PENDING, changes)
+    except InspectionConflictError:
+        await _delete_revision(r["id"], rev["id"])
+        raise
+    if updated is None:
+        await _delete_revision(r["id"], rev["id"])
+        return None
     return r
 
 
-def cancel_my_inspection(user_name: str, date: str, hospital: str, equipment_name: Optional[str] = None) -> bool:
-    r = _find_record(user_name, date, hospital, equipment_name)
+async def cancel_my_inspection(user_name: str, date: str, hospital: str, equipment_name: Optional[str] = None) -> bool:
+    r = await _find_record(user_name, date, hospital, equipment_name)
     if not r:
         return False
 
-    r["status"] = STATUS_CANCELLED
-    r["updatedAt"] = datetime.datetime.now().isoformat()
-    _save_record(r)
-    return True
-
-
-def approve_inspection(inspection_id: str, subadmin_name: Optional[str] = None, signature_base64: Optional[str] = None) -> Optional[Dict[str, Any]]:
-    for r in _all_records():
-        if str(r.get("id")) != str(inspection_id):
-            continue
-        r["status"] = STATUS_SUBMITTED
-        r["approvedBy"] = subadmin_name
-        r["approvedAt"] = datetime.datetime.now().isoformat()
-        if signature_base64:
-            r["subadminSignatureBase64"] = signature_base64
-        r["updatedAt"] = datetime.datetime.now().isoformat()
-        _save_record(r)
-        return r
-    return None
-
-
-def reject_inspection(inspection_id: str, subadmin_name: Optional[str] = None, reason: str = "") -> Optional[Dict[str, Any]]:
-    for r in _all_records():
-        if str(r.get("id")) != str(inspection_id):
-            continue
-        r["status"] = STATUS_REJECTED
-        r["rejectedBy"] = subadmin_name
-        r["rejectedAt"] = datetime.datetime.now().isoformat()
-        r["rejectReason"] = reason
-        r["updatedAt"] = datetime.datetime.now().isoformat()
-        _save_record(r)
-        return r
-    return None
+    return await _transition(r, STATUS_CANCELLED, {"updatedAt": datetime.datetime.now().isoformat()}) is not None
+
+
+async def approve_inspection(inspection_id: str, subadmin_name: Optional[str] = None, signature_base64: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    r = await _get_record(inspection_id)
+    if not r:
+        return None
+
+    now = datetime.datetime.now().isoformat()
+    changes = {"approvedBy": subadmin_name, "approvedAt": now, "updatedAt": now}
+    if signature_base64:
+        changes["subadminSignatureRef"] = await store_signature(signature_base64)
+    return await _transition(r, STATUS_SUBMITTED, changes)
+
+
+async def reject_inspection(inspection_id: str, subadmin_name: Optional[str] = None, reason: str = "") -> Optional[Dict[str, Any]]:
+    r = await _get_record(inspection_id)
+    if not r:
+        return None
+
+    now = datetime.datetime.now().isoformat()
+    return await _transition(
+        r,
+        STATUS_REJECTED,
+        {"rejectedBy": subadmin_name, "rejectedAt": now, "rejectReason": reason, "updatedAt": now},
+    )
+
+
+async def _transition_many(
+    inspection_ids: List[str],
+    target: str,
+    changes: Dict[str, Any],
+    categories: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """여러 점검을 target 상태로 바꾸고 id별 결과를 입력 순서대로 반환한다.
+
+    문서는 get_many 한 번으로 읽고 권한/상태 전이는 메모리에서 확인한 뒤, 통과한 건만
+    update_many(트랜잭션, 대기 큐 쓰기 포함 최대 BATCH_WRITE_LIMIT건 단위)로 쓴다. categories가 있으면 그 작업 종류만 처리한다.
+    결과 status: ok / not_found / forbidden / conflict
+    """
+    ids = list(dict.fromkeys(str(i or "").strip() for i in inspection_ids if str(i or "").strip()))
+    allowed = {str(c).strip() for c in (categories or []) if str(c).strip()}
+    records = await get_repository().get_many("inspections", ids)
+
+    outcomes: Dict[str, Dict[str, Any]] = {}
+    updates: Dict[str, Dict[str, Any]] = {}
+    expected: Dict[str, Dict[str, Any]] = {}
+    for rec_id in ids:
+        r = records.get(rec_id)
+        if not r:
+            outcomes[rec_id] = {"status": "not_found", "error": "inspection not found"}
+        elif allowed and str(r.get("workType") or "") not in allowed:
+            outcomes[rec_id] = {"status": "forbidden", "error": "subadmin cannot handle this category"}
+        elif target not in ALLOWED_TRANSITIONS.get(_status_of(r), set()):
+            outcomes[rec_id] = {"status": "conflict", "error": f"cannot change status from {_status_of(r)} to {target}"}
+        else:
+            updates[rec_id] = {**changes, "status": target}
+            expected[rec_id] = {"status": r.get("status"), "updatedAt": r.get("updatedAt")}
+
+    repo = get_repository()
+    pending = list(updates)
+    # 점검 1건마다 대기 큐 쓰기 1건이 같은 트랜잭션에 들어간다.
+    per_transaction = BATCH_WRITE_LIMIT // 2
+    for i in range(0, len(pending), per_transaction):
+        chunk = pending[i:i + per_transaction]
+        updated = {rec_id: _with_changes(records[rec_id], updates[rec_id]) for rec_id in chunk}
+        try:
+            skipped = await repo.update_many(
+                "inspections",
+                {rec_id: updates[rec_id] for rec_id in chunk},
+                expected={rec_id: expected[rec_id] for rec_id in chunk},
+                side_writes={rec_id: [_queue_write(updated[rec_id])] for rec_id in chunk},
+            )
+        except ConflictError:
+            skipped = {rec_id: ConflictError(rec_id) for rec_id in chunk}
+        for rec_id in chunk:
+            exc = skipped.get(rec_id)
+            if exc is None:
+                outcomes[rec_id] = {"status": "ok"}
+                publish_inspection_change(TRANSITION_EVENTS[target], updated[rec_id])
+            elif isinstance(exc, KeyError):
+                outcomes[rec_id] = {"status": "not_found", "error": "inspection not found"}
+            else:
+                outcomes[rec_id] = {"status": "conflict", "error": "inspection was changed by another request; reload and try again"}
+
+    return [{"id": rec_id, **outcomes[rec_id]} for rec_id in ids]
+
+
+async def approve_inspections(
+    inspection_ids: List[str],
+    subadmin_name: Optional[str] = None,
+    signature_base64: Optional[str] = None,
+    categories: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """여러 점검을 한 번에 승인한다. 서명은 한 번만 저장해 모든 건이 같은 ref를 가리킨다."""
+    now = datetime.datetime.now().isoformat()
+    changes = {"approvedBy": subadmin_name, "approvedAt": now, "updatedAt": now}
+    if signature_base64:
+        changes["subadminSignatureRef"] = await store_signature(signature_base64)
+    return await _transition_many(inspection_ids, STATUS_SUBMITTED, changes, categories)
+
+
+async def reject_inspections(
+    inspection_ids: List[str],
+    subadmin_name: Optional[str] = None,
+    reason: str = "",
+    categories: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    now = datetime.datetime.now().isoformat()
+    changes = {"rejectedBy": subadmin_name, "rejectedAt": now, "rejectReason": reason, "updatedAt": now}
+    return await _transition_many(inspection_ids, STATUS_REJECTED, changes, categories)
+
+
+async def list_pending_queue(
+    requester_role: Optional[str] = None,
+    requester_categories: Optional[List[str]] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """승인 대기 건을 오래된 순(createdAt)으로 한 페이지 반환한다. 잘못된 cursor는 ValueError."""
+    size = max(1, min(int(limit), MAX_PAGE_SIZE))
+    rows = await get_repository().query(
+        QUEUE,
+        _category_filters(requester_role, requester_categories),
+        order_by=QUEUE_ORDER,
+        limit=size + 1,
+        start_after=_decode_cursor(cursor, QUEUE_ORDER),
+    )
+    next_cursor = _encode_cursor(rows[size - 1], QUEUE_ORDER) if len(rows) > size else None
+    return {"items": rows[:size], "nextCursor": next_cursor}
+
+
+async def rebuild_pending_queue() -> Tuple[int, int]:
+    """PENDING 점검 기준으로 대기 큐를 다시 만든다. (추가/갱신 수, 삭제 수)를 반환한다."""
+    repo = get_repository()
+    pending = await repo.query("inspections", [("status", "==", STATUS_PENDING)], select=QUEUE_FIELDS)
+    writes = [(QUEUE, r["id"], _queue_entry(r)) for r in pending]
+    for i in range(0, len(writes), BATCH_WRITE_LIMIT):
+        await repo.set_many(writes[i:i + BATCH_WRITE_LIMIT])
+
+    pending_ids = {r["id"] for r in pending}
+    stale = [q["id"] for q in await repo.query(QUEUE, select=[]) if q["id"] not in pending_ids]
+    for i in range(0, len(stale), BATCH_WRITE_LIMIT):
+        await repo.delete_many(QUEUE, stale[i:i + BATCH_WRITE_LIMIT])
+    return len(writes), len(stale)
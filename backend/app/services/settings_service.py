@@ -1,7 +1,13 @@
+import copy
 import datetime
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
-from app.storage.firestore_client import get_firestore_client
+from app.core.cache import TTLCache
+from app.core.config import SETTINGS_CACHE_TTL_SECONDS
+from app.storage.repository import get_repository
+
+# settings 문서 키("hospitals", "work_types") -> 응답 dict
+_cache = TTLCache(SETTINGS_CACHE_TTL_SECONDS)
 
 
 def _clean_hospitals(hospitals: List[str]) -> List[str]:
@@ -13,15 +19,20 @@ def _clean_hospitals(hospitals: List[str]) -> List[str]:
     return cleaned
 
 
-def get_hospitals() -> Dict[str, object]:
-    client = get_firestore_client()
-    doc = client.collection("settings").document("hospitals").get()
-    if not doc.exists:
+async def get_hospitals() -> Dict[str, object]:
+    return copy.deepcopy(await _cache.get_or_load("hospitals", _load_hospitals))
+
+
+async def _load_hospitals() -> Dict[str, object]:
+    return await _hospitals_from(await get_repository().get("settings", "hospitals"))
+
+
+async def _hospitals_from(data: Optional[Dict[str, Any]]) -> Dict[str, object]:
+    if data is None:
         initial = {"hospitals": [], "updatedAt": datetime.datetime.now().isoformat()}
-        client.collection("settings").document("hospitals").set(initial, merge=True)
+        await get_repository().set("settings", "hospitals", initial, merge=True)
         return initial
 
-    data = doc.to_dict() or {}
     hospitals = _clean_hospitals(data.get("hospitals") or [])
     return {
         "hospitals": hospitals,
@@ -29,15 +40,15 @@ def get_hospitals() -> Dict[str, object]:
     }
 
 
-def update_hospitals(admin_name: str, hospitals: List[str]) -> Dict[str, object]:
+async def update_hospitals(admin_name: str, hospitals: List[str]) -> Dict[str, object]:
     cleaned = _clean_hospitals(hospitals)
     payload = {
         "hospitals": cleaned,
         "updatedBy": admin_name,
         "updatedAt": datetime.datetime.now().isoformat(),
     }
-    client = get_firestore_client()
-    client.collection("settings").document("hospitals").set(payload, merge=True)
+    await get_repository().set("settings", "hospitals", payload, merge=True)
+    _cache.invalidate("hospitals")
     return {
         "status": "ok",
         "adminName": admin_name,
@@ -56,19 +67,23 @@ def _clean_work_types(work_types: List[str]) -> List[str]:
     return cleaned
 
 
-def get_work_types() -> Dict[str, object]:
-    client = get_firestore_client()
-    ref = client.collection("settings").document("work_types")
-    doc = ref.get()
-    if not doc.exists:
+async def get_work_types() -> Dict[str, object]:
+    return copy.deepcopy(await _cache.get_or_load("work_types", _load_work_types))
+
+
+async def _load_work_types() -> Dict[str, object]:
+    return await _work_types_from(await get_repository().get("settings", "work_types"))
+
+
+async def _work_types_from(data: Optional[Dict[str, Any]]) -> Dict[str, object]:
+    if data is None:
         initial = {
             "workTypes": ["X-ray 설치작업", "MR 설치작업", "CT 작업", "정기 유지보수"],
             "updatedAt": datetime.datetime.now().isoformat(),
         }
-        ref.set(initial, merge=True)
+        await get_repository().set("settings", "work_types", initial, merge=True)
         return initial
 
-    data = doc.to_dict() or {}
     work_types = _clean_work_types(data.get("workTypes") or [])
     return {
         "workTypes": work_types,
@@ -76,18 +91,33 @@ def get_work_types() -> Dict[str, object]:
     }
 
 
-def update_work_types(admin_name: str, work_types: List[str]) -> Dict[str, object]:
+async def update_work_types(admin_name: str, work_types: List[str]) -> Dict[str, object]:
     cleaned = _clean_work_types(work_types)
     payload = {
         "workTypes": cleaned,
         "updatedBy": admin_name,
         "updatedAt": datetime.datetime.now().isoformat(),
     }
-    client = get_firestore_client()
-    client.collection("settings").document("work_types").set(payload, merge=True)
+    await get_repository().set("settings", "work_types", payload, merge=True)
+    _cache.invalidate("work_types")
     return {
         "status": "ok",
         "adminName": admin_name,
         "workTypes": cleaned,
         "updatedAt": payload["updatedAt"],
     }
+
+
+async def get_settings() -> Dict[str, Dict[str, object]]:
+    """{"hospitals": ..., "work_types": ...}를 함께 반환한다. 캐시에 없는 문서만 한 번의 get_many로 읽는다."""
+    converters = {"hospitals": _hospitals_from, "work_types": _work_types_from}
+    missing = object()
+    out = {key: _cache.get(key, missing) for key in converters}
+    todo = [key for key, value in out.items() if value is missing]
+    if todo:
+        generation = _cache.generation
+        docs = await get_repository().get_many("settings", todo)
+        for key in todo:
+            out[key] = await converters[key](docs.get(key))
+            _cache.set(key, out[key], generation)
+    return copy.deepcopy(out)
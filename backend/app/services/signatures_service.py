@@ -0,0 +1,113 @@
+"""서명 이미지 저장소 (content-addressed).
+
+서명 base64는 `signatures/{sha256}` 문서에 한 번만 저장하고, 점검 문서에는 해시(ref)만 남긴다.
+내용이 같으면 키도 같으므로 같은 서명(예: 같은 서브관리자의 승인 서명)은 중복 저장되지 않고,
+문서가 바뀌지 않으므로 프로세스 메모리에 캐시해도 안전하다.
+"""
+
+import datetime
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+from app.storage.repository import BATCH_WRITE_LIMIT, get_repository
+
+COLLECTION = "signatures"
+
+_KNOWN_REFS_MAX = 10000
+_BLOB_CACHE_MAX = 256
+
+_lock = threading.Lock()
+_known_refs: "OrderedDict[str, None]" = OrderedDict()   # 저장이 확인된 ref
+_blob_cache: "OrderedDict[str, str]" = OrderedDict()    # ref -> base64
+
+
+def signature_ref(signature_base64: Optional[str]) -> Optional[str]:
+    raw = str(signature_base64 or "").strip()
+    if not raw:
+        return None
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _remember(ref: str, data: Optional[str] = None) -> None:
+    with _lock:
+        _known_refs[ref] = None
+        _known_refs.move_to_end(ref)
+        while len(_known_refs) > _KNOWN_REFS_MAX:
+            _known_refs.popitem(last=False)
+        if data is not None:
+            _blob_cache[ref] = data
+            _blob_cache.move_to_end(ref)
+            while len(_blob_cache) > _BLOB_CACHE_MAX:
+                _blob_cache.popitem(last=False)
+
+
+async def store_signature(signature_base64: Optional[str]) -> Optional[str]:
+    """서명을 저장하고 ref를 반환한다.
+
+    ref가 내용의 해시이므로 존재 확인 없이 그대로 set 해도 같은 문서가 된다.
+    이 프로세스에서 이미 저장한 ref만 쓰기를 생략한다.
+    """
+    ref = signature_ref(signature_base64)
+    if not ref:
+        return None
+
+    with _lock:
+        known = ref in _known_refs
+    if known:
+        return ref
+
+    data = str(signature_base64).strip()
+    await get_repository().set(
+        COLLECTION,
+        ref,
+        {"data": data, "size": len(data), "createdAt": datetime.datetime.now().isoformat()},
+    )
+    _remember(ref, data)
+    return ref
+
+
+async def store_signatures(signatures: Iterable[Optional[str]]) -> List[Optional[str]]:
+    """여러 서명을 저장하고 입력 순서대로 ref를 반환한다. 처음 보는 ref만 batch로 한 번에 쓴다."""
+    values = [str(v or "").strip() for v in signatures]
+    refs = [signature_ref(v) for v in values]
+
+    pending: Dict[str, str] = {}
+    with _lock:
+        for ref, data in zip(refs, values):
+            if ref and ref not in _known_refs:
+                pending[ref] = data
+    if not pending:
+        return refs
+
+    repo = get_repository()
+    now = datetime.datetime.now().isoformat()
+    writes = [(COLLECTION, ref, {"data": data, "size": len(data), "createdAt": now}) for ref, data in pending.items()]
+    for i in range(0, len(writes), BATCH_WRITE_LIMIT):
+        await repo.set_many(writes[i:i + BATCH_WRITE_LIMIT])
+    for ref, data in pending.items():
+        _remember(ref, data)
+    return refs
+
+
+async def load_signatures(refs: Iterable[Optional[str]]) -> Dict[str, str]:
+    """ref 목록의 서명을 {ref: base64}로 반환한다. 캐시에 없는 것만 한 번에 조회한다."""
+    wanted = list(dict.fromkeys(r for r in refs if r))
+    out: Dict[str, str] = {}
+    missing = []
+    with _lock:
+        for ref in wanted:
+            if ref in _blob_cache:
+                out[ref] = _blob_cache[ref]
+                _blob_cache.move_to_end(ref)
+            else:
+                missing.append(ref)
+
+    if missing:
+        for ref, doc in (await get_repository().get_many(COLLECTION, missing)).items():
+            data = doc.get("data")
+            if data:
+                out[ref] = data
+                _remember(ref, data)
+    return out
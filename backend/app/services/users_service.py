@@ -1,7 +1,9 @@
 import unicodedata
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from app.storage.firestore_client import get_firestore_client
+from app.core.cache import TTLCache
+from app.core.config import LOGIN_CACHE_TTL_SECONDS, SUBADMIN_CACHE_TTL_SECONDS, USERS_LEGACY_LOOKUP
+from app.storage.repository import decode_cursor, encode_cursor, get_repository
 
 
 USER_ROLE_MASTER_ADMIN = "MASTER_ADMIN"
@@ -10,6 +12,15 @@ USER_ROLE_WORKER = "WORKER"
 
 VALID_ROLES = {USER_ROLE_MASTER_ADMIN, USER_ROLE_SUB_ADMIN, USER_ROLE_WORKER}
 
+# (nameKey, phoneLast4) -> 로그인 결과. 역할/카테고리가 바뀌는 쓰기(서브어드민 관리)에서 비운다.
+_login_cache = TTLCache(LOGIN_CACHE_TTL_SECONDS, max_entries=4096)
+# 서브어드민 목록(role 인덱스 조회 결과). 서브어드민 생성/수정/삭제에서 비운다.
+_subadmin_cache = TTLCache(SUBADMIN_CACHE_TTL_SECONDS, max_entries=1)
+
+# 사용자 목록 페이지 정렬 (Firestore 복합 인덱스: role + name)
+USER_ORDER = [("name", "asc")]
+MAX_USER_PAGE_SIZE = 500
+
 
 def _build_flags(role: str) -> Dict[str, bool]:
     return {
@@ -35,6 +46,10 @@ def _normalize_phone_last4(phone_last4: str) -> str:
     return digits
 
 
+def _copy_user(user: Dict[str, Any]) -> Dict[str, Any]:
+    return {**user, "categories": list(user.get("categories") or [])}
+
+
 def _normalize_categories(categories: Optional[List[str]]) -> List[str]:
     out: List[str] = []
     for c in categories or []:
@@ -44,10 +59,6 @@ def _normalize_categories(categories: Optional[List[str]]) -> List[str]:
     return out
 
 
-def _get_client() -> Any:
-    return get_firestore_client()
-
-
 def _normalize_user_payload(data: Dict[str, Any], user_id: str) -> Dict[str, Any]:
     role = str(data.get("role") or "").strip().upper()
     if role not in VALID_ROLES:
@@ -66,14 +77,32 @@ def _normalize_user_payload(data: Dict[str, Any], user_id: str) -> Dict[str, Any
     }
 
 
-def list_users() -> List[Dict[str, Any]]:
-    client = _get_client()
-    docs = client.collection("users").stream()
-    users = []
-    for doc in docs:
-        data = doc.to_dict() or {}
-        users.append(_normalize_user_payload(data, doc.id))
-    return users
+def _role_filters(role: Optional[str]) -> List[Tuple[str, str, Any]]:
+    cleaned = str(role or "").strip().upper()
+    if not cleaned:
+        return []
+    if cleaned not in VALID_ROLES:
+        raise ValueError(f"invalid role: {role}")
+    return [("role", "==", cleaned)]
+
+
+async def list_users(role: Optional[str] = None) -> List[Dict[str, Any]]:
+    docs = await get_repository().query("users", _role_filters(role))
+    return [_normalize_user_payload(doc, doc["id"]) for doc in docs]
+
+
+async def list_users_page(role: Optional[str] = None, limit: int = 100, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """이름순으로 한 페이지와 다음 페이지 커서를 반환한다. 잘못된 cursor/role은 ValueError."""
+    size = max(1, min(int(limit), MAX_USER_PAGE_SIZE))
+    docs = await get_repository().query(
+        "users",
+        _role_filters(role),
+        order_by=USER_ORDER,
+        limit=size + 1,
+        start_after=decode_cursor(cursor, USER_ORDER),
+    )
+    next_cursor = encode_cursor(docs[size - 1], USER_ORDER) if len(docs) > size else None
+    return {"users": [_normalize_user_payload(doc, doc["id"]) for doc in docs[:size]], "nextCursor": next_cursor}
 
 
 def _build_firestore_payload(user: Dict[str, Any]) -> Dict[str, Any]:
@@ -89,42 +118,42 @@ def _build_firestore_payload(user: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _find_existing_user(users_col: Any, cleaned_name: str, cleaned_phone_last4: str):
+async def _find_existing_user(cleaned_name: str, cleaned_phone_last4: str) -> Optional[Dict[str, Any]]:
+    repo = get_repository()
     key = _name_key(cleaned_name)
 
     # 1) 신규 로직: nameKey + phoneLast4
-    query = (
-        users_col.where("nameKey", "==", key)
-        .where("phoneLast4", "==", cleaned_phone_last4)
-        .limit(1)
-        .stream()
-    )
-    doc = next(query, None)
-    if doc:
-        return doc
+    docs = await repo.query("users", [("nameKey", "==", key), ("phoneLast4", "==", cleaned_phone_last4)], limit=1)
+    if docs:
+        return docs[0]
 
     # 2) 구버전 데이터 호환: phoneLast4로 조회 후 Python에서 이름 키 비교
-    legacy_docs = users_col.where("phoneLast4", "==", cleaned_phone_last4).stream()
-    for legacy in legacy_docs:
-        data = legacy.to_dict() or {}
-        if _name_key(data.get("name") or "") == key:
-            users_col.document(legacy.id).set({"nameKey": key}, merge=True)
+    #    (nameKey는 로그인 시 채워지며, backfill_user_name_keys.py 실행 후에는 꺼도 된다)
+    if not USERS_LEGACY_LOOKUP:
+        return None
+    for legacy in await repo.query("users", [("phoneLast4", "==", cleaned_phone_last4)]):
+        if _name_key(legacy.get("name") or "") == key:
             return legacy
 
     return None
 
 
-def login_user(name: str, phone_last4: str) -> Dict[str, Any]:
+async def login_user(name: str, phone_last4: str) -> Dict[str, Any]:
     cleaned_name = _normalize_name(name)
     cleaned_phone_last4 = _normalize_phone_last4(phone_last4)
 
     if not cleaned_name:
         raise ValueError("name is required")
 
-    client = _get_client()
-    users_col = client.collection("users")
+    cache_key = (_name_key(cleaned_name), cleaned_phone_last4)
+    cached = _login_cache.get(cache_key)
+    if cached is not None:
+        return _copy_user(cached)
 
-    user_doc = _find_existing_user(users_col, cleaned_name, cleaned_phone_last4)
+    repo = get_repository()
+    # 조회 중에 서브어드민 관리로 캐시가 비워졌으면 읽은 결과를 캐시에 넣지 않는다.
+    generation = _login_cache.generation
+    user_doc = await _find_existing_user(cleaned_name, cleaned_phone_last4)
 
     if not user_doc:
         created = _normalize_user_payload(
@@ -136,22 +165,33 @@ def login_user(name: str, phone_last4: str) -> Dict[str, Any]:
             },
             "",
         )
-        ref = users_col.document()
-        created["id"] = ref.id
-        ref.set(_build_firestore_payload(created), merge=True)
-        return created
+        created["id"] = repo.new_id("users")
+        await repo.set("users", created["id"], _build_firestore_payload(created), merge=True)
+        _login_cache.set(cache_key, created, generation)
+        return _copy_user(created)
+
+    normalized = _normalize_user_payload(user_doc, user_doc["id"])
+    # 저장된 값과 다른 필드만 쓴다(예전 문서의 nameKey/플래그 보정). 대부분의 로그인은 쓰기 없이 끝난다.
+    payload = _build_firestore_payload(normalized)
+    changed = {field: value for field, value in payload.items() if user_doc.get(field) != value}
+    if changed:
+        await repo.set("users", user_doc["id"], changed, merge=True)
+    _login_cache.set(cache_key, normalized, generation)
+    return _copy_user(normalized)
+
 
-    data = user_doc.to_dict() or {}
-    normalized = _normalize_user_payload(data, user_doc.id)
-    users_col.document(user_doc.id).set(_build_firestore_payload(normalized), merge=True)
-    return normalized
+async def list_subadmins() -> List[Dict[str, Any]]:
+    # role 인덱스로 서브어드민만 읽는다(작업자 수와 무관).
+    roster = await _subadmin_cache.get_or_load("roster", lambda: list_users(USER_ROLE_SUB_ADMIN))
+    return [_copy_user(u) for u in roster]
 
 
-def list_subadmins() -> List[Dict[str, Any]]:
-    return [u for u in list_users() if u.get("role") == USER_ROLE_SUB_ADMIN]
+def _invalidate_user_caches() -> None:
+    _login_cache.invalidate()
+    _subadmin_cache.invalidate()
 
 
-def create_subadmin(name: str, phone_last4: str, categories: Optional[List[str]]) -> Dict[str, Any]:
+async def create_subadmin(name: str, phone_last4: str, categories: Optional[List[str]]) -> Dict[str, Any]:
     cleaned_name = _normalize_name(name)
     cleaned_phone_last4 = _normalize_phone_last4(phone_last4)
     cleaned_categories = _normalize_categories(categories)
@@ -169,29 +209,26 @@ def create_subadmin(name: str, phone_last4: str, categories: Optional[List[str]]
         "",
     )
 
-    client = _get_client()
-    users_col = client.collection("users")
-    existing = _find_existing_user(users_col, cleaned_name, cleaned_phone_last4)
+    existing = await _find_existing_user(cleaned_name, cleaned_phone_last4)
     if existing:
         raise ValueError("subadmin already exists")
 
-    ref = users_col.document()
-    new_user["id"] = ref.id
-    ref.set(_build_firestore_payload(new_user))
+    repo = get_repository()
+    new_user["id"] = repo.new_id("users")
+    await repo.set("users", new_user["id"], _build_firestore_payload(new_user))
+    _invalidate_user_caches()
     return new_user
 
 
-def update_subadmin(subadmin_id: str, name: str, phone_last4: str, categories: Optional[List[str]]) -> Dict[str, Any]:
+async def update_subadmin(subadmin_id: str, name: str, phone_last4: str, categories: Optional[List[str]]) -> Dict[str, Any]:
     cleaned_name = _normalize_name(name)
     cleaned_phone_last4 = _normalize_phone_last4(phone_last4)
     cleaned_categories = _normalize_categories(categories)
     if not cleaned_name:
         raise ValueError("name is required")
 
-    client = _get_client()
-    ref = client.collection("users").document(subadmin_id)
-    snap = ref.get()
-    if not snap.exists:
+    repo = get_repository()
+    if not await repo.get("users", subadmin_id):
         raise ValueError("subadmin not found")
 
     updated = _normalize_user_payload(
@@ -203,15 +240,15 @@ def update_subadmin(subadmin_id: str, name: str, phone_last4: str, categories: O
         },
         subadmin_id,
     )
-    ref.set(_build_firestore_payload(updated), merge=True)
+    await repo.set("users", subadmin_id, _build_firestore_payload(updated), merge=True)
+    _invalidate_user_caches()
     return updated
 
 
-def delete_subadmin(subadmin_id: str) -> bool:
-    client = _get_client()
-    ref = client.collection("users").document(subadmin_id)
-    snap = ref.get()
-    if not snap.exists:
+async def delete_subadmin(subadmin_id: str) -> bool:
+    repo = get_repository()
+    if not await repo.get("users", subadmin_id):
         return False
-    ref.delete()
+    await repo.delete("users", subadmin_id)
+    _invalidate_user_caches()
     return True
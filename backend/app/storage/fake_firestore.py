@@ -0,0 +1,503 @@
+"""In-process Firestore 대체 클라이언트 (테스트/벤치마크용).
+
+서비스 코드가 실제로 사용하는 `firestore.AsyncClient` 기능만 흉내 낸다.
+네트워크/인증 없이 동작하며, 모든 읽기/쓰기 횟수를 `stats`에 기록하므로
+Firestore 과금 단위(문서 읽기/쓰기)와 왕복 횟수를 오프라인에서 비교할 수 있다.
+
+    from app.storage.fake_firestore import FakeFirestoreClient
+    from app.storage.firestore_client import set_firestore_client
+
+    fake = FakeFirestoreClient()
+    set_firestore_client(fake)
+    ...  # await 서비스 함수
+    print(fake.stats)
+"""
+
+import copy
+import datetime
+import functools
+import json
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from google.api_core import exceptions
+from google.cloud import firestore
+
+from app.storage.repository import BATCH_WRITE_LIMIT, DELETE_FIELD, merge_document, set_field
+
+
+@dataclass
+class OperationStats:
+    reads: int = 0
+    writes: int = 0
+    deletes: int = 0
+    round_trips: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+
+    def reset(self) -> None:
+        self.reads = self.writes = self.deletes = self.round_trips = 0
+        self.bytes_read = self.bytes_written = 0
+
+
+def _payload_size(data: Dict[str, Any]) -> int:
+    return len(json.dumps(data, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+def _get_field(data: Dict[str, Any], field_path: str) -> Tuple[bool, Any]:
+    value: Any = data
+    for part in field_path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return False, None
+        value = value[part]
+    return True, value
+
+
+def _compare(left: Any, op: str, right: Any) -> bool:
+    try:
+        if op == "==":
+            return left == right
+        if op == "!=":
+            return left != right
+        if op == "<":
+            return left < right
+        if op == "<=":
+            return left <= right
+        if op == ">":
+            return left > right
+        if op == ">=":
+            return left >= right
+        if op == "in":
+            return left in right
+        if op == "not-in":
+            return left not in right
+        if op == "array_contains":
+            return isinstance(left, list) and right in left
+        if op == "array_contains_any":
+            return isinstance(left, list) and any(v in left for v in right)
+    except TypeError:
+        # Firestore는 타입이 다른 값끼리는 범위 비교에서 매칭하지 않는다.
+        return False
+    raise ValueError(f"unsupported filter op: {op}")
+
+
+def _cmp(left: Any, right: Any) -> int:
+    if left == right:
+        return 0
+    try:
+        return -1 if left < right else 1
+    except TypeError:
+        return -1 if str(type(left)) < str(type(right)) else 1
+
+
+async def _iterate(items: List[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+class FakeDocumentSnapshot:
+    def __init__(self, reference: "FakeDocumentReference", data: Optional[Dict[str, Any]], update_time: Optional[datetime.datetime]):
+        self.reference = reference
+        self.id = reference.id
+        self._data = data
+        self.update_time = update_time
+
+    @property
+    def exists(self) -> bool:
+        return self._data is not None
+
+    def to_dict(self) -> Optional[Dict[str, Any]]:
+        return copy.deepcopy(self._data) if self._data is not None else None
+
+    def get(self, field_path: str) -> Any:
+        found, value = _get_field(self._data or {}, field_path)
+        if not found:
+            raise KeyError(field_path)
+        return copy.deepcopy(value)
+
+
+class FakeDocumentReference:
+    def __init__(self, client: "FakeFirestoreClient", parent_path: str, doc_id: str):
+        self._client = client
+        self.id = doc_id
+        self.path = f"{parent_path}/{doc_id}"
+        self._parent_path = parent_path
+
+    def collection(self, name: str) -> "FakeCollectionReference":
+        return FakeCollectionReference(self._client, f"{self.path}/{name}")
+
+    async def get(self, field_paths: Optional[List[str]] = None, transaction: Optional["FakeTransaction"] = None, **_: Any) -> FakeDocumentSnapshot:
+        if transaction is not None:
+            return await transaction.get(self)
+        return self._get(field_paths)
+
+    def _get(self, field_paths: Optional[List[str]] = None) -> FakeDocumentSnapshot:
+        with self._client._lock:
+            self._client.stats.reads += 1
+            self._client.stats.round_trips += 1
+            return self._client._snapshot(self, field_paths)
+
+    async def set(self, document_data: Dict[str, Any], merge: bool = False) -> None:
+        with self._client._lock:
+            self._client.stats.round_trips += 1
+            self._client._apply_set(self, document_data, merge)
+
+    async def update(self, field_updates: Dict[str, Any], **_: Any) -> None:
+        with self._client._lock:
+            self._client.stats.round_trips += 1
+            self._client._apply_update(self, field_updates)
+
+    async def delete(self, **_: Any) -> None:
+        with self._client._lock:
+            self._client.stats.round_trips += 1
+            self._client._apply_delete(self)
+
+
+class FakeQuery:
+    def __init__(
+        self,
+        client: "FakeFirestoreClient",
+        path: str,
+        filters: Tuple[Tuple[str, str, Any], ...] = (),
+        orders: Tuple[Tuple[str, str], ...] = (),
+        limit: Optional[int] = None,
+        start_after: Any = None,
+        projection: Optional[Tuple[str, ...]] = None,
+    ):
+        self._client = client
+        self._path = path
+        self._filters = filters
+        self._orders = orders
+        self._limit = limit
+        self._start_after = start_after
+        self._projection = projection
+
+    def _copy(self, **changes: Any) -> "FakeQuery":
+        params = {
+            "filters": self._filters,
+            "orders": self._orders,
+            "limit": self._limit,
+            "start_after": self._start_after,
+            "projection": self._projection,
+        }
+        params.update(changes)
+        return FakeQuery(self._client, self._path, **params)
+
+    def where(self, field_path: Optional[str] = None, op_string: Optional[str] = None, value: Any = None, *, filter: Any = None) -> "FakeQuery":
+        if filter is not None:
+            field_path, op_string, value = filter.field_path, filter.op_string, filter.value
+        return self._copy(filters=self._filters + ((field_path, op_string, value),))
+
+    def select(self, field_paths: List[str]) -> "FakeQuery":
+        return self._copy(projection=tuple(field_paths))
+
+    def order_by(self, field_path: str, direction: str = "ASCENDING") -> "FakeQuery":
+        return self._copy(orders=self._orders + ((field_path, direction),))
+
+    def limit(self, count: int) -> "FakeQuery":
+        return self._copy(limit=count)
+
+    def start_after(self, document_fields_or_snapshot: Any) -> "FakeQuery":
+        return self._copy(start_after=document_fields_or_snapshot)
+
+    def _effective_orders(self) -> List[Tuple[str, str]]:
+        orders = list(self._orders)
+        if orders and orders[-1][0] != "__name__":
+            orders.append(("__name__", orders[-1][1]))
+        return orders
+
+    def _order_values(self, doc_id: str, data: Dict[str, Any], orders: List[Tuple[str, str]]) -> Optional[List[Any]]:
+        values = []
+        for field_path, _ in orders:
+            if field_path == "__name__":
+                values.append(doc_id)
+                continue
+            found, value = _get_field(data, field_path)
+            if not found:
+                # Firestore는 order_by 필드가 없는 문서를 결과에서 제외한다.
+                return None
+            values.append(value)
+        return values
+
+    def _cursor_values(self, orders: List[Tuple[str, str]]) -> List[Any]:
+        cursor = self._start_after
+        if isinstance(cursor, FakeDocumentSnapshot):
+            cursor = {**(cursor.to_dict() or {}), "__name__": cursor.id}
+        if isinstance(cursor, dict):
+            values = []
+            for field_path, _ in orders:
+                if field_path not in cursor:
+                    break
+                values.append(cursor[field_path])
+            cursor = values
+        out = []
+        for (field_path, _), value in zip(orders, cursor):
+            if field_path == "__name__":
+                value = getattr(value, "id", None) or str(value).rsplit("/", 1)[-1]
+            out.append(value)
+        return out
+
+    @staticmethod
+    def _compare_values(left: List[Any], right: List[Any], orders: List[Tuple[str, str]]) -> int:
+        for (_, direction), a, b in zip(orders, left, right):
+            result = _cmp(a, b)
+            if result:
+                return -result if direction == "DESCENDING" else result
+        return 0
+
+    def _matches(self, data: Dict[str, Any]) -> bool:
+        for field_path, op, value in self._filters:
+            found, current = _get_field(data, field_path)
+            if not found or not _compare(current, op, value):
+                return False
+        return True
+
+    async def stream(self, **_: Any) -> AsyncIterator[FakeDocumentSnapshot]:
+        for snap in self._run():
+            yield snap
+
+    async def get(self, **_: Any) -> List[FakeDocumentSnapshot]:
+        return self._run()
+
+    def _run(self) -> List[FakeDocumentSnapshot]:
+        with self._client._lock:
+            docs = self._client._collection_docs(self._path)
+            orders = self._effective_orders() or [("__name__", "ASCENDING")]
+            rows = []
+            for doc_id, data in docs.items():
+                if not self._matches(data):
+                    continue
+                values = self._order_values(doc_id, data, orders)
+                if values is not None:
+                    rows.append((values, doc_id))
+
+            rows.sort(key=functools.cmp_to_key(lambda a, b: self._compare_values(a[0], b[0], orders)))
+            if self._start_after is not None:
+                cursor = self._cursor_values(orders)
+                rows = [r for r in rows if self._compare_values(r[0][:len(cursor)], cursor, orders) > 0]
+            if self._limit is not None:
+                rows = rows[:self._limit]
+
+            out = [
+                self._client._snapshot(FakeDocumentReference(self._client, self._path, doc_id), self._projection)
+                for _, doc_id in rows
+            ]
+            # 결과가 0건이어도 쿼리 1회는 문서 1건 읽기로 과금된다.
+            self._client.stats.reads += max(1, len(out))
+            self._client.stats.round_trips += 1
+        return out
+
+
+class FakeCollectionReference(FakeQuery):
+    def __init__(self, client: "FakeFirestoreClient", path: str):
+        super().__init__(client, path)
+        self.id = path.rsplit("/", 1)[-1]
+
+    def document(self, document_id: Optional[str] = None) -> FakeDocumentReference:
+        return FakeDocumentReference(self._client, self._path, document_id or uuid.uuid4().hex[:20])
+
+
+class FakeWriteBatch:
+    """set/update/delete를 모았다가 commit 시 한 번의 왕복으로 적용한다.
+
+    Firestore처럼 전부 적용되거나 전혀 적용되지 않는다: 없는 문서에 대한 update가 있으면
+    아무것도 쓰지 않고 `NotFound`를 던진다.
+    """
+
+    def __init__(self, client: "FakeFirestoreClient"):
+        self._client = client
+        # (종류, 문서, 데이터, merge)
+        self._ops: List[Tuple[str, FakeDocumentReference, Optional[Dict[str, Any]], bool]] = []
+
+    def set(self, reference: FakeDocumentReference, document_data: Dict[str, Any], merge: bool = False) -> None:
+        self._ops.append(("set", reference, copy.deepcopy(document_data), merge))
+
+    def update(self, reference: FakeDocumentReference, field_updates: Dict[str, Any], **_: Any) -> None:
+        self._ops.append(("update", reference, copy.deepcopy(field_updates), False))
+
+    def delete(self, reference: FakeDocumentReference, **_: Any) -> None:
+        self._ops.append(("delete", reference, None, False))
+
+    async def commit(self, **_: Any) -> List[Any]:
+        return self._commit_ops()
+
+    def _check_ops(self) -> None:
+        # 앞선 set/delete를 반영해 update 대상이 모두 있는지 먼저 확인한다.
+        exists: Dict[str, bool] = {}
+        for kind, ref, _, _ in self._ops:
+            if kind == "update":
+                found = exists.get(ref.path)
+                if found is None:
+                    found = ref.id in self._client._collection_docs(ref._parent_path)
+                if not found:
+                    raise exceptions.NotFound(f"no document to update: {ref.path}")
+            exists[ref.path] = kind != "delete"
+
+    def _commit_ops(self) -> List[Any]:
+        if len(self._ops) > BATCH_WRITE_LIMIT:
+            raise exceptions.InvalidArgument(f"maximum {BATCH_WRITE_LIMIT} writes allowed per request")
+        with self._client._lock:
+            self._client.stats.round_trips += 1
+            self._check_ops()
+            for kind, ref, data, merge in self._ops:
+                if kind == "set":
+                    self._client._apply_set(ref, data, merge)
+                elif kind == "update":
+                    self._client._apply_update(ref, data)
+                else:
+                    self._client._apply_delete(ref)
+            count = len(self._ops)
+            self._ops = []
+        return [None] * count
+
+
+class FakeTransaction(FakeWriteBatch):
+    """`firestore.async_transactional` 데코레이터와 함께 쓸 수 있는 낙관적 트랜잭션.
+
+    트랜잭션 안에서 읽은 문서가 commit 전에 다른 쓰기로 바뀌었으면 `Aborted`를 던지고,
+    데코레이터가 `max_attempts`까지 다시 시도한다.
+    """
+
+    def __init__(self, client: "FakeFirestoreClient", max_attempts: int = 5, read_only: bool = False):
+        super().__init__(client)
+        self._max_attempts = max_attempts
+        self._read_only = read_only
+        self._id: Optional[bytes] = None
+        self._read_versions: Dict[str, int] = {}
+
+    @property
+    def in_progress(self) -> bool:
+        return self._id is not None
+
+    @property
+    def id(self) -> Optional[bytes]:
+        return self._id
+
+    async def _begin(self, retry_id: Optional[bytes] = None) -> None:
+        self._id = uuid.uuid4().bytes
+
+    def _clean_up(self) -> None:
+        self._ops = []
+        self._read_versions = {}
+        self._id = None
+
+    async def _rollback(self) -> None:
+        self._clean_up()
+
+    async def get(self, ref_or_query: Any, **_: Any) -> Any:
+        if isinstance(ref_or_query, FakeDocumentReference):
+            with self._client._lock:
+                snap = ref_or_query._get()
+                self._read_versions[ref_or_query.path] = self._client._version(ref_or_query.path)
+            return snap
+        with self._client._lock:
+            snaps = ref_or_query._run()
+            for snap in snaps:
+                self._read_versions[snap.reference.path] = self._client._version(snap.reference.path)
+        return snaps
+
+    async def get_all(self, references: List[FakeDocumentReference], **_: Any) -> AsyncIterator[FakeDocumentSnapshot]:
+        with self._client._lock:
+            self._client.stats.reads += len(references)
+            self._client.stats.round_trips += 1
+            snaps = [self._client._snapshot(ref) for ref in references]
+            for ref in references:
+                self._read_versions[ref.path] = self._client._version(ref.path)
+        return _iterate(snaps)
+
+    async def _commit(self) -> List[Any]:
+        with self._client._lock:
+            for path, version in self._read_versions.items():
+                if self._client._version(path) != version:
+                    self._clean_up()
+                    raise exceptions.Aborted(f"transaction conflict on {path}")
+            result = self._commit_ops()
+        self._clean_up()
+        return result
+
+
+class FakeFirestoreClient:
+    def __init__(self, project: str = "fake-project"):
+        self.project = project
+        self.stats = OperationStats()
+        self._lock = threading.RLock()
+        # collection path -> doc id -> data
+        self._data: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # document path -> (version, update_time)
+        self._meta: Dict[str, Tuple[int, datetime.datetime]] = {}
+
+    def collection(self, name: str) -> FakeCollectionReference:
+        return FakeCollectionReference(self, name)
+
+    async def get_all(self, references: List[FakeDocumentReference], field_paths: Optional[List[str]] = None, **_: Any) -> AsyncIterator[FakeDocumentSnapshot]:
+        with self._lock:
+            self.stats.reads += len(references)
+            self.stats.round_trips += 1
+            snaps = [self._snapshot(ref, field_paths) for ref in references]
+        for snap in snaps:
+            yield snap
+
+    def batch(self) -> FakeWriteBatch:
+        return FakeWriteBatch(self)
+
+    def transaction(self, max_attempts: int = 5, read_only: bool = False) -> FakeTransaction:
+        return FakeTransaction(self, max_attempts=max_attempts, read_only=read_only)
+
+    def reset_stats(self) -> None:
+        self.stats.reset()
+
+    # --- internal helpers (호출 측에서 lock을 잡는다) ---
+
+    def _collection_docs(self, path: str) -> Dict[str, Dict[str, Any]]:
+        return self._data.get(path, {})
+
+    def _version(self, doc_path: str) -> int:
+        return self._meta.get(doc_path, (0, None))[0]
+
+    def _snapshot(self, ref: FakeDocumentReference, field_paths: Optional[Any] = None) -> FakeDocumentSnapshot:
+        data = self._data.get(ref._parent_path, {}).get(ref.id)
+        meta = self._meta.get(ref.path)
+        if data is not None and field_paths is not None:
+            projected: Dict[str, Any] = {}
+            for field_path in field_paths:
+                found, value = _get_field(data, field_path)
+                if found:
+                    set_field(projected, field_path, value)
+            data = projected
+        if data is not None:
+            self.stats.bytes_read += _payload_size(data)
+        return FakeDocumentSnapshot(ref, copy.deepcopy(data) if data is not None else None, meta[1] if meta else None)
+
+    def _touch(self, ref: FakeDocumentReference) -> None:
+        version = self._version(ref.path) + 1
+        self._meta[ref.path] = (version, datetime.datetime.now(datetime.timezone.utc))
+
+    def _apply_set(self, ref: FakeDocumentReference, document_data: Dict[str, Any], merge: bool) -> None:
+        docs = self._data.setdefault(ref._parent_path, {})
+        data = copy.deepcopy(document_data)
+        if merge and ref.id in docs:
+            data = merge_document(docs[ref.id], data)
+        docs[ref.id] = data
+        self._touch(ref)
+        self.stats.writes += 1
+        self.stats.bytes_written += _payload_size(document_data)
+
+    def _apply_update(self, ref: FakeDocumentReference, field_updates: Dict[str, Any]) -> None:
+        docs = self._data.get(ref._parent_path, {})
+        if ref.id not in docs:
+            raise exceptions.NotFound(f"no document to update: {ref.path}")
+        data = docs[ref.id]
+        for field_path, value in field_updates.items():
+            if value is firestore.DELETE_FIELD:
+                value = DELETE_FIELD
+            set_field(data, field_path, copy.deepcopy(value))
+        self._touch(ref)
+        self.stats.writes += 1
+        self.stats.bytes_written += _payload_size(field_updates)
+
+    def _apply_delete(self, ref: FakeDocumentReference) -> None:
+        self._data.get(ref._parent_path, {}).pop(ref.id, None)
+        self._touch(ref)
+        self.stats.deletes += 1
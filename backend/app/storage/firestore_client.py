@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Any, Optional
 
 from google.cloud import firestore
 from google.oauth2 import service_account
@@ -20,7 +21,24 @@ SERVICE_ACCOUNT_INFO = {
 }
 
 
+# 테스트/벤치마크에서 주입한 클라이언트 (예: app.storage.fake_firestore.FakeFirestoreClient)
+_client_override: Optional[Any] = None
+
+
+def set_firestore_client(client: Optional[Any]) -> None:
+    """get_firestore_client()가 반환할 클라이언트를 교체한다. None이면 실제 Firestore로 되돌린다."""
+    global _client_override
+    _client_override = client
+
+
 @lru_cache(maxsize=1)
-def get_firestore_client() -> firestore.Client:
+def _create_firestore_client() -> firestore.AsyncClient:
+    # 비동기 클라이언트: 요청 처리 중 Firestore 응답을 기다리는 동안 스레드를 점유하지 않는다.
     creds = service_account.Credentials.from_service_account_info(SERVICE_ACCOUNT_INFO)
-    return firestore.Client(project=SERVICE_ACCOUNT_INFO["project_id"], credentials=creds)
+    return firestore.AsyncClient(project=SERVICE_ACCOUNT_INFO["project_id"], credentials=creds)
+
+
+def get_firestore_client() -> firestore.AsyncClient:
+    if _client_override is not None:
+        return _client_override
+    return _create_firestore_client()
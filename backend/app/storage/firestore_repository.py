@@ -0,0 +1,240 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence
+
+from google.api_core import exceptions
+from google.cloud import firestore
+
+from app.storage.firestore_client import get_firestore_client
+from app.storage.repository import (
+    BATCH_WRITE_LIMIT,
+    DELETE_FIELD,
+    FILTER_OPS,
+    ConflictError,
+    Filter,
+    OrderBy,
+    SideWrite,
+    StorageRepository,
+    Write,
+    count_writes,
+    sort_documents,
+)
+
+# Firestore `in` 필터는 한 번에 최대 30개 값까지만 허용한다.
+IN_FILTER_LIMIT = 30
+
+
+def _to_dict(snap: Any) -> Dict[str, Any]:
+    data = snap.to_dict() or {}
+    data["id"] = snap.id
+    return data
+
+
+async def _fetch(query: Any, limit: Optional[int]) -> List[Dict[str, Any]]:
+    if limit is not None:
+        query = query.limit(limit)
+    return [_to_dict(doc) async for doc in query.stream()]
+
+
+def _fields(fields: Dict[str, Any]) -> Dict[str, Any]:
+    # 저장소 공용 DELETE_FIELD를 Firestore sentinel로 바꾼다.
+    return {path: firestore.DELETE_FIELD if value is DELETE_FIELD else value for path, value in fields.items()}
+
+
+def _retries_exhausted(exc: ValueError) -> bool:
+    # async_transactional은 Aborted로 재시도 횟수를 모두 쓰면 ValueError로 감싸서 던진다.
+    return isinstance(exc.__cause__, exceptions.Aborted)
+
+
+def _direction(direction: str) -> str:
+    return firestore.Query.DESCENDING if direction == "desc" else firestore.Query.ASCENDING
+
+
+class FirestoreRepository(StorageRepository):
+    def _col(self, collection: str) -> Any:
+        return get_firestore_client().collection(collection)
+
+    def new_id(self, collection: str) -> str:
+        return self._col(collection).document().id
+
+    def _add_side_writes(self, writer: Any, side_writes: Sequence[SideWrite]) -> None:
+        # writer: WriteBatch 또는 Transaction
+        for collection, doc_id, data in side_writes:
+            ref = self._col(collection).document(doc_id)
+            if data is None:
+                writer.delete(ref)
+            else:
+                writer.set(ref, data)
+
+    async def get(self, collection: str, doc_id: str) -> Optional[Dict[str, Any]]:
+        snap = await self._col(collection).document(doc_id).get()
+        if not snap.exists:
+            return None
+        return _to_dict(snap)
+
+    async def get_many(self, collection: str, doc_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        unique_ids = list(dict.fromkeys(str(i) for i in doc_ids if i))
+        if not unique_ids:
+            return {}
+        col = self._col(collection)
+        out: Dict[str, Dict[str, Any]] = {}
+        async for snap in get_firestore_client().get_all([col.document(i) for i in unique_ids]):
+            if snap.exists:
+                out[snap.id] = _to_dict(snap)
+        return out
+
+    async def set(self, collection: str, doc_id: str, data: Dict[str, Any], merge: bool = False) -> None:
+        await self._col(collection).document(doc_id).set(data, merge=merge)
+
+    async def update(
+        self,
+        collection: str,
+        doc_id: str,
+        fields: Dict[str, Any],
+        expected: Optional[Dict[str, Any]] = None,
+        side_writes: Sequence[SideWrite] = (),
+    ) -> None:
+        ref = self._col(collection).document(doc_id)
+        if not expected:
+            try:
+                if side_writes:
+                    batch = get_firestore_client().batch()
+                    batch.update(ref, _fields(fields))
+                    self._add_side_writes(batch, side_writes)
+                    await batch.commit()
+                else:
+                    await ref.update(_fields(fields))
+            except exceptions.NotFound as exc:
+                raise KeyError(doc_id) from exc
+            return
+
+        # 읽은 뒤 다른 쓰기가 끼어들면 Firestore가 트랜잭션을 다시 실행하므로 expected 검사가 원자적이다.
+        @firestore.async_transactional
+        async def _run(transaction: Any) -> None:
+            snap = await ref.get(transaction=transaction)
+            if not snap.exists:
+                raise KeyError(doc_id)
+            current = snap.to_dict() or {}
+            for field, value in expected.items():
+                if current.get(field) != value:
+                    raise ConflictError(f"{collection}/{doc_id}: {field} changed")
+            transaction.update(ref, _fields(fields))
+            self._add_side_writes(transaction, side_writes)
+
+        try:
+            await _run(get_firestore_client().transaction())
+        except ValueError as exc:
+            if not _retries_exhausted(exc):
+                raise
+            raise ConflictError(f"{collection}/{doc_id}: too much contention") from exc
+
+    async def update_many(
+        self,
+        collection: str,
+        updates: Dict[str, Dict[str, Any]],
+        expected: Optional[Dict[str, Dict[str, Any]]] = None,
+        side_writes: Optional[Dict[str, Sequence[SideWrite]]] = None,
+    ) -> Dict[str, Exception]:
+        count = count_writes(updates, side_writes)
+        if count > BATCH_WRITE_LIMIT:
+            raise ValueError(f"too many writes in one batch: {count} > {BATCH_WRITE_LIMIT}")
+        if not updates:
+            return {}
+        col = self._col(collection)
+        refs = {doc_id: col.document(doc_id) for doc_id in updates}
+
+        @firestore.async_transactional
+        async def _run(transaction: Any) -> Dict[str, Exception]:
+            current: Dict[str, Dict[str, Any]] = {}
+            async for snap in await transaction.get_all(list(refs.values())):
+                if snap.exists:
+                    current[snap.id] = snap.to_dict() or {}
+            skipped: Dict[str, Exception] = {}
+            for doc_id, fields in updates.items():
+                if doc_id not in current:
+                    skipped[doc_id] = KeyError(doc_id)
+                    continue
+                changed = [f for f, v in ((expected or {}).get(doc_id) or {}).items() if current[doc_id].get(f) != v]
+                if changed:
+                    skipped[doc_id] = ConflictError(f"{collection}/{doc_id}: {changed[0]} changed")
+                    continue
+                transaction.update(refs[doc_id], _fields(fields))
+                self._add_side_writes(transaction, (side_writes or {}).get(doc_id) or ())
+            return skipped
+
+        try:
+            return await _run(get_firestore_client().transaction())
+        except ValueError as exc:
+            if not _retries_exhausted(exc):
+                raise
+            raise ConflictError(f"{collection}: too much contention") from exc
+
+    async def set_many(self, writes: Sequence[Write]) -> None:
+        if len(writes) > BATCH_WRITE_LIMIT:
+            raise ValueError(f"too many writes in one batch: {len(writes)} > {BATCH_WRITE_LIMIT}")
+        if not writes:
+            return
+        batch = get_firestore_client().batch()
+        for collection, doc_id, data in writes:
+            batch.set(self._col(collection).document(doc_id), data)
+        await batch.commit()
+
+    async def delete(self, collection: str, doc_id: str) -> None:
+        await self._col(collection).document(doc_id).delete()
+
+    async def delete_many(self, collection: str, doc_ids: Sequence[str]) -> None:
+        if len(doc_ids) > BATCH_WRITE_LIMIT:
+            raise ValueError(f"too many writes in one batch: {len(doc_ids)} > {BATCH_WRITE_LIMIT}")
+        if not doc_ids:
+            return
+        batch = get_firestore_client().batch()
+        for doc_id in doc_ids:
+            batch.delete(self._col(collection).document(doc_id))
+        await batch.commit()
+
+    async def query(
+        self,
+        collection: str,
+        filters: Sequence[Filter] = (),
+        order_by: Sequence[OrderBy] = (),
+        limit: Optional[int] = None,
+        start_after: Optional[Dict[str, Any]] = None,
+        select: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        query = self._col(collection)
+        if select is not None:
+            query = query.select(list(select))
+        in_filter = None
+        for field, op, value in filters:
+            if op not in FILTER_OPS:
+                raise ValueError(f"unsupported filter op: {op}")
+            if op == "in" and len(value) > IN_FILTER_LIMIT:
+                # 30개를 넘는 in 필터는 나눠서 조회한 뒤 합친다.
+                in_filter = (field, list(value))
+                continue
+            query = query.where(field, op, value)
+
+        if order_by:
+            for field, direction in order_by:
+                query = query.order_by(field, direction=_direction(direction))
+            query = query.order_by("__name__", direction=_direction(order_by[-1][1]))
+            if start_after is not None:
+                cursor = {field: start_after.get(field) for field, _ in order_by}
+                cursor["__name__"] = str(start_after.get("id") or "")
+                query = query.start_after(cursor)
+
+        if in_filter is None:
+            return await _fetch(query, limit)
+
+        # 나눈 쿼리는 동시에 보낸다.
+        field, values = in_filter
+        chunks = await asyncio.gather(
+            *(
+                _fetch(query.where(field, "in", values[i:i + IN_FILTER_LIMIT]), limit)
+                for i in range(0, len(values), IN_FILTER_LIMIT)
+            )
+        )
+        out = [doc for chunk in chunks for doc in chunk]
+
+        if order_by:
+            out = sort_documents(out, order_by)
+        return out[:limit] if limit is not None else out
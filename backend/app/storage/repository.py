@@ -0,0 +1,214 @@
+"""저장소(repository) 인터페이스.
+
+서비스 레이어는 Firestore/SQLite 클라이언트를 직접 다루지 않고 이 인터페이스만 사용한다.
+문서는 `dict`로 주고받으며, 조회 결과에는 문서 키가 `id` 필드로 포함된다.
+collection에는 `inspections/{id}/revisions`처럼 하위 컬렉션 경로도 쓸 수 있다.
+실제 엔진은 `app.core.config.STORAGE_BACKEND`로 선택한다.
+모든 메서드는 코루틴이다(Firestore는 AsyncClient, SQLite는 작업 스레드에서 실행).
+"""
+
+import base64
+import json
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import SQLITE_PATH, STORAGE_BACKEND
+
+# (field, op, value) - op: "==", "<", "<=", ">", ">=", "in"
+Filter = Tuple[str, str, Any]
+
+FILTER_OPS = {"==", "<", "<=", ">", ">=", "in"}
+
+# (field, "asc" | "desc")
+OrderBy = Tuple[str, str]
+
+# (collection, doc_id, data) - set_many에 넘기는 문서 1건
+Write = Tuple[str, str, Dict[str, Any]]
+
+# (collection, doc_id, data | None) - update/update_many와 같은 트랜잭션에서 함께 덮어쓸 문서(None이면 삭제)
+SideWrite = Tuple[str, str, Optional[Dict[str, Any]]]
+
+# 한 번에 원자적으로 커밋할 수 있는 최대 쓰기 수 (Firestore WriteBatch 제한)
+BATCH_WRITE_LIMIT = 500
+
+
+class _DeleteField:
+    """update()의 값으로 넘기면 해당 필드를 지운다(Firestore DELETE_FIELD와 같은 역할)."""
+
+    def __repr__(self) -> str:
+        return "DELETE_FIELD"
+
+    def __copy__(self) -> "_DeleteField":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_DeleteField":
+        return self
+
+
+DELETE_FIELD = _DeleteField()
+
+
+def count_writes(updates: Dict[str, Any], side_writes: Optional[Dict[str, Sequence[SideWrite]]] = None) -> int:
+    """update_many 한 번이 커밋하는 쓰기 수."""
+    return len(updates) + sum(len(writes) for writes in (side_writes or {}).values())
+
+
+def sort_documents(docs: List[Dict[str, Any]], order_by: Sequence[OrderBy]) -> List[Dict[str, Any]]:
+    """order_by 순서(마지막 tie-breaker는 문서 id)대로 정렬한다. 여러 쿼리 결과를 합칠 때 사용한다."""
+    out = list(docs)
+    tie_desc = bool(order_by) and order_by[-1][1] == "desc"
+    out.sort(key=lambda d: str(d.get("id") or ""), reverse=tie_desc)
+    for field, direction in reversed(order_by):
+        out.sort(key=lambda d: (d.get(field) is not None, d.get(field) or ""), reverse=direction == "desc")
+    return out
+
+
+def encode_cursor(doc: Dict[str, Any], order_by: Sequence[OrderBy]) -> str:
+    """페이지의 마지막 문서로 다음 페이지 커서(order_by 필드 값 + id)를 만든다."""
+    raw = json.dumps([doc.get(field) for field, _ in order_by] + [doc.get("id")], ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: Optional[str], order_by: Sequence[OrderBy]) -> Optional[Dict[str, Any]]:
+    """encode_cursor 결과를 query의 start_after 형태로 되돌린다. 형식이 틀리면 ValueError."""
+    if not cursor:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, TypeError) as exc:
+        raise ValueError("invalid cursor") from exc
+    if not isinstance(values, list) or len(values) != len(order_by) + 1:
+        raise ValueError("invalid cursor")
+    return {**{field: value for (field, _), value in zip(order_by, values)}, "id": values[-1]}
+
+
+def set_field(data: Dict[str, Any], field_path: str, value: Any) -> None:
+    """`a.b` 형태의 경로에 값을 넣는다. 중간 map이 없으면 만든다. 값이 DELETE_FIELD면 필드를 지운다."""
+    parts = field_path.split(".")
+    target = data
+    for part in parts[:-1]:
+        target = target.setdefault(part, {})
+    if value is DELETE_FIELD:
+        target.pop(parts[-1], None)
+        return
+    target[parts[-1]] = value
+
+
+def merge_document(base: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """Firestore `set(..., merge=True)`와 같은 방식으로 map 필드를 재귀 병합한다."""
+    out = dict(base)
+    for key, value in patch.items():
+        if isinstance(value, dict) and isinstance(out.get(key), dict):
+            out[key] = merge_document(out[key], value)
+        else:
+            out[key] = value
+    return out
+
+
+def subcollection(collection: str, doc_id: str, name: str) -> str:
+    """하위 컬렉션 경로(`collection/doc_id/name`)를 만든다."""
+    doc_id = str(doc_id or "").strip()
+    if not doc_id or "/" in doc_id:
+        raise ValueError(f"invalid document id: {doc_id}")
+    return f"{collection}/{doc_id}/{name}"
+
+
+class ConflictError(Exception):
+    """조건부 쓰기(update의 expected)가 현재 문서 값과 맞지 않을 때 발생한다."""
+
+
+class StorageRepository(ABC):
+    @abstractmethod
+    def new_id(self, collection: str) -> str:
+        """새 문서 키를 발급한다."""
+
+    @abstractmethod
+    async def get(self, collection: str, doc_id: str) -> Optional[Dict[str, Any]]:
+        """문서 1건을 키로 조회한다. 없으면 None."""
+
+    @abstractmethod
+    async def get_many(self, collection: str, doc_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 문서를 한 번의 왕복으로 조회한다. 반환값은 {doc_id: 문서}이며 없는 문서는 빠진다."""
+
+    @abstractmethod
+    async def set(self, collection: str, doc_id: str, data: Dict[str, Any], merge: bool = False) -> None:
+        """문서를 저장한다. merge=True면 기존 필드와 병합한다."""
+
+    @abstractmethod
+    async def update(
+        self,
+        collection: str,
+        doc_id: str,
+        fields: Dict[str, Any],
+        expected: Optional[Dict[str, Any]] = None,
+        side_writes: Sequence[SideWrite] = (),
+    ) -> None:
+        """지정한 필드만 바꾼다(`a.b` 경로 가능, 값이 DELETE_FIELD면 삭제). 나머지 필드는 다시 쓰지 않는다.
+        문서가 없으면 KeyError.
+
+        expected가 있으면 문서의 해당 최상위 필드 값이 모두 같을 때만 원자적으로 쓰고,
+        다르면 ConflictError를 던진다(낙관적 동시성 제어, 잠금 없음).
+        side_writes는 같은 트랜잭션에서 함께 쓰므로, update가 실패하면 하나도 쓰이지 않는다.
+        """
+
+    @abstractmethod
+    async def update_many(
+        self,
+        collection: str,
+        updates: Dict[str, Dict[str, Any]],
+        expected: Optional[Dict[str, Dict[str, Any]]] = None,
+        side_writes: Optional[Dict[str, Sequence[SideWrite]]] = None,
+    ) -> Dict[str, Exception]:
+        """여러 문서의 필드를 한 트랜잭션으로 바꾼다({doc_id: fields}).
+
+        없는 문서와 expected[doc_id]가 현재 값과 다른 문서는 건너뛰고 나머지만 원자적으로 쓴다.
+        side_writes[doc_id]는 그 문서를 바꿀 때만 같은 트랜잭션에서 함께 쓴다.
+        updates와 side_writes를 합쳐 BATCH_WRITE_LIMIT건을 넘으면 ValueError.
+        반환값은 건너뛴 문서의 {doc_id: KeyError | ConflictError}.
+        """
+
+    @abstractmethod
+    async def set_many(self, writes: Sequence[Write]) -> None:
+        """여러 문서(하위 컬렉션 포함)를 한 번의 왕복으로 저장한다(덮어쓰기).
+
+        모두 저장되거나 하나도 저장되지 않는다. BATCH_WRITE_LIMIT건을 넘으면 ValueError.
+        """
+
+    @abstractmethod
+    async def delete(self, collection: str, doc_id: str) -> None:
+        """문서를 삭제한다. 없는 문서여도 오류가 아니다."""
+
+    @abstractmethod
+    async def delete_many(self, collection: str, doc_ids: Sequence[str]) -> None:
+        """여러 문서를 한 번의 왕복으로 삭제한다(최대 BATCH_WRITE_LIMIT건). 없는 문서는 무시한다."""
+
+    @abstractmethod
+    async def query(
+        self,
+        collection: str,
+        filters: Sequence[Filter] = (),
+        order_by: Sequence[OrderBy] = (),
+        limit: Optional[int] = None,
+        start_after: Optional[Dict[str, Any]] = None,
+        select: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """filters를 모두 만족하는 문서 목록을 반환한다.
+
+        order_by가 있으면 그 순서로 정렬하고 문서 id를 마지막 기준으로 덧붙인다(방향은 마지막 필드와 같다).
+        start_after는 order_by 필드 + "id" 값을 담은 dict로, 그 위치 다음 문서부터 반환한다.
+        select가 있으면 해당 필드만 읽어 온다(`a.b` 형태의 중첩 경로 가능, 없는 필드는 생략).
+        """
+
+
+@lru_cache(maxsize=1)
+def get_repository() -> StorageRepository:
+    if STORAGE_BACKEND == "sqlite":
+        from app.storage.sqlite_repository import SqliteRepository
+
+        return SqliteRepository(SQLITE_PATH)
+    if STORAGE_BACKEND == "firestore":
+        from app.storage.firestore_repository import FirestoreRepository
+
+        return FirestoreRepository()
+    raise ValueError(f"unknown STORAGE_BACKEND: {STORAGE_BACKEND}")
@@ -0,0 +1,388 @@
+"""SQLite 저장소 (온프레미스/로컬 설치용).
+
+컬렉션마다 `(id TEXT PRIMARY KEY, data TEXT)` 테이블을 두고 문서를 JSON으로 저장한다.
+하위 컬렉션(`inspections/{pid}/revisions`)은 `inspections_revisions` 테이블 하나에 `{pid}/{id}` 키로 저장하므로,
+부모 문서별 조회는 기본 키 범위 조회가 된다.
+자주 조회하는 필드는 `json_extract` 식 인덱스를 만들어 두므로, 같은 식으로 조회하면 인덱스를 탄다.
+"""
+
+import asyncio
+import json
+import re
+import sqlite3
+import threading
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.storage.repository import (
+    BATCH_WRITE_LIMIT,
+    FILTER_OPS,
+    ConflictError,
+    Filter,
+    OrderBy,
+    SideWrite,
+    StorageRepository,
+    Write,
+    count_writes,
+    merge_document,
+    set_field,
+)
+
+# collection -> 인덱스(필드 튜플) 목록
+INDEXES: Dict[str, List[Tuple[str, ...]]] = {
+    "inspections": [
+        ("date",),
+        ("workType", "date"),
+        ("status",),
+        ("userName", "date"),
+        ("userName", "updatedAt"),
+        ("date", "updatedAt"),
+        ("lookupKey",),
+        ("lookupPrefix",),
+    ],
+    "inspection_queue": [
+        ("workType", "createdAt"),
+        ("createdAt",),
+    ],
+    "users": [
+        ("nameKey", "phoneLast4"),
+        ("phoneLast4",),
+        ("role",),
+        ("role", "name"),
+        ("name",),
+    ],
+}
+
+_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _check_name(name: str) -> str:
+    if not _NAME_RE.match(name):
+        raise ValueError(f"invalid collection/field name: {name}")
+    return name
+
+
+def _resolve(collection: str) -> Tuple[str, str]:
+    """컬렉션 경로 -> (테이블 이름, 문서 키 prefix)."""
+    parts = collection.split("/")
+    if len(parts) % 2 == 0:
+        raise ValueError(f"invalid collection path: {collection}")
+    table = "_".join(_check_name(part) for part in parts[0::2])
+    prefix = "".join(f"{part}/" for part in parts[1::2])
+    return table, prefix
+
+
+def _field_path(field: str) -> str:
+    return "$." + ".".join(_check_name(part) for part in field.split("."))
+
+
+def _field_expr(field: str) -> str:
+    # 인덱스 정의와 조회 조건이 같은 식을 써야 SQLite가 인덱스를 사용한다.
+    return f"json_extract(data, '{_field_path(field)}')"
+
+
+def _to_dict(row: Tuple[str, str]) -> Dict[str, Any]:
+    data = json.loads(row[1])
+    data["id"] = row[0].rsplit("/", 1)[-1]
+    return data
+
+
+class SqliteRepository(StorageRepository):
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._tables: set[str] = set()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            for collection in INDEXES:
+                self._ensure_table(collection)
+
+    def _ensure_table(self, collection: str) -> Tuple[str, str]:
+        table, prefix = _resolve(collection)
+        if table in self._tables:
+            return table, prefix
+
+        with self._lock, self._conn:
+            self._conn.execute(f'CREATE TABLE IF NOT EXISTS "{table}" (id TEXT PRIMARY KEY, data TEXT NOT NULL)')
+            for fields in INDEXES.get(table, []):
+                index_name = f"ix_{table}_{'_'.join(fields)}"
+                columns = ", ".join(_field_expr(f) for f in fields)
+                self._conn.execute(f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "{table}" ({columns})')
+        self._tables.add(table)
+        return table, prefix
+
+    def new_id(self, collection: str) -> str:
+        return uuid.uuid4().hex[:20]
+
+    # 비동기 인터페이스: SQLite 호출은 작업 스레드에서 실행해 이벤트 루프를 막지 않는다.
+
+    async def get(self, collection: str, doc_id: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._get, collection, doc_id)
+
+    async def get_many(self, collection: str, doc_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        return await asyncio.to_thread(self._get_many, collection, doc_ids)
+
+    async def set(self, collection: str, doc_id: str, data: Dict[str, Any], merge: bool = False) -> None:
+        await asyncio.to_thread(self._set, collection, doc_id, data, merge)
+
+    async def update(
+        self,
+        collection: str,
+        doc_id: str,
+        fields: Dict[str, Any],
+        expected: Optional[Dict[str, Any]] = None,
+        side_writes: Sequence[SideWrite] = (),
+    ) -> None:
+        await asyncio.to_thread(self._update, collection, doc_id, fields, expected, side_writes)
+
+    async def update_many(
+        self,
+        collection: str,
+        updates: Dict[str, Dict[str, Any]],
+        expected: Optional[Dict[str, Dict[str, Any]]] = None,
+        side_writes: Optional[Dict[str, Sequence[SideWrite]]] = None,
+    ) -> Dict[str, Exception]:
+        return await asyncio.to_thread(self._update_many, collection, updates, expected, side_writes)
+
+    async def set_many(self, writes: Sequence[Write]) -> None:
+        await asyncio.to_thread(self._set_many, writes)
+
+    async def delete(self, collection: str, doc_id: str) -> None:
+        await asyncio.to_thread(self._delete, collection, doc_id)
+
+    async def delete_many(self, collection: str, doc_ids: Sequence[str]) -> None:
+        await asyncio.to_thread(self._delete_many, collection, doc_ids)
+
+    async def query(
+        self,
+        collection: str,
+        filters: Sequence[Filter] = (),
+        order_by: Sequence[OrderBy] = (),
+        limit: Optional[int] = None,
+        start_after: Optional[Dict[str, Any]] = None,
+        select: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self._query, collection, filters, order_by, limit, start_after, select)
+
+    def _get(self, collection: str, doc_id: str) -> Optional[Dict[str, Any]]:
+        table, prefix = self._ensure_table(collection)
+        with self._lock:
+            row = self._conn.execute(f'SELECT id, data FROM "{table}" WHERE id = ?', (prefix + doc_id,)).fetchone()
+        return _to_dict(row) if row else None
+
+    def _get_many(self, collection: str, doc_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        table, prefix = self._ensure_table(collection)
+        unique_ids = list(dict.fromkeys(str(i) for i in doc_ids if i))
+        out: Dict[str, Dict[str, Any]] = {}
+        # SQLite 바인딩 변수 개수 제한(기본 999)을 넘지 않도록 나눠서 조회한다.
+        for i in range(0, len(unique_ids), 500):
+            chunk = [prefix + doc_id for doc_id in unique_ids[i:i + 500]]
+            placeholders = ", ".join("?" for _ in chunk)
+            with self._lock:
+                rows = self._conn.execute(f'SELECT id, data FROM "{table}" WHERE id IN ({placeholders})', chunk).fetchall()
+            out.update((doc["id"], doc) for doc in map(_to_dict, rows))
+        return out
+
+    def _set(self, collection: str, doc_id: str, data: Dict[str, Any], merge: bool = False) -> None:
+        table, prefix = self._ensure_table(collection)
+        with self._lock, self._conn:
+            if merge:
+                row = self._conn.execute(f'SELECT data FROM "{table}" WHERE id = ?', (prefix + doc_id,)).fetchone()
+                if row:
+                    data = merge_document(json.loads(row[0]), data)
+            self._conn.execute(
+                f'INSERT OR REPLACE INTO "{table}" (id, data) VALUES (?, ?)',
+                (prefix + doc_id, json.dumps(data, ensure_ascii=False)),
+            )
+
+    def _set_many(self, writes: Sequence[Write]) -> None:
+        if len(writes) > BATCH_WRITE_LIMIT:
+            raise ValueError(f"too many writes in one batch: {len(writes)} > {BATCH_WRITE_LIMIT}")
+        rows: Dict[str, List[Tuple[str, str]]] = {}
+        for collection, doc_id, data in writes:
+            table, prefix = self._ensure_table(collection)
+            rows.setdefault(table, []).append((prefix + doc_id, json.dumps(data, ensure_ascii=False)))
+        # 한 트랜잭션으로 커밋한다.
+        with self._lock, self._conn:
+            for table, values in rows.items():
+                self._conn.executemany(f'INSERT OR REPLACE INTO "{table}" (id, data) VALUES (?, ?)', values)
+
+    def _side_rows(self, side_writes: Sequence[SideWrite]) -> List[Tuple[str, str, Optional[str]]]:
+        # 테이블 생성은 자체 커밋을 하므로 트랜잭션을 열기 전에 (테이블, 키, JSON | None)으로 바꿔 둔다.
+        rows: List[Tuple[str, str, Optional[str]]] = []
+        for collection, doc_id, data in side_writes:
+            table, prefix = self._ensure_table(collection)
+            rows.append((table, prefix + doc_id, None if data is None else json.dumps(data, ensure_ascii=False)))
+        return rows
+
+    def _write_side_rows(self, rows: Sequence[Tuple[str, str, Optional[str]]]) -> None:
+        # 호출 측이 연 트랜잭션 안에서 실행한다.
+        for table, key, raw in rows:
+            if raw is None:
+                self._conn.execute(f'DELETE FROM "{table}" WHERE id = ?', (key,))
+            else:
+                self._conn.execute(f'INSERT OR REPLACE INTO "{table}" (id, data) VALUES (?, ?)', (key, raw))
+
+    def _update(
+        self,
+        collection: str,
+        doc_id: str,
+        fields: Dict[str, Any],
+        expected: Optional[Dict[str, Any]] = None,
+        side_writes: Sequence[SideWrite] = (),
+    ) -> None:
+        table, prefix = self._ensure_table(collection)
+        side_rows = self._side_rows(side_writes)
+        key = prefix + doc_id
+        # 읽은 행과 같을 때만 UPDATE한다(compare-and-set). 다른 프로세스가 먼저 쓰면 다시 읽어서 확인한다.
+        while True:
+            with self._lock, self._conn:
+                row = self._conn.execute(f'SELECT data FROM "{table}" WHERE id = ?', (key,)).fetchone()
+                if not row:
+                    raise KeyError(doc_id)
+                data = json.loads(row[0])
+                for field, value in (expected or {}).items():
+                    if data.get(field) != value:
+                        raise ConflictError(f"{collection}/{doc_id}: {field} changed")
+                for field_path, value in fields.items():
+                    set_field(data, field_path, value)
+                cur = self._conn.execute(
+                    f'UPDATE "{table}" SET data = ? WHERE id = ? AND data = ?',
+                    (json.dumps(data, ensure_ascii=False), key, row[0]),
+                )
+                if cur.rowcount:
+                    self._write_side_rows(side_rows)
+                    return
+
+    def _update_many(
+        self,
+        collection: str,
+        updates: Dict[str, Dict[str, Any]],
+        expected: Optional[Dict[str, Dict[str, Any]]] = None,
+        side_writes: Optional[Dict[str, Sequence[SideWrite]]] = None,
+    ) -> Dict[str, Exception]:
+        count = count_writes(updates, side_writes)
+        if count > BATCH_WRITE_LIMIT:
+            raise ValueError(f"too many writes in one batch: {count} > {BATCH_WRITE_LIMIT}")
+        if not updates:
+            return {}
+        table, prefix = self._ensure_table(collection)
+        side_rows = {doc_id: self._side_rows(writes) for doc_id, writes in (side_writes or {}).items()}
+        keys = [prefix + doc_id for doc_id in updates]
+        placeholders = ", ".join("?" for _ in keys)
+        skipped: Dict[str, Exception] = {}
+        with self._lock, self._conn:
+            # 읽기 전에 쓰기 잠금을 잡아 다른 프로세스가 중간에 끼어들지 못하게 한다.
+            self._conn.execute("BEGIN IMMEDIATE")
+            rows = dict(self._conn.execute(f'SELECT id, data FROM "{table}" WHERE id IN ({placeholders})', keys).fetchall())
+            for doc_id, fields in updates.items():
+                raw = rows.get(prefix + doc_id)
+                if raw is None:
+                    skipped[doc_id] = KeyError(doc_id)
+                    continue
+                data = json.loads(raw)
+                changed = [f for f, v in ((expected or {}).get(doc_id) or {}).items() if data.get(f) != v]
+                if changed:
+                    skipped[doc_id] = ConflictError(f"{collection}/{doc_id}: {changed[0]} changed")
+                    continue
+                for field_path, value in fields.items():
+                    set_field(data, field_path, value)
+                self._conn.execute(
+                    f'UPDATE "{table}" SET data = ? WHERE id = ?',
+                    (json.dumps(data, ensure_ascii=False), prefix + doc_id),
+                )
+                self._write_side_rows(side_rows.get(doc_id) or ())
+        return skipped
+
+    def _delete(self, collection: str, doc_id: str) -> None:
+        table, prefix = self._ensure_table(collection)
+        with self._lock, self._conn:
+            self._conn.execute(f'DELETE FROM "{table}" WHERE id = ?', (prefix + doc_id,))
+
+    def _delete_many(self, collection: str, doc_ids: Sequence[str]) -> None:
+        if len(doc_ids) > BATCH_WRITE_LIMIT:
+            raise ValueError(f"too many writes in one batch: {len(doc_ids)} > {BATCH_WRITE_LIMIT}")
+        table, prefix = self._ensure_table(collection)
+        with self._lock, self._conn:
+            self._conn.executemany(f'DELETE FROM "{table}" WHERE id = ?', [(prefix + doc_id,) for doc_id in doc_ids])
+
+    def _query(
+        self,
+        collection: str,
+        filters: Sequence[Filter] = (),
+        order_by: Sequence[OrderBy] = (),
+        limit: Optional[int] = None,
+        start_after: Optional[Dict[str, Any]] = None,
+        select: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        table, prefix = self._ensure_table(collection)
+        clauses: List[str] = []
+        params: List[Any] = []
+        if prefix:
+            # "{pid}/" 로 시작하는 키 범위 ("/" 다음 문자는 "0")
+            clauses.append("id >= ? AND id < ?")
+            params.extend([prefix, prefix[:-1] + "0"])
+        for field, op, value in filters:
+            if op not in FILTER_OPS:
+                raise ValueError(f"unsupported filter op: {op}")
+            expr = _field_expr(field)
+            if op == "in":
+                values = list(value)
+                if not values:
+                    return []
+                clauses.append(f"{expr} IN ({', '.join('?' for _ in values)})")
+                params.extend(values)
+            elif op == "==" and value is None:
+                clauses.append(f"json_type(data, '{_field_path(field)}') = 'null'")
+            else:
+                clauses.append(f"{expr} {'=' if op == '==' else op} ?")
+                params.append(value)
+
+        orders: List[Tuple[str, str]] = []
+        if order_by:
+            orders = [(_field_expr(field), direction) for field, direction in order_by]
+            orders.append(("id", order_by[-1][1]))
+            # Firestore처럼 정렬 필드가 없는 문서는 결과에서 뺀다(커서 비교에 NULL이 끼지 않게).
+            clauses.extend(f"{expr} IS NOT NULL" for expr, _ in orders[:-1])
+
+        if orders and start_after is not None:
+            # (a, b, id) 다음 위치: a 뒤 OR (a 같고 b 뒤) OR (a, b 같고 id 뒤)
+            cursor = [start_after.get(field) for field, _ in order_by] + [prefix + str(start_after.get("id") or "")]
+            alternatives: List[str] = []
+            for i, (expr, direction) in enumerate(orders):
+                parts = [f"{prev} = ?" for prev, _ in orders[:i]]
+                parts.append(f"{expr} {'<' if direction == 'desc' else '>'} ?")
+                alternatives.append("(" + " AND ".join(parts) + ")")
+                params.extend(cursor[:i + 1])
+            clauses.append("(" + " OR ".join(alternatives) + ")")
+
+        fields = list(select) if select is not None else None
+        if fields is None:
+            sql = f'SELECT id, data FROM "{table}"'
+        else:
+            # json_quote(json_extract(...))는 map/배열/문자열 모두 JSON 텍스트로 돌려주므로 타입이 보존된다.
+            columns = "".join(f", json_quote({_field_expr(f)})" for f in fields)
+            sql = f'SELECT id{columns} FROM "{table}"'
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        if orders:
+            sql += " ORDER BY " + ", ".join(f"{expr} {'DESC' if d == 'desc' else 'ASC'}" for expr, d in orders)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        if fields is None:
+            return [_to_dict(row) for row in rows]
+
+        out: List[Dict[str, Any]] = []
+        for row in rows:
+            doc: Dict[str, Any] = {}
+            for field, raw in zip(fields, row[1:]):
+                value = json.loads(raw)
+                if value is not None:
+                    set_field(doc, field, value)
+            doc["id"] = row[0].rsplit("/", 1)[-1]
+            out.append(doc)
+        return out
@@ -0,0 +1,39 @@
+"""기존 inspections 문서에 lookupKey/lookupPrefix 필드를 채운다.
+
+_find_record는 자연키 필드로만 조회하므로, 필드가 없는 과거 문서는 배포 후 1회 실행해야 한다.
+
+    cd backend
+    python scripts/backfill_inspection_lookup_keys.py
+"""
+
+import asyncio
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.inspections_service import _all_records, _with_lookup_keys  # noqa: E402
+from app.storage.repository import get_repository  # noqa: E402
+
+
+async def main() -> int:
+    repo = get_repository()
+    updated = 0
+    for record in await _all_records():
+        keyed = _with_lookup_keys(record)
+        if record.get("lookupKey") == keyed["lookupKey"] and record.get("lookupPrefix") == keyed["lookupPrefix"]:
+            continue
+        await repo.set(
+            "inspections",
+            record["id"],
+            {"lookupKey": keyed["lookupKey"], "lookupPrefix": keyed["lookupPrefix"]},
+            merge=True,
+        )
+        updated += 1
+
+    print(f"OK: lookup keys updated on {updated} inspection(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,35 @@
+"""기존 users 문서에 nameKey 필드를 채운다.
+
+로그인은 nameKey + phoneLast4로 조회한다. 필드가 없는 과거 문서는 phoneLast4 전체를 훑는 호환 조회로 찾으므로,
+배포 후 1회 실행한 다음 USERS_LEGACY_LOOKUP=0으로 호환 조회를 끈다.
+
+    cd backend
+    python scripts/backfill_user_name_keys.py
+"""
+
+import asyncio
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.users_service import _name_key  # noqa: E402
+from app.storage.repository import get_repository  # noqa: E402
+
+
+async def main() -> int:
+    repo = get_repository()
+    updated = 0
+    for user in await repo.query("users"):
+        key = _name_key(user.get("name") or "")
+        if user.get("nameKey") == key:
+            continue
+        await repo.set("users", user["id"], {"nameKey": key}, merge=True)
+        updated += 1
+
+    print(f"OK: nameKey updated on {updated} user(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
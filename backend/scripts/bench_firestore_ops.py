@@ -0,0 +1,95 @@
+"""Fake Firestore로 서비스 함수별 읽기/쓰기/왕복 횟수와 소요 시간을 측정한다.
+
+네트워크/인증 없이 실행된다. 점검 문서 수를 바꿔 가며 비용이 이력 크기에 비례하는지 확인할 때 사용한다.
+
+    cd backend
+    python scripts/bench_firestore_ops.py --records 5000
+"""
+
+import argparse
+import asyncio
+import os
+from pathlib import Path
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ["STORAGE_BACKEND"] = "firestore"
+
+from app.services import inspections_service, settings_service, users_service  # noqa: E402
+from app.storage.fake_firestore import FakeFirestoreClient  # noqa: E402
+from app.storage.firestore_client import set_firestore_client  # noqa: E402
+
+WORK_TYPES = ["X-ray 설치작업", "MR 설치작업", "CT 작업", "정기 유지보수"]
+SIGNATURE = "data:image/png;base64," + "A" * 4000
+
+
+async def _seed(records: int) -> None:
+    for i in range(records):
+        await inspections_service.create_inspection_record(
+            {
+                "userName": f"worker-{i % 50}",
+                "date": f"2026-{(i // 300) % 12 + 1:02d}-{i % 28 + 1:02d}",
+                "hospital": f"hospital-{i % 7}",
+                "equipmentName": f"eq-{i}",
+                "workType": WORK_TYPES[i % len(WORK_TYPES)],
+                "answers": [{"itemId": str(n), "question": f"q{n}", "value": "YES"} for n in range(20)],
+                "signatureBase64": SIGNATURE,
+            }
+        )
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=2000)
+    args = parser.parse_args()
+
+    fake = FakeFirestoreClient()
+    set_firestore_client(fake)
+    await _seed(args.records)
+    sample = (await inspections_service._all_records())[0]
+
+    cases = [
+        ("login_user", lambda: users_service.login_user("worker-1", "1234")),
+        ("get_hospitals", settings_service.get_hospitals),
+        ("list_admin_inspections (1 month)", lambda: inspections_service.list_admin_inspections("2026-01-01", "2026-01-31")),
+        (
+            "list_admin_inspections (1 month, summary)",
+            lambda: inspections_service.list_admin_inspections("2026-01-01", "2026-01-31", summary=True),
+        ),
+        (
+            "list_admin_inspections (SUB_ADMIN, 1 category)",
+            lambda: inspections_service.list_admin_inspections("2026-01-01", "2026-01-31", "SUB_ADMIN", [WORK_TYPES[0]]),
+        ),
+        ("list_my_inspections", lambda: inspections_service.list_my_inspections("worker-1")),
+        (
+            "get_my_inspection_detail",
+            lambda: inspections_service.get_my_inspection_detail(
+                sample["userName"], sample["date"], sample["hospital"], sample["equipmentName"]
+            ),
+        ),
+        (
+            "add_revision",
+            lambda: inspections_service.add_revision(
+                sample["userName"], sample["date"], sample["hospital"], sample["equipmentName"], [], SIGNATURE
+            ),
+        ),
+        ("list_inspection_revisions", lambda: inspections_service.list_inspection_revisions(sample["id"])),
+        ("can_subadmin_handle_inspection", lambda: inspections_service.can_subadmin_handle_inspection(sample["id"], WORK_TYPES)),
+        ("approve_inspection", lambda: inspections_service.approve_inspection(sample["id"], "sub", SIGNATURE)),
+    ]
+
+    print(f"records={args.records}")
+    print(f"{'operation':<48}{'reads':>8}{'writes':>8}{'rtt':>6}{'bytes_r':>10}{'bytes_w':>10}{'ms':>10}")
+    for name, fn in cases:
+        fake.reset_stats()
+        started = time.perf_counter()
+        await fn()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        s = fake.stats
+        print(f"{name:<48}{s.reads:>8}{s.writes:>8}{s.round_trips:>6}{s.bytes_read:>10}{s.bytes_written:>10}{elapsed_ms:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,58 @@
+"""inspections 문서에 inline으로 저장된 서명(base64)을 signatures 컬렉션으로 옮긴다.
+
+새로 저장되는 문서는 서명 ref만 갖는다. 과거 문서는 읽을 때도 그대로 동작하지만,
+문서 크기를 줄이려면 배포 후 1회 실행한다.
+
+    cd backend
+    python scripts/migrate_inline_signatures.py
+"""
+
+import asyncio
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.inspections_service import _all_records, _externalize_signatures  # noqa: E402
+from app.storage.repository import DELETE_FIELD, ConflictError, get_repository  # noqa: E402
+
+
+def _has_inline_signature(record: dict) -> bool:
+    if record.get("signatureBase64") or record.get("subadminSignatureBase64"):
+        return True
+    revisions = list(record.get("revisions") or []) + [record.get("latestRevision") or {}]
+    return any(rev.get("signatureBase64") for rev in revisions)
+
+
+def _changed_fields(before: dict, after: dict) -> dict:
+    changes = {field: value for field, value in after.items() if before.get(field) != value}
+    changes.update({field: DELETE_FIELD for field in before if field not in after})
+    return changes
+
+
+async def main() -> int:
+    repo = get_repository()
+    migrated = skipped = 0
+    for record in await _all_records():
+        if not _has_inline_signature(record):
+            continue
+        changes = _changed_fields(record, await _externalize_signatures(record))
+        try:
+            # 읽은 뒤 승인/반려/재제출된 문서는 덮어쓰지 않고 건너뛴다(다시 실행하면 처리된다).
+            await repo.update(
+                "inspections",
+                record["id"],
+                changes,
+                expected={"status": record.get("status"), "updatedAt": record.get("updatedAt")},
+            )
+        except (ConflictError, KeyError):
+            skipped += 1
+            continue
+        migrated += 1
+
+    print(f"OK: signatures moved out of {migrated} inspection(s), skipped {skipped} changed during migration")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
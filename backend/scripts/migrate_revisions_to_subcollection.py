@@ -0,0 +1,44 @@
+"""inspections 문서의 revisions 배열을 inspections/{id}/revisions 하위 컬렉션으로 옮긴다.
+
+재제출(add_revision) 시에도 문서 단위로 옮겨지지만, 문서 크기를 한 번에 줄이려면 배포 후 1회 실행한다.
+
+    cd backend
+    python scripts/migrate_revisions_to_subcollection.py
+"""
+
+import asyncio
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.inspections_service import _all_records, _move_embedded_revisions  # noqa: E402
+from app.storage.repository import DELETE_FIELD, ConflictError, get_repository  # noqa: E402
+
+
+async def main() -> int:
+    repo = get_repository()
+    migrated = skipped = 0
+    for record in await _all_records():
+        if "revisions" not in record:
+            continue
+        expected = {"status": record.get("status"), "updatedAt": record.get("updatedAt")}
+        # revision 문서 id는 배열 항목의 id 그대로이므로, 건너뛴 문서를 다시 옮겨도 같은 문서를 덮어쓴다.
+        await _move_embedded_revisions(record)
+        changes = {"revisions": DELETE_FIELD, "revisionCount": record["revisionCount"]}
+        if "latestRevision" in record:
+            changes["latestRevision"] = record["latestRevision"]
+        try:
+            # 읽은 뒤 승인/반려/재제출된 문서는 덮어쓰지 않고 건너뛴다(다시 실행하면 처리된다).
+            await repo.update("inspections", record["id"], changes, expected=expected)
+        except (ConflictError, KeyError):
+            skipped += 1
+            continue
+        migrated += 1
+
+    print(f"OK: revisions moved to subcollection on {migrated} inspection(s), skipped {skipped} changed during migration")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
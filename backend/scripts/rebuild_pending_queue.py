@@ -0,0 +1,26 @@
+"""승인 대기 큐(inspection_queue)를 PENDING 점검 기준으로 다시 만든다.
+
+큐는 점검 쓰기 경로에서 함께 갱신되므로, 배포 직후(기존 PENDING 건 채우기) 또는
+쓰기 도중 실패로 큐가 어긋났을 때만 실행하면 된다. 여러 번 실행해도 결과는 같다.
+
+    cd backend
+    python scripts/rebuild_pending_queue.py
+"""
+
+import asyncio
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.inspections_service import rebuild_pending_queue  # noqa: E402
+
+
+async def main() -> int:
+    written, removed = await rebuild_pending_queue()
+    print(f"OK: {written} pending inspection(s) queued, {removed} stale queue entr(ies) removed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
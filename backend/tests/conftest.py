@@ -0,0 +1,41 @@
+"""서비스 테스트 공통 fixture.
+
+`storage` fixture는 같은 테스트를 Fake Firestore(FirestoreRepository + FakeFirestoreClient)와
+SQLite(임시 파일) 두 저장소에서 각각 실행한다. 네트워크/인증 없이 동작한다.
+
+    cd backend
+    python -m pytest -q
+"""
+
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services import checklists_service, settings_service, signatures_service, users_service  # noqa: E402
+from app.storage import repository  # noqa: E402
+from app.storage.fake_firestore import FakeFirestoreClient  # noqa: E402
+from app.storage.firestore_client import set_firestore_client  # noqa: E402
+
+
+@pytest.fixture(params=["firestore", "sqlite"])
+def storage(request, tmp_path, monkeypatch):
+    monkeypatch.setattr(repository, "STORAGE_BACKEND", request.param)
+    monkeypatch.setattr(repository, "SQLITE_PATH", str(tmp_path / "test.db"))
+    repository.get_repository.cache_clear()
+    set_firestore_client(FakeFirestoreClient())
+    # 저장이 확인된 서명 ref 캐시가 이전 테스트의 저장소를 가리키지 않게 비운다.
+    with signatures_service._lock:
+        signatures_service._known_refs.clear()
+        signatures_service._blob_cache.clear()
+    checklists_service._cache.invalidate()
+    settings_service._cache.invalidate()
+    users_service._login_cache.invalidate()
+    users_service._subadmin_cache.invalidate()
+
+    yield repository.get_repository()
+
+    set_firestore_client(None)
+    repository.get_repository.cache_clear()
@@ -0,0 +1,31 @@
+"""테스트 공통 도우미 (점검 제출/조회)."""
+
+import asyncio
+
+from app.services import inspections_service as svc
+
+SIGNATURE = "data:image/png;base64," + "A" * 80
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def submit(user_name="worker", equipment_name="eq-1", work_type="CT", date="2026-10-01"):
+    return run(
+        svc.create_inspection_record(
+            {
+                "userName": user_name,
+                "date": date,
+                "hospital": "H",
+                "equipmentName": equipment_name,
+                "workType": work_type,
+                "answers": [{"itemId": "1", "question": "q1", "value": "YES"}],
+                "signatureBase64": SIGNATURE,
+            }
+        )
+    )
+
+
+def get_record(rec_id):
+    return run(svc._get_record(rec_id))
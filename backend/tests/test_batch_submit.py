@@ -0,0 +1,50 @@
+"""오프라인 작성분 일괄 제출(POST /inspections/batch)의 항목별 결과를 두 저장소에서 확인한다."""
+
+from app.routers.inspections import InspectionBatchRequest, submit_inspections_batch
+from app.services import inspections_service as svc
+from helpers import SIGNATURE, get_record, run
+
+
+def _item(equipment_name, **extra):
+    return {
+        "userName": "worker",
+        "date": "2026-10-01",
+        "hospital": "H",
+        "equipmentName": equipment_name,
+        "workType": "CT",
+        "answers": [{"itemId": "1", "question": "q1", "value": "YES"}],
+        "signatureBase64": SIGNATURE,
+        **extra,
+    }
+
+
+def test_batch_reports_invalid_items_and_saves_the_rest(storage):
+    invalid = _item("b")
+    del invalid["workType"]
+
+    res = run(submit_inspections_batch(InspectionBatchRequest(items=[_item("a"), invalid, _item("c")])))
+
+    assert (res["status"], res["succeeded"], res["failed"]) == ("partial", 2, 1)
+    assert [(i["index"], i["status"]) for i in res["items"]] == [(0, "ok"), (1, "error"), (2, "ok")]
+    assert "workType" in res["items"][1]["error"]
+    saved = [i["id"] for i in res["items"] if i["status"] == "ok"]
+    assert all(get_record(rec_id)["status"] == svc.STATUS_PENDING for rec_id in saved)
+    assert sorted(i["id"] for i in run(svc.list_pending_queue())["items"]) == sorted(saved)
+
+
+def test_failed_write_batch_only_fails_its_own_items(storage, monkeypatch):
+    # 점검 하나가 batch 하나가 되도록 줄이고, 두 번째 batch만 실패시킨다.
+    monkeypatch.setattr(svc, "BATCH_WRITE_LIMIT", 3)
+    set_many = storage.set_many
+
+    async def fail_second_record(writes):
+        if any(doc.get("equipmentName") == "b" for collection, _, doc in writes if collection == "inspections"):
+            raise RuntimeError("batch failed")
+        await set_many(writes)
+
+    monkeypatch.setattr(storage, "set_many", fail_second_record)
+    items = run(svc.create_inspection_records([_item("a"), _item("b"), _item("c")]))
+
+    assert ["id" in i for i in items] == [True, False, True]
+    assert items[1] == {"error": "batch failed"}
+    assert {r["equipmentName"] for r in run(storage.query("inspections"))} == {"a", "c"}
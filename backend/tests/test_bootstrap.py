@@ -0,0 +1,36 @@
+"""bootstrap 응답의 version/ETag 재검증을 두 저장소에서 확인한다."""
+
+from fastapi import Response
+
+from app.routers.bootstrap import api_get_bootstrap
+from app.services import checklists_service, settings_service
+from helpers import run
+
+
+def _get(if_none_match=None):
+    response = Response()
+    body = run(api_get_bootstrap(response, if_none_match))
+    return body, response
+
+
+def test_unchanged_bootstrap_revalidates_with_304(storage):
+    body, response = _get()
+    assert response.headers["ETag"] == f'W/"{body["version"]}"'
+    assert set(body["checklists"]) == set(body["workTypes"])
+
+    not_modified, _ = _get(response.headers["ETag"])
+    assert isinstance(not_modified, Response) and not_modified.status_code == 304
+
+
+def test_bootstrap_version_changes_with_checklist_and_settings(storage):
+    first, _ = _get()
+    work_type = first["workTypes"][0]
+
+    run(checklists_service.update_checklist("admin", work_type, [{"id": "a", "text": "new item", "order": 1}]))
+    second, _ = _get(f'W/"{first["version"]}"')
+    assert second["version"] != first["version"]
+    assert second["checklists"][work_type]["items"][0]["text"] == "new item"
+
+    run(settings_service.update_hospitals("admin", ["H1"]))
+    third, _ = _get(f'W/"{second["version"]}"')
+    assert third["version"] != second["version"] and third["hospitals"] == ["H1"]
@@ -0,0 +1,57 @@
+"""일괄 승인·반려의 건별 결과를 두 저장소에서 확인한다."""
+
+from app.routers.inspections import BulkApproveRequest, bulk_approve
+from app.services import inspections_service as svc
+from helpers import SIGNATURE, get_record, run, submit
+
+
+def test_bulk_approve_reports_each_outcome(storage):
+    ok = submit(equipment_name="a")
+    cancelled = submit(equipment_name="b")
+    other_category = submit(equipment_name="c", work_type="MR")
+    run(svc.cancel_my_inspection("worker", "2026-10-01", "H", "b"))
+
+    items = run(
+        svc.approve_inspections(
+            [ok["id"], cancelled["id"], "missing", other_category["id"], ok["id"]], "sub", SIGNATURE, ["CT"]
+        )
+    )
+
+    assert [(i["id"], i["status"]) for i in items] == [
+        (ok["id"], "ok"),
+        (cancelled["id"], "conflict"),
+        ("missing", "not_found"),
+        (other_category["id"], "forbidden"),
+    ]
+    assert get_record(ok["id"])["status"] == svc.STATUS_SUBMITTED
+    assert get_record(other_category["id"])["status"] == svc.STATUS_PENDING
+    queue_ids = [i["id"] for i in run(svc.list_pending_queue())["items"]]
+    assert ok["id"] not in queue_ids and other_category["id"] in queue_ids
+
+
+def test_bulk_reject_skips_records_changed_after_read(storage, monkeypatch):
+    first = submit(equipment_name="a")
+    second = submit(equipment_name="b")
+    get_many = storage.get_many
+
+    async def get_many_then_concurrent_approve(collection, doc_ids):
+        docs = await get_many(collection, doc_ids)
+        # 읽은 뒤 다른 요청이 second를 먼저 승인한 상황
+        await svc.approve_inspection(second["id"], "other", SIGNATURE)
+        return docs
+
+    monkeypatch.setattr(storage, "get_many", get_many_then_concurrent_approve)
+    items = run(svc.reject_inspections([first["id"], second["id"]], "sub", "bad"))
+
+    assert [i["status"] for i in items] == ["ok", "conflict"]
+    assert get_record(first["id"])["status"] == svc.STATUS_REJECTED
+    assert get_record(second["id"])["status"] == svc.STATUS_SUBMITTED
+
+
+def test_bulk_approve_endpoint_returns_partial(storage):
+    ok = submit(equipment_name="a")
+    body = BulkApproveRequest(ids=[ok["id"], "missing"], subadminName="sub", signatureBase64=SIGNATURE)
+
+    res = run(bulk_approve(body))
+
+    assert (res["status"], res["succeeded"], res["failed"]) == ("partial", 1, 1)
@@ -0,0 +1,55 @@
+"""TTLCache의 read-through와 invalidate 세대 확인."""
+
+import asyncio
+
+from app.core.cache import TTLCache
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_get_or_load_caches_loaded_value():
+    cache = TTLCache(60)
+    calls = []
+
+    async def load():
+        calls.append(1)
+        return "v1"
+
+    assert run(cache.get_or_load("k", load)) == "v1"
+    assert run(cache.get_or_load("k", load)) == "v1"
+    assert len(calls) == 1
+
+
+def test_loader_started_before_invalidate_does_not_store_stale_value():
+    cache = TTLCache(60)
+
+    async def scenario():
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_load():
+            started.set()
+            await release.wait()
+            return "stale"
+
+        task = asyncio.create_task(cache.get_or_load("k", slow_load))
+        await started.wait()
+        cache.invalidate("k")  # 로드 중에 다른 요청이 값을 바꿨다
+        release.set()
+        return await task
+
+    assert run(scenario()) == "stale"
+    assert cache.get("k") is None
+
+
+def test_set_with_old_generation_is_skipped():
+    cache = TTLCache(60)
+    generation = cache.generation
+    cache.invalidate()
+
+    cache.set("k", "stale", generation)
+    assert cache.get("k") is None
+
+    cache.set("k", "fresh", cache.generation)
+    assert cache.get("k") == "fresh"
@@ -0,0 +1,46 @@
+"""since 증분 동기화(list_my_inspection_changes)를 두 저장소에서 확인한다."""
+
+from app.services import inspections_service as svc
+from helpers import SIGNATURE, get_record, run, submit
+
+
+def test_changes_since_returns_only_new_changes_and_tombstones(storage):
+    a = submit(equipment_name="a")
+    b = submit(equipment_name="b")
+    submit(equipment_name="c")
+    submit(user_name="someone-else")
+
+    full = run(svc.list_my_inspection_changes("worker", None))
+    assert len(full["items"]) == 3 and not full["tombstones"] and not full["hasMore"]
+
+    idle = run(svc.list_my_inspection_changes("worker", full["nextSince"]))
+    assert idle["items"] == [] and idle["tombstones"] == [] and idle["nextSince"] == full["nextSince"]
+
+    run(svc.cancel_my_inspection("worker", "2026-10-01", "H", "a"))
+    run(svc.add_revision("worker", "2026-10-01", "H", "b", [], SIGNATURE))
+    delta = run(svc.list_my_inspection_changes("worker", full["nextSince"]))
+
+    assert [i["id"] for i in delta["items"]] == [b["id"]]
+    assert [(t["id"], t["status"]) for t in delta["tombstones"]] == [(a["id"], svc.STATUS_CANCELLED)]
+
+
+def test_changes_since_pages_with_has_more(storage):
+    ids = {submit(equipment_name=f"e{i}")["id"] for i in range(3)}
+
+    seen, since = [], None
+    while True:
+        page = run(svc.list_my_inspection_changes("worker", since, limit=2))
+        seen += [i["id"] for i in page["items"]]
+        since = page["nextSince"]
+        if not page["hasMore"]:
+            break
+    assert sorted(seen) == sorted(ids)
+
+
+def test_changes_since_accepts_plain_updated_at_inclusive(storage):
+    rec = submit()
+    updated_at = get_record(rec["id"])["updatedAt"]
+
+    res = run(svc.list_my_inspection_changes("worker", updated_at))
+
+    assert [i["id"] for i in res["items"]] == [rec["id"]]
@@ -0,0 +1,53 @@
+"""체크리스트 ETag/304 재검증과 캐시 무효화를 두 저장소에서 확인한다."""
+
+from fastapi import Response
+
+from app.routers.checklists import api_get_checklist
+from app.services import checklists_service as svc
+from helpers import run
+
+ITEMS = [{"id": "a", "text": "new item", "order": 1}]
+
+
+def _get(if_none_match=None):
+    response = Response()
+    body = run(api_get_checklist("CT", response, if_none_match))
+    return body, response
+
+
+def test_unchanged_checklist_revalidates_with_304(storage):
+    body, response = _get()
+    etag = response.headers["ETag"]
+    assert body["version"] == 1 and response.headers["Cache-Control"] == "no-cache"
+
+    not_modified, _ = _get(etag)
+    assert isinstance(not_modified, Response) and not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == etag
+
+
+def test_updated_checklist_returns_new_version_for_old_etag(storage):
+    _, response = _get()
+    old_etag = response.headers["ETag"]
+
+    run(svc.update_checklist("admin", "CT", ITEMS))
+    body, response = _get(old_etag)
+
+    assert body["version"] == 2 and body["items"][0]["text"] == "new item"
+    assert response.headers["ETag"] != old_etag
+
+
+def test_bulk_load_racing_an_update_is_not_cached(storage, monkeypatch):
+    run(svc.get_checklist("CT"))
+    svc._cache.invalidate()
+    get_many = storage.get_many
+
+    async def get_many_then_concurrent_update(collection, doc_ids):
+        docs = await get_many(collection, doc_ids)
+        # 읽은 뒤 관리자가 체크리스트를 바꾼 상황
+        await svc.update_checklist("admin", "CT", ITEMS)
+        return docs
+
+    monkeypatch.setattr(storage, "get_many", get_many_then_concurrent_update)
+    assert run(svc.get_checklists(["CT"]))["CT"]["version"] == 1
+
+    assert run(svc.get_checklist("CT"))["version"] == 2
@@ -0,0 +1,78 @@
+"""점검 변경 SSE 피드(GET /inspections/stream)를 두 저장소에서 확인한다."""
+
+import asyncio
+import json
+
+from app.core.events import EventBroker
+from app.routers.inspections import stream_inspections
+from app.services import inspection_events
+from app.services import inspections_service as svc
+from helpers import SIGNATURE, run
+
+
+def _payload(equipment_name, work_type):
+    return {
+        "userName": "worker",
+        "date": "2026-10-01",
+        "hospital": "H",
+        "equipmentName": equipment_name,
+        "workType": work_type,
+        "answers": [{"itemId": "1", "question": "q1", "value": "YES"}],
+        "signatureBase64": SIGNATURE,
+    }
+
+
+def _parse(chunk):
+    lines = dict(line.split(": ", 1) for line in chunk.strip().split("\n"))
+    return lines["event"], json.loads(lines["data"])
+
+
+def test_stream_pushes_visible_changes_and_unsubscribes_on_close(storage):
+    async def scenario():
+        response = await stream_inspections(requester_role="SUB_ADMIN", requester_categories="CT")
+        assert response.media_type == "text/event-stream"
+        body = response.body_iterator
+        assert await body.__anext__() == "retry: 3000\n\n"
+
+        pending = asyncio.ensure_future(body.__anext__())
+        while inspection_events._broker.subscriber_count == 0:
+            await asyncio.sleep(0)
+        await svc.create_inspection_record(_payload("mr", "MR"))  # 담당이 아닌 작업 종류
+        ct = await svc.create_inspection_record(_payload("ct", "CT"))
+        created = _parse(await asyncio.wait_for(pending, 1))
+
+        await svc.approve_inspection(ct["id"], "sub", SIGNATURE)
+        approved = _parse(await asyncio.wait_for(body.__anext__(), 1))
+
+        await body.aclose()
+        return created, approved
+
+    created, approved = run(scenario())
+
+    assert created[0] == "created" and created[1]["equipmentName"] == "ct"
+    assert "answers" not in created[1] and "signatureRef" not in created[1]
+    assert approved[0] == "approved" and approved[1]["status"] == svc.STATUS_SUBMITTED
+    assert inspection_events._broker.subscriber_count == 0
+
+
+def test_changes_feed_sends_keepalive_when_idle():
+    async def scenario():
+        feed = inspection_events.inspection_changes(keepalive_seconds=0.01)
+        first = await feed.__anext__()
+        await feed.aclose()
+        return first
+
+    assert run(scenario()) is None
+    assert inspection_events._broker.subscriber_count == 0
+
+
+def test_slow_subscriber_keeps_only_latest_events():
+    async def scenario():
+        broker = EventBroker(max_queue=2)
+        queue = broker.subscribe()
+        for i in range(3):
+            broker.publish({"n": i})
+        await asyncio.sleep(0)
+        return [queue.get_nowait()["n"] for _ in range(queue.qsize())]
+
+    assert run(scenario()) == [1, 2]
@@ -0,0 +1,142 @@
+"""엑셀 내보내기(GET /inspections/export)와 템플릿 캐시, 컴파일한 템플릿으로 찍은 시트를 확인한다."""
+
+import io
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+
+from openpyxl import load_workbook
+from openpyxl.cell.cell import MergedCell
+
+from app.routers.inspections import EXCEL_TEMPLATE_PATH, export_inspections
+from app.services import excel_export_service as excel
+from helpers import run, submit
+
+
+def _export(**kwargs):
+    async def scenario():
+        response = await export_inspections("admin", "2026-10-01", "2026-10-31", **kwargs)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        return response, body
+
+    return run(scenario())
+
+
+def test_export_template_file_exists():
+    # 예전에는 없는 파일(EHS_Checklist_HB.xlsx)을 찾아 내보내기가 항상 500이었다.
+    assert EXCEL_TEMPLATE_PATH.is_file()
+
+
+def test_export_streams_one_sheet_per_record(storage):
+    submit(user_name="kim", equipment_name="a", work_type="CT")
+    submit(user_name="lee", equipment_name="b", work_type="MR")
+    submit(user_name="park", equipment_name="c", work_type="CT")
+
+    response, body = _export(requester_role="SUB_ADMIN", requester_categories="CT")
+
+    assert response.headers["Content-Length"] == str(len(body))
+    assert response.headers["Content-Disposition"].startswith("attachment; filename=safety_report_2026-10-01_")
+    wb = load_workbook(io.BytesIO(body))
+    assert sorted(wb.sheetnames) == ["2026-10-01_kim", "2026-10-01_park"]
+    assert (wb["2026-10-01_kim"]["C4"].value, wb["2026-10-01_park"]["C4"].value) == ("a", "c")
+
+
+def test_export_without_records_still_returns_a_workbook(storage):
+    _, body = _export()
+
+    assert len(load_workbook(io.BytesIO(body)).worksheets) == 1
+
+
+def test_iter_file_chunks_closes_the_file():
+    fp = io.BytesIO(b"x" * 10)
+
+    assert list(excel.iter_file_chunks(fp, chunk_size=4)) == [b"xxxx", b"xxxx", b"xx"]
+    assert fp.closed
+
+
+def _count_template_loads(monkeypatch):
+    calls = []
+    load = excel._load_template_safe
+
+    def counting(path):
+        calls.append(path)
+        return load(path)
+
+    monkeypatch.setattr(excel, "_load_template_safe", counting)
+    return calls
+
+
+def test_template_is_loaded_once_per_file_version(tmp_path, monkeypatch):
+    path = tmp_path / "template.xlsx"
+    shutil.copyfile(EXCEL_TEMPLATE_PATH, path)
+    calls = _count_template_loads(monkeypatch)
+
+    first = excel.load_excel_template(str(path))
+    assert excel.load_excel_template(str(path)) is first
+    assert len(calls) == 1
+
+    # 템플릿 파일을 바꾸면(수정 시각이 달라지면) 다시 읽는다.
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert excel.load_excel_template(str(path)) is not first
+    assert len(calls) == 2
+
+
+def test_concurrent_exports_share_the_cached_template(tmp_path, monkeypatch):
+    path = tmp_path / "template.xlsx"
+    shutil.copyfile(EXCEL_TEMPLATE_PATH, path)
+    calls = _count_template_loads(monkeypatch)
+    record = {"date": "2026-10-01", "userName": "kim", "equipmentName": "ct-1", "results": []}
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        outputs = list(pool.map(lambda _: excel.build_inspections_excel_bytes([record], str(path)), range(8)))
+
+    assert len(calls) == 1
+    assert all(load_workbook(io.BytesIO(out))["2026-10-01_kim"]["C4"].value == "ct-1" for out in outputs)
+
+
+RECORD = {
+    "date": "2026-10-01",
+    "userName": "kim",
+    "hospital": "H",
+    "equipmentName": "ct-1",
+    "workType": "CT",
+    "results": [{"question": "q1", "value": "YES", "comment": "ok"}],
+}
+
+
+def _style(cell):
+    return (copy(cell.font), copy(cell.border), copy(cell.fill), copy(cell.alignment), cell.number_format, copy(cell.protection))
+
+
+def test_compiled_template_stamps_record_values_and_template_styles():
+    template_ws = excel._load_template_safe(str(EXCEL_TEMPLATE_PATH))["Sheet1"]
+    out = excel.build_inspections_excel_bytes([RECORD, dict(RECORD, userName="lee")], str(EXCEL_TEMPLATE_PATH))
+    wb = load_workbook(io.BytesIO(out))
+
+    assert wb.sheetnames == ["2026-10-01_kim", "2026-10-01_lee"]
+    ws = wb["2026-10-01_kim"]
+    assert [ws[c].value for c in ("B1", "B2", "B3", "B4", "C4")] == [" 2026-10-01", "kim", "H", "CT", "ct-1"]
+    assert [ws[c].value for c in ("A7", "B7", "C7", "D7")] == [1, "q1", "YES", "ok"]
+
+    # 스타일/병합/크기는 템플릿 그대로다(레코드 값을 쓴 셀 포함).
+    for row in template_ws.iter_rows():
+        for cell in row:
+            # 병합 범위 안쪽 셀은 다시 읽을 때 MergedCell(기본 스타일)이 되므로 비교하지 않는다.
+            if cell.has_style and not isinstance(ws[cell.coordinate], MergedCell):
+                assert _style(ws[cell.coordinate]) == _style(cell), cell.coordinate
+    assert {str(r) for r in ws.merged_cells.ranges} == {str(r) for r in template_ws.merged_cells.ranges}
+    assert ws.column_dimensions["B"].width == template_ws.column_dimensions["B"].width
+    assert ws.row_dimensions[2].height == 52.0
+
+
+def test_template_styles_are_compiled_once_and_shared_by_sheets():
+    template = excel.load_excel_template(str(EXCEL_TEMPLATE_PATH))
+    styled_cells = sum(1 for _, style_id in template.cells.values() if style_id is not None)
+    assert len(template.styles) < styled_cells
+
+    writer = excel.InspectionsExcelWriter(str(EXCEL_TEMPLATE_PATH))
+    writer.add_records([RECORD] * 3)
+    assert len(writer._style_arrays) == len({s for _, s in template.cells.values() if s is not None})
+    writer.finish().close()
@@ -0,0 +1,47 @@
+"""커서 페이지 조회(limit/cursor)를 두 저장소에서 확인한다."""
+
+import pytest
+from fastapi import HTTPException
+
+from app.routers.inspections import admin_list_inspections, me_list_inspections
+from app.services import inspections_service as svc
+from helpers import run, submit
+
+
+def test_admin_pages_cover_every_record_once_in_order(storage):
+    for i, date in enumerate(["2026-10-01", "2026-10-02", "2026-10-02", "2026-10-03", "2026-10-05"]):
+        submit(equipment_name=f"e{i}", date=date)
+
+    seen, cursor = [], None
+    while True:
+        page = run(svc.list_admin_inspections_page("2026-10-01", "2026-10-04", limit=2, cursor=cursor))
+        assert len(page["items"]) <= 2
+        seen += page["items"]
+        cursor = page["nextCursor"]
+        if not cursor:
+            break
+
+    assert len({i["id"] for i in seen}) == len(seen) == 4
+    assert [i["date"] for i in seen] == ["2026-10-03", "2026-10-02", "2026-10-02", "2026-10-01"]
+
+
+def test_me_pages_follow_cursor(storage):
+    ids = {submit(equipment_name=f"e{i}")["id"] for i in range(3)}
+    submit(user_name="someone-else")
+
+    first = run(me_list_inspections("worker", limit=2))
+    second = run(me_list_inspections("worker", limit=2, cursor=first["nextCursor"]))
+
+    assert second["nextCursor"] is None
+    assert {i["id"] for i in first["items"] + second["items"]} == ids
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "WzFd"])
+def test_invalid_cursor_is_400(storage, cursor):
+    with pytest.raises(HTTPException) as exc:
+        run(admin_list_inspections("admin", "2026-10-01", "2026-10-31", limit=10, cursor=cursor))
+    assert exc.value.status_code == 400
+
+    with pytest.raises(HTTPException) as exc:
+        run(me_list_inspections("worker", limit=10, cursor=cursor))
+    assert exc.value.status_code == 400
@@ -0,0 +1,97 @@
+"""승인 대기 큐(inspection_queue)가 점검 상태와 함께 바뀌는지 두 저장소에서 확인한다."""
+
+import pytest
+from fastapi import HTTPException
+
+from app.routers.inspections import subadmin_queue
+from app.services import inspections_service as svc
+from app.storage.firestore_client import get_firestore_client
+from app.storage.firestore_repository import FirestoreRepository
+from helpers import SIGNATURE, run, submit
+
+
+def _queue_ids(**kwargs):
+    return [i["id"] for i in run(subadmin_queue(**kwargs))["items"]]
+
+
+def test_create_writes_record_revision_and_queue_in_one_batch(storage):
+    if not isinstance(storage, FirestoreRepository):
+        pytest.skip("Fake Firestore 호출 횟수로 확인한다")
+    run(svc.store_signature(SIGNATURE))
+    stats = get_firestore_client().stats
+    stats.reset()
+
+    rec = submit()
+
+    assert (stats.writes, stats.round_trips) == (3, 1)
+    assert _queue_ids() == [rec["id"]]
+
+
+def test_subadmin_queue_is_filtered_by_category(storage):
+    ct = submit(equipment_name="a", work_type="CT")
+    mr = submit(equipment_name="b", work_type="MR")
+    xr = submit(equipment_name="c", work_type="XR")
+
+    assert _queue_ids(requester_role="SUB_ADMIN", requester_categories="CT, MR") == [ct["id"], mr["id"]]
+    assert _queue_ids(requester_role="SUB_ADMIN", requester_categories="XR") == [xr["id"]]
+    assert _queue_ids(requester_role="MASTER_ADMIN", requester_categories="CT") == [ct["id"], mr["id"], xr["id"]]
+
+
+def test_subadmin_queue_pages_and_rejects_bad_cursor(storage):
+    ids = [submit(equipment_name=f"e{i}")["id"] for i in range(3)]
+
+    first = run(subadmin_queue(limit=2))
+    second = run(subadmin_queue(limit=2, cursor=first["nextCursor"]))
+    assert [i["id"] for i in first["items"] + second["items"]] == ids and second["nextCursor"] is None
+
+    with pytest.raises(HTTPException) as exc:
+        run(subadmin_queue(limit=2, cursor="WzFd"))
+    assert exc.value.status_code == 400
+
+
+def _pending_ids(storage):
+    return sorted(r["id"] for r in run(storage.query("inspections", [("status", "==", svc.STATUS_PENDING)])))
+
+
+def test_queue_follows_every_status_change(storage):
+    a = submit(equipment_name="a")
+    b = submit(equipment_name="b")
+    c = submit(equipment_name="c")
+
+    run(svc.approve_inspection(a["id"], "sub", SIGNATURE))
+    run(svc.reject_inspection(b["id"], "sub", "bad"))
+    assert sorted(_queue_ids()) == _pending_ids(storage) == [c["id"]]
+
+    run(svc.add_revision("worker", "2026-10-01", "H", "b", [], SIGNATURE))
+    run(svc.cancel_my_inspection("worker", "2026-10-01", "H", "c"))
+    assert sorted(_queue_ids()) == _pending_ids(storage) == [b["id"]]
+
+    run(svc.reject_inspections([b["id"]], "sub", "again"))
+    assert _queue_ids() == _pending_ids(storage) == []
+
+
+def test_queue_is_written_in_the_status_transaction(storage, monkeypatch):
+    a = submit(equipment_name="a")
+    b = submit(equipment_name="b")
+
+    async def separate_write(*args, **kwargs):
+        raise AssertionError("queue must not be written outside the status update")
+
+    for name in ("set", "set_many", "delete", "delete_many"):
+        monkeypatch.setattr(storage, name, separate_write)
+    run(svc.approve_inspection(a["id"], "sub", None))
+    run(svc.approve_inspections([b["id"]], "sub", None))
+
+    assert _queue_ids() == []
+
+
+def test_conflicting_transition_leaves_queue_untouched(storage):
+    rec = submit()
+    stale = run(svc._get_record(rec["id"]))
+    run(svc.reject_inspection(rec["id"], "sub", "bad"))
+    run(svc.add_revision("worker", "2026-10-01", "H", "eq-1", [], SIGNATURE))
+
+    with pytest.raises(svc.InspectionConflictError):
+        run(svc._transition(stale, svc.STATUS_SUBMITTED, {"updatedAt": "later"}))
+
+    assert _queue_ids() == [rec["id"]]
@@ -0,0 +1,73 @@
+"""재제출(add_revision)의 revision 쓰기 순서와 예전 문서 정리를 두 저장소에서 확인한다."""
+
+import pytest
+
+from app.services import inspections_service as svc
+from app.services.inspections_service import InspectionConflictError
+from helpers import SIGNATURE, get_record, run, submit
+
+
+def _revision_seqs(rec_id):
+    return [rev["seq"] for rev in run(svc.list_inspection_revisions(rec_id))["items"]]
+
+
+def test_add_revision_conflict_leaves_no_orphan_revision(storage, monkeypatch):
+    rec = submit()
+    run(svc.reject_inspection(rec["id"], "sub", "bad"))
+    find_record = svc._find_record
+
+    async def find_then_concurrent_cancel(*args):
+        found = await find_record(*args)
+        await storage.update("inspections", rec["id"], {"status": svc.STATUS_CANCELLED, "updatedAt": "later"})
+        return found
+
+    monkeypatch.setattr(svc, "_find_record", find_then_concurrent_cancel)
+    with pytest.raises(InspectionConflictError):
+        run(svc.add_revision("worker", "2026-10-01", "H", "eq-1", [], SIGNATURE))
+
+    assert get_record(rec["id"])["status"] == svc.STATUS_CANCELLED
+    assert _revision_seqs(rec["id"]) == [1]
+
+
+def _save_legacy(storage, rec_id, equipment_name):
+    # 예전 형식: revisions 배열과 inline 서명이 부모 문서에 들어 있다.
+    record = {
+        "userName": "worker",
+        "date": "2026-10-01",
+        "hospital": "H",
+        "equipmentName": equipment_name,
+        "workType": "CT",
+        "status": svc.STATUS_REJECTED,
+        "updatedAt": "t0",
+        "revisions": [{"id": f"{rec_id}-old", "answers": [], "signatureBase64": SIGNATURE, "createdAt": "t0"}],
+    }
+    run(storage.set("inspections", rec_id, svc._with_lookup_keys(record)))
+
+
+def test_add_revision_moves_legacy_revisions(storage):
+    _save_legacy(storage, "legacy-1", "a")
+
+    run(svc.add_revision("worker", "2026-10-01", "H", "a", [], SIGNATURE))
+
+    doc = run(storage.get("inspections", "legacy-1"))
+    assert "revisions" not in doc
+    assert (doc["status"], doc["revisionCount"]) == (svc.STATUS_PENDING, 2)
+    assert _revision_seqs("legacy-1") == [2, 1]
+
+
+def test_add_revision_on_legacy_record_does_not_overwrite_concurrent_change(storage, monkeypatch):
+    _save_legacy(storage, "legacy-2", "b")
+    find_record = svc._find_record
+
+    async def find_then_concurrent_cancel(*args):
+        found = await find_record(*args)
+        await storage.update("inspections", "legacy-2", {"status": svc.STATUS_CANCELLED, "updatedAt": "t1"})
+        return found
+
+    monkeypatch.setattr(svc, "_find_record", find_then_concurrent_cancel)
+    with pytest.raises(InspectionConflictError):
+        run(svc.add_revision("worker", "2026-10-01", "H", "b", [], SIGNATURE))
+
+    doc = run(storage.get("inspections", "legacy-2"))
+    assert (doc["status"], doc["updatedAt"]) == (svc.STATUS_CANCELLED, "t1")
+    assert "revisions" in doc
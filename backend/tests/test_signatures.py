@@ -0,0 +1,53 @@
+"""서명 content-addressed 저장(중복 제거/캐시 조회)을 두 저장소에서 확인한다."""
+
+import pytest
+
+from app.services import signatures_service as sigs
+from app.storage.firestore_client import get_firestore_client
+from app.storage.firestore_repository import FirestoreRepository
+from helpers import SIGNATURE, run, submit
+
+OTHER = "data:image/png;base64," + "B" * 80
+
+
+def _clear_caches():
+    with sigs._lock:
+        sigs._known_refs.clear()
+        sigs._blob_cache.clear()
+
+
+def test_same_signature_is_stored_once(storage):
+    submit(equipment_name="a")
+    submit(equipment_name="b")
+    refs = run(sigs.store_signatures([SIGNATURE, OTHER, SIGNATURE, None]))
+
+    assert refs == [sigs.signature_ref(SIGNATURE), sigs.signature_ref(OTHER), sigs.signature_ref(SIGNATURE), None]
+    docs = run(storage.query("signatures"))
+    assert sorted(d["id"] for d in docs) == sorted([refs[0], refs[1]])
+
+
+def test_store_signature_writes_without_reading(storage):
+    if not isinstance(storage, FirestoreRepository):
+        pytest.skip("Fake Firestore 호출 횟수로 확인한다")
+    stats = get_firestore_client().stats
+    run(sigs.store_signature(SIGNATURE))
+    _clear_caches()
+    stats.reset()
+
+    # 다른 프로세스가 이미 저장한 서명이어도 읽지 않고 같은 내용으로 set 한다.
+    assert run(sigs.store_signature(SIGNATURE)) == sigs.signature_ref(SIGNATURE)
+    assert (stats.reads, stats.writes, stats.round_trips) == (0, 1, 1)
+
+    # 이 프로세스에서 저장한 ref는 다시 쓰지 않는다.
+    run(sigs.store_signature(SIGNATURE))
+    assert stats.writes == 1
+
+
+def test_load_signatures_reads_missing_refs_once(storage):
+    ref = run(sigs.store_signature(SIGNATURE))
+    _clear_caches()
+
+    assert run(sigs.load_signatures([ref, ref, None, "unknown"])) == {ref: SIGNATURE}
+    run(storage.delete("signatures", ref))
+    # 한 번 읽은 서명은 캐시에서 돌려준다.
+    assert run(sigs.load_signatures([ref])) == {ref: SIGNATURE}
@@ -0,0 +1,129 @@
+"""저장소 구현(Fake Firestore / SQLite)의 조회·쓰기 동작을 확인한다."""
+
+import asyncio
+
+import pytest
+from google.api_core import exceptions
+
+from app.storage import firestore_repository
+from app.storage.fake_firestore import FakeFirestoreClient, FakeTransaction
+from app.storage.firestore_client import set_firestore_client
+from app.storage.repository import ConflictError
+from app.storage.sqlite_repository import SqliteRepository
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_query_skips_documents_without_order_field(storage):
+    run(storage.set("inspections", "a", {"status": "X", "updatedAt": "2026-10-01"}))
+    run(storage.set("inspections", "b", {"status": "X"}))
+    run(storage.set("inspections", "c", {"status": "X", "updatedAt": "2026-10-02"}))
+
+    rows = run(storage.query("inspections", [("status", "==", "X")], order_by=[("updatedAt", "asc")]))
+    assert [r["id"] for r in rows] == ["a", "c"]
+
+    rows = run(storage.query("inspections", order_by=[("updatedAt", "asc")], start_after=rows[0]))
+    assert [r["id"] for r in rows] == ["c"]
+
+
+def test_update_side_writes_commit_only_with_the_update(storage):
+    run(storage.set("inspections", "a", {"status": "X"}))
+    run(storage.set("inspection_queue", "old", {"status": "X"}))
+    side = [("inspection_queue", "a", {"status": "Y"}), ("inspection_queue", "old", None)]
+
+    with pytest.raises(ConflictError):
+        run(storage.update("inspections", "a", {"status": "Y"}, expected={"status": "Z"}, side_writes=side))
+    with pytest.raises(KeyError):
+        run(storage.update("inspections", "missing", {"status": "Y"}, side_writes=side))
+    assert [q["id"] for q in run(storage.query("inspection_queue"))] == ["old"]
+
+    run(storage.update("inspections", "a", {"status": "Y"}, expected={"status": "X"}, side_writes=side))
+    assert [q["id"] for q in run(storage.query("inspection_queue"))] == ["a"]
+
+
+def test_update_many_side_writes_follow_each_document(storage):
+    run(storage.set("inspections", "a", {"status": "X"}))
+    run(storage.set("inspections", "b", {"status": "X"}))
+
+    skipped = run(
+        storage.update_many(
+            "inspections",
+            {"a": {"status": "Y"}, "b": {"status": "Y"}, "missing": {"status": "Y"}},
+            expected={"b": {"status": "Z"}},
+            side_writes={doc_id: [("inspection_queue", doc_id, {"status": "Y"})] for doc_id in ["a", "b", "missing"]},
+        )
+    )
+
+    assert sorted(skipped) == ["b", "missing"]
+    assert [q["id"] for q in run(storage.query("inspection_queue"))] == ["a"]
+
+
+def test_sqlite_rejects_invalid_field_name_in_null_filter(tmp_path):
+    repo = SqliteRepository(str(tmp_path / "test.db"))
+
+    with pytest.raises(ValueError):
+        run(repo.query("inspections", [("status') = 'null' OR ('1", "==", None)]))
+
+
+def test_fake_batch_applies_nothing_when_an_update_target_is_missing():
+    client = FakeFirestoreClient()
+    col = client.collection("inspections")
+    run(col.document("a").set({"status": "X"}))
+
+    batch = client.batch()
+    batch.set(col.document("b"), {"status": "Y"})
+    batch.update(col.document("a"), {"status": "Z"})
+    batch.update(col.document("missing"), {"status": "Z"})
+    with pytest.raises(exceptions.NotFound):
+        run(batch.commit())
+
+    assert run(col.document("a").get()).to_dict() == {"status": "X"}
+    assert not run(col.document("b").get()).exists
+
+
+def test_fake_batch_update_after_set_in_same_batch():
+    client = FakeFirestoreClient()
+    col = client.collection("inspections")
+
+    batch = client.batch()
+    batch.set(col.document("a"), {"status": "X"})
+    batch.update(col.document("a"), {"status": "Y"})
+    run(batch.commit())
+
+    assert run(col.document("a").get()).to_dict() == {"status": "Y"}
+
+
+@pytest.fixture
+def firestore_repo():
+    set_firestore_client(FakeFirestoreClient())
+    yield firestore_repository.FirestoreRepository()
+    set_firestore_client(None)
+
+
+def test_firestore_update_maps_exhausted_retries_to_conflict(firestore_repo, monkeypatch):
+    run(firestore_repo.set("inspections", "a", {"status": "X"}))
+
+    async def always_aborted(self):
+        self._clean_up()
+        raise exceptions.Aborted("contention")
+
+    monkeypatch.setattr(FakeTransaction, "_commit", always_aborted)
+    with pytest.raises(ConflictError):
+        run(firestore_repo.update("inspections", "a", {"status": "Y"}, expected={"status": "X"}))
+    with pytest.raises(ConflictError):
+        run(firestore_repo.update_many("inspections", {"a": {"status": "Y"}}))
+
+
+def test_firestore_update_keeps_other_value_errors(firestore_repo, monkeypatch):
+    run(firestore_repo.set("inspections", "a", {"status": "X"}))
+
+    def bad_fields(fields):
+        raise ValueError("bad field path")
+
+    monkeypatch.setattr(firestore_repository, "_fields", bad_fields)
+    with pytest.raises(ValueError, match="bad field path"):
+        run(firestore_repo.update("inspections", "a", {"status": "Y"}, expected={"status": "X"}))
+    with pytest.raises(ValueError, match="bad field path"):
+        run(firestore_repo.update_many("inspections", {"a": {"status": "Y"}}))
@@ -0,0 +1,50 @@
+"""점검 상태 전이(_transition의 조건부 update)를 두 저장소에서 확인한다."""
+
+import asyncio
+
+import pytest
+
+from app.services import inspections_service as svc
+from app.services.inspections_service import InspectionConflictError
+from helpers import SIGNATURE, get_record, run, submit
+
+
+def test_transition_conflicts_when_record_changed_after_read(storage):
+    rec = submit()
+    stale = get_record(rec["id"])
+    run(svc.approve_inspection(rec["id"], "sub", SIGNATURE))
+
+    with pytest.raises(InspectionConflictError):
+        run(svc._transition(stale, svc.STATUS_REJECTED, {"updatedAt": "later"}))
+    assert get_record(rec["id"])["status"] == svc.STATUS_SUBMITTED
+
+
+def test_transition_returns_none_when_record_deleted(storage):
+    rec = submit()
+    current = get_record(rec["id"])
+    run(storage.delete("inspections", rec["id"]))
+
+    assert run(svc._transition(current, svc.STATUS_SUBMITTED, {"updatedAt": "later"})) is None
+
+
+def test_transition_rejects_disallowed_status_change(storage):
+    rec = submit()
+    assert run(svc.cancel_my_inspection("worker", "2026-10-01", "H", "eq-1"))
+
+    with pytest.raises(InspectionConflictError):
+        run(svc.approve_inspection(rec["id"], "sub", SIGNATURE))
+
+
+def test_concurrent_approve_and_reject_only_one_wins(storage):
+    rec = submit()
+
+    async def both():
+        return await asyncio.gather(
+            svc.approve_inspection(rec["id"], "sub", SIGNATURE),
+            svc.reject_inspection(rec["id"], "sub", "bad"),
+            return_exceptions=True,
+        )
+
+    results = run(both())
+    assert sum(isinstance(r, InspectionConflictError) for r in results) == 1
+    assert get_record(rec["id"])["status"] in (svc.STATUS_SUBMITTED, svc.STATUS_REJECTED)
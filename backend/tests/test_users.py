@@ -0,0 +1,65 @@
+"""로그인 조회(nameKey 인덱스/예전 문서 호환)와 로그인 캐시 무효화를 두 저장소에서 확인한다."""
+
+from app.services import users_service as svc
+from helpers import run
+
+
+def _count_lookups(monkeypatch):
+    calls = []
+    find = svc._find_existing_user
+
+    async def counting(*args):
+        calls.append(args)
+        return await find(*args)
+
+    monkeypatch.setattr(svc, "_find_existing_user", counting)
+    return calls
+
+
+def test_login_creates_worker_once_and_serves_repeat_logins_from_cache(storage, monkeypatch):
+    calls = _count_lookups(monkeypatch)
+
+    first = run(svc.login_user(" Kim  Min ", "12-34"))
+    again = run(svc.login_user("kim min", "1234"))  # 같은 nameKey/phoneLast4 -> 캐시
+
+    assert first["role"] == svc.USER_ROLE_WORKER and again["id"] == first["id"]
+    assert len(calls) == 1
+
+    svc._login_cache.invalidate()
+    assert run(svc.login_user("KIMMIN", "1234"))["id"] == first["id"]
+    assert len(calls) == 2
+    assert len(run(storage.query("users"))) == 1
+
+
+def test_login_finds_legacy_user_without_name_key_and_backfills_it(storage):
+    run(storage.set("users", "legacy", {"name": "Lee", "phoneLast4": "5678", "role": "SUB_ADMIN", "categories": ["CT"]}))
+
+    user = run(svc.login_user("lee", "5678"))
+
+    assert (user["id"], user["role"], user["categories"]) == ("legacy", svc.USER_ROLE_SUB_ADMIN, ["CT"])
+    assert run(storage.get("users", "legacy"))["nameKey"] == "lee"
+
+
+def test_subadmin_update_invalidates_cached_login(storage):
+    sub = run(svc.create_subadmin("Park", "1111", ["CT"]))
+    assert run(svc.login_user("Park", "1111"))["categories"] == ["CT"]
+
+    run(svc.update_subadmin(sub["id"], "Park", "1111", ["MR"]))
+
+    assert run(svc.login_user("Park", "1111"))["categories"] == ["MR"]
+
+
+def test_login_racing_a_subadmin_update_does_not_cache_stale_user(storage, monkeypatch):
+    sub = run(svc.create_subadmin("Park", "1111", ["CT"]))
+    find = svc._find_existing_user
+
+    async def find_then_concurrent_update(*args):
+        found = await find(*args)
+        monkeypatch.setattr(svc, "_find_existing_user", find)
+        await svc.update_subadmin(sub["id"], "Park", "1111", ["MR"])
+        return found
+
+    monkeypatch.setattr(svc, "_find_existing_user", find_then_concurrent_update)
+    assert run(svc.login_user("Park", "1111"))["categories"] == ["CT"]
+
+    assert run(svc.login_user("Park", "1111"))["categories"] == ["MR"]
@@ -1,5 +1,5 @@
 // frontend/src/App.jsx
-import React, { useEffect, useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import { safetyApi } from './services/api';
 
 import PhoneFrame from './components/PhoneFrame';
@@ -29,6 +29,21 @@ import SubAdminRecordsView from './pages/subadmin/SubAdminRecordsView';
 
 import { normalizeToUiValue } from './utils/inspectionFormat';
 
+// 내 점검 목록에 변경분(items)과 취소 tombstone을 id 기준으로 병합한다. 정렬은 서버 목록과 같다(점검일 → 수정시각 최신순).
+const mergeMyRecordChanges = (records, items, tombstones) => {
+  const byId = new Map((records || []).map((r) => [r.id, r]));
+  (items || []).forEach((item) => byId.set(item.id, item));
+  (tombstones || []).forEach((t) => {
+    const existing = byId.get(t.id);
+    if (existing) byId.set(t.id, { ...existing, status: t.status, updatedAt: t.updatedAt });
+  });
+  return [...byId.values()].sort(
+    (a, b) =>
+      String(b.date || '').localeCompare(String(a.date || '')) ||
+      String(b.updatedAt || '').localeCompare(String(a.updatedAt || ''))
+  );
+};
+
 const App = () => {
   const [view, setView] = useState('login');
   const [user, setUser] = useState(null);
@@ -43,6 +58,8 @@ const App = () => {
   // 내 점검 내역
   const [myRecords, setMyRecords] = useState([]);
   const [mySelected, setMySelected] = useState(null);
+  // 내 점검 목록 증분 동기화 기준(since). null이면 다음 로드는 전체 조회
+  const mySinceRef = useRef(null);
 
   // 수정 모드 컨텍스트
   const [editContext, setEditContext] = useState(null);
@@ -50,6 +67,9 @@ const App = () => {
   // 작업 종류
   const [workTypes, setWorkTypes] = useState(['X-ray 설치작업', 'MR 설치작업', 'CT 작업', '정기 유지보수']);
 
+  // 시작 시 bootstrap으로 받아 둔 작업 종류별 체크리스트(점검 화면은 이 값을 먼저 보여 주고 서버에 다시 확인한다)
+  const [checklists, setChecklists] = useState({});
+
   // 점검 진행 상태
   const [setupData, setSetupData] = useState({
     hospital: '',
@@ -64,6 +84,15 @@ const App = () => {
   // 1) 초기 설정 데이터 로딩
   useEffect(() => {
     const init = async () => {
+      try {
+        const data = await safetyApi.getBootstrap();
+        setHospitals(data.hospitals || []);
+        setWorkTypes(data.workTypes || []);
+        setChecklists(data.checklists || {});
+        return;
+      } catch (e) {
+        console.error('bootstrap 로딩 실패, 개별 조회로 대체:', e);
+      }
       try {
         const [hospitalData, workTypeData] = await Promise.all([
           safetyApi.getHospitals(),
@@ -93,6 +122,7 @@ const App = () => {
         end_date: end,
         requester_role: user?.role,
         requester_categories: (user?.categories || []).join(','),
+        view: 'summary',
       });
       setRecords(data || []);
     } catch (e) {
@@ -103,6 +133,24 @@ const App = () => {
     }
   };
 
+  // 목록은 summary만 받으므로 상세 화면 진입 시 응답 항목/서명을 따로 조회
+  const openRecordDetail = async (record, nextView) => {
+    setIsLoading(true);
+    try {
+      const detail = await safetyApi.getInspection(record.id, {
+        requester_role: user?.role,
+        requester_categories: (user?.categories || []).join(','),
+      });
+      setSelectedRecord(detail);
+      setView(nextView);
+    } catch (e) {
+      console.error(e);
+      alert('상세 조회 실패');
+    } finally {
+      setIsLoading(false);
+    }
+  };
+
   const fetchSubadmins = async () => {
     if (!user?.isMasterAdmin) return;
     setIsLoading(true);
@@ -117,13 +165,41 @@ const App = () => {
     }
   };
 
+  // 내 점검 목록: 처음에는 전체를 받고, 이후에는 since 이후 변경분만 받아 병합한다.
+  const syncMyRecords = async (userName) => {
+    if (mySinceRef.current !== null) {
+      try {
+        const items = [];
+        const tombstones = [];
+        let since = mySinceRef.current;
+        for (;;) {
+          const delta = await safetyApi.getMyInspectionChanges({ userName, since });
+          items.push(...(delta.items || []));
+          tombstones.push(...(delta.tombstones || []));
+          since = delta.nextSince ?? since;
+          if (!delta.hasMore) break;
+        }
+        mySinceRef.current = since;
+        const merged = mergeMyRecordChanges(myRecords, items, tombstones);
+        setMyRecords(merged);
+        return merged;
+      } catch (e) {
+        console.error(e);
+      }
+    }
+
+    const data = (await safetyApi.getMyInspections({ userName })) || [];
+    mySinceRef.current = data.reduce((max, r) => (r.updatedAt && r.updatedAt > max ? r.updatedAt : max), '');
+    setMyRecords(data);
+    return data;
+  };
+
   useEffect(() => {
     if (!user?.isWorker || view !== 'home') return;
 
     const loadWorkerStats = async () => {
       try {
-        const data = await safetyApi.getMyInspections({ userName: user.name });
-        setMyRecords(data || []);
+        await syncMyRecords(user.name);
       } catch (e) {
         console.error(e);
       }
@@ -177,9 +253,9 @@ const App = () => {
       if (loggedInUser?.isMasterAdmin) setView('admin_home');
       else if (loggedInUser?.isSubAdmin) setView('subadmin_home');
       else {
-        const myData = await safetyApi.getMyInspections({ userName: loggedInUser.name });
-        setMyRecords(myData || []);
-        notifyRejectedRecords(myData || []);
+        mySinceRef.current = null;
+        const myData = await syncMyRecords(loggedInUser.name);
+        notifyRejectedRecords(myData);
         setView('home');
       }
     } catch (e) {
@@ -202,6 +278,7 @@ const App = () => {
 
     setMyRecords([]);
     setMySelected(null);
+    mySinceRef.current = null;
 
     setEditContext(null);
     setTempResults(null);
@@ -213,11 +290,11 @@ const App = () => {
 
     setIsLoading(true);
     try {
-      const data = await safetyApi.getMyInspections({ userName: user.name });
-      setMyRecords(data || []);
+      await syncMyRecords(user.name);
     } catch (e) {
       console.error(e);
       setMyRecords([]);
+      mySinceRef.current = null;
     } finally {
       setIsLoading(false);
     }
@@ -415,6 +492,8 @@ const handleReject = async ({ inspectionId, subadminName, reason }) => {
       {view === 'inspect' && (
         <InspectionView
           workType={setupData.workType}
+          preloadedChecklist={checklists[setupData.workType] || null}
+          onChecklistLoaded={(data) => setChecklists(prev => ({ ...prev, [setupData.workType]: data }))}
           setup={setupData}
           initialAnswers={editContext?.initialAnswers || null}
           onBack={() => {
@@ -468,10 +547,7 @@ const handleReject = async ({ inspectionId, subadminName, reason }) => {
           user={user}
           records={records}
           onBack={() => setView('admin_home')}
-          onDetail={(r) => {
-            setSelectedRecord(r);
-            setView('admin_record_detail');
-          }}
+          onDetail={(r) => openRecordDetail(r, 'admin_record_detail')}
         />
       )}
 
@@ -547,10 +623,7 @@ const handleReject = async ({ inspectionId, subadminName, reason }) => {
         <SubAdminRecordsView
           records={records}
           onBack={() => setView('subadmin_home')}
-          onDetail={(r) => {
-            setSelectedRecord(r);
-            setView('subadmin_record_detail');
-          }}
+          onDetail={(r) => openRecordDetail(r, 'subadmin_record_detail')}
         />
       )}
 
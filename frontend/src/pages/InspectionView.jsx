@@ -3,35 +3,57 @@ import { ArrowLeft, Check, X, CheckCircle2 } from 'lucide-react';
 import { safetyApi } from '../services/api';
 import { normalizeToUiValue } from '../utils/inspectionFormat';
 
-const InspectionView = ({ workType, setup, onBack, onFinish, initialAnswers }) => {
+const InspectionView = ({ workType, preloadedChecklist, onChecklistLoaded, setup, onBack, onFinish, initialAnswers }) => {
   const [items, setItems] = useState([]);
   const [results, setResults] = useState([]); // [{value:'양호|보통|점검필요', comment:''}] or null
   const [isLoading, setIsLoading] = useState(true);
   const itemRefs = useRef([]);
 
   useEffect(() => {
+    let cancelled = false;
+
+    const toResults = (list, answers) => {
+      if (!answers || !Array.isArray(answers) || answers.length === 0) return Array(list.length).fill(null);
+      const map = new Map(answers.map(a => [String(a.itemId), a]));
+      return list.map(it => {
+        const found = map.get(String(it.id));
+        if (!found) return null;
+        return { value: normalizeToUiValue(found.value), comment: found.comment || "" };
+      });
+    };
+
     const fetchItems = async () => {
+      // bootstrap으로 받은 체크리스트는 바로 보여 주되, 열 때마다 서버에 다시 확인한다
+      // (바뀌지 않았으면 ETag 재검증으로 304라 본문이 오지 않는다).
+      const shown = preloadedChecklist;
+      if (shown) {
+        setItems(shown.items || []);
+        setResults(toResults(shown.items || [], initialAnswers));
+        setIsLoading(false);
+      }
       try {
         const data = await safetyApi.getChecklist(workType);
+        if (cancelled) return;
+        // 조회 실패 시 getChecklist가 돌려주는 기본 목록(version 없음)으로 받아 둔 체크리스트를 덮지 않는다.
+        if (shown && (!data.version || data.version === shown.version)) return;
         const list = data.items || [];
         setItems(list);
-
-        if (initialAnswers && Array.isArray(initialAnswers) && initialAnswers.length > 0) {
-          const map = new Map(initialAnswers.map(a => [String(a.itemId), a]));
-          const initial = list.map(it => {
-            const found = map.get(String(it.id));
-            if (!found) return null;
-            return { value: normalizeToUiValue(found.value), comment: found.comment || "" };
+        if (shown) {
+          // 관리자가 바꾼 체크리스트: 이미 고른 답은 같은 항목 id에 남긴다.
+          setResults(prev => {
+            const current = (shown.items || []).flatMap((it, i) => (prev[i] ? [{ itemId: it.id, ...prev[i] }] : []));
+            return toResults(list, current);
           });
-          setResults(initial);
         } else {
-          setResults(Array(list.length).fill(null));
+          setResults(toResults(list, initialAnswers));
         }
+        if (onChecklistLoaded && data.version) onChecklistLoaded(data);
       } finally {
-        setIsLoading(false);
+        if (!cancelled) setIsLoading(false);
       }
     };
     fetchItems();
+    return () => { cancelled = true; };
   }, [workType]); // eslint-disable-line
 
   const setValue = (idx, val) => {
@@ -52,6 +52,12 @@ export const safetyApi = {
     }
   },
 
+  // 앱 시작용: 장소/작업 종류/작업 종류별 체크리스트를 한 번에 조회
+  getBootstrap: async () => {
+    const response = await api.get('/bootstrap');
+    return response.data;
+  },
+
   getHospitals: async () => {
     try {
       const response = await api.get('/settings/hospitals');
@@ -105,6 +111,17 @@ export const safetyApi = {
     }
   },
 
+  // 여러 점검 일괄 제출 (오프라인 작성분 동기화). 항목별 id/error를 반환한다.
+  submitInspectionsBatch: async (items) => {
+    try {
+      const response = await api.post('/inspections/batch', { items });
+      return response.data;
+    } catch (error) {
+      console.error('점검 일괄 제출 실패:', error);
+      throw error;
+    }
+  },
+
   // --- 2-1. 유저 내 점검 내역 ---
   getMyInspections: async (params) => {
     try {
@@ -116,6 +133,12 @@ export const safetyApi = {
     }
   },
 
+  // 내 점검 변경분(증분 동기화): params = { userName, since } → { items, tombstones, nextSince, hasMore }
+  getMyInspectionChanges: async (params) => {
+    const response = await api.get('/me/inspections', { params: { ...params, since: params?.since ?? '' } });
+    return response.data;
+  },
+
   getMyInspectionDetail: async (params) => {
     try {
       const response = await api.get('/me/inspections/detail', { params });
@@ -180,6 +203,18 @@ export const safetyApi = {
     }
   },
 
+  // 점검 기록 상세 (목록은 view: 'summary'로 받아 응답 항목/서명 없이 로딩)
+  getInspection: async (id, params) => {
+    const response = await api.get(`/inspections/${encodeURIComponent(id)}`, { params });
+    return response.data;
+  },
+
+  // 점검 제출/수정 이력 (최신순, { items, nextCursor })
+  getInspectionRevisions: async (id, params) => {
+    const response = await api.get(`/inspections/${encodeURIComponent(id)}/revisions`, { params });
+    return response.data;
+  },
+
   // 점검 기록 PDF 다운로드
   exportInspections: async (params) => {
     try {
@@ -218,6 +253,35 @@ export const safetyApi = {
     return response.data;
   },
 
+  // 승인 대기 큐(오래된 순): params = { requester_role, requester_categories, limit, cursor } → { items, nextCursor }
+  getPendingQueue: async (params) => {
+    const response = await api.get('/subadmin/queue', { params });
+    return response.data;
+  },
+
+  // 점검 변경 실시간 구독(SSE). onEvent({ type, id, status, workType, ... }) 호출, 반환된 함수로 구독 해제
+  subscribeInspections: (params, onEvent) => {
+    const query = new URLSearchParams(
+      Object.entries(params || {}).filter(([, value]) => value !== undefined && value !== null && value !== '')
+    ).toString();
+    const source = new EventSource(`${API_BASE_URL}/inspections/stream${query ? `?${query}` : ''}`);
+    ['created', 'resubmitted', 'approved', 'rejected', 'cancelled'].forEach((type) => {
+      source.addEventListener(type, (e) => onEvent(JSON.parse(e.data)));
+    });
+    return () => source.close();
+  },
+
+  // 일괄 승인/반려: payload = { ids, subadminName, ... }. items[i].status(ok/not_found/forbidden/conflict)로 결과 확인
+  approveInspections: async (payload) => {
+    const response = await api.post('/inspections/bulk-approve', payload || {});
+    return response.data;
+  },
+
+  rejectInspections: async (payload) => {
+    const response = await api.post('/inspections/bulk-reject', payload || {});
+    return response.data;
+  },
+
   updateChecklist: async (data) => {
     try {
       const response = await api.post('/checklists', data);